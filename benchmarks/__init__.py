@@ -0,0 +1,6 @@
+""" Benchmarks for the cryptopals package.
+
+Run each benchmark from the project dir as a module, for example:
+
+    python -m benchmarks.bench_parallel
+"""
@@ -0,0 +1,83 @@
+""" Replay seeded attacks and report their oracle queries and time.
+
+Each trial seeds its oracle with `seed + trial`, so the keys, IVs and
+plain texts, and with them the query counts, are the same on every run
+and only the times vary. Two runs with the same arguments can be
+compared for regressions.
+
+    python -m benchmarks.bench_attacks [trials] [seed]
+"""
+import sys
+import time
+
+from benchmarks.common import table
+from cryptopals.challenges.s2_c12_byte_at_a_time_ecb_decryption import (
+    ByteAtATimeECB,
+    ECBOracle
+)
+from cryptopals.challenges.s2_c16_cbc_bitflipping_attacks import (
+    ADMIN,
+    BitFlippingCBC,
+    CookieOracle
+)
+from cryptopals.challenges.s3_c17_cbc_padding_oracle import (
+    PaddingOracleAttack,
+    s3_c17_cbc_padding_oracle
+)
+
+
+def padding_oracle(seed):
+    """The set3/17 attack against its own oracle"""
+    oracle = s3_c17_cbc_padding_oracle(seed=seed)
+    encrypted = oracle.encrypt()
+    result = PaddingOracleAttack(
+        oracle.decrypt_and_validate_padding,
+        workers=1
+    ).decrypt(encrypted['iv'], encrypted['ct'])
+    return result['queries'], len(result['plaintext'])
+
+
+def byte_at_a_time(seed):
+    """The set2/12 attack with a 7 byte prefix"""
+    result = ByteAtATimeECB(ECBOracle(prefix=b'prefix!', seed=seed)).recover()
+    return result['calls'], len(result['secret'])
+
+
+def bit_flipping(seed):
+    """The set2/16 attack forging ;admin=true;"""
+    result = BitFlippingCBC(CookieOracle(seed=seed).encrypt).forge()
+    return result['calls'], len(ADMIN)
+
+
+ATTACKS = (
+    ('s3_c17 padding oracle', padding_oracle),
+    ('s2_c12 byte at a time', byte_at_a_time),
+    ('s2_c16 bit flipping', bit_flipping),
+)
+
+
+def main(trials=20, seed=0):
+    rows = []
+    for name, attack in ATTACKS:
+        queries = 0
+        recovered = 0
+        times = []
+        for trial in range(trials):
+            start = time.time()
+            count, length = attack(seed + trial)
+            times.append(time.time() - start)
+            queries += count
+            recovered += length
+        rows.append((
+            name,
+            queries,
+            '%.2f' % (queries / float(recovered)),
+            '%.2fms' % (1000 * min(times)),
+            '%.2fms' % (1000 * sum(times) / trials),
+        ))
+    print('%i seeded trials from seed %i' % (trials, seed))
+    table(('attack', 'queries', 'per byte', 'fastest', 'mean'), rows)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
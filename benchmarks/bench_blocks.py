@@ -0,0 +1,59 @@
+""" Blocks views against per-block strings.
+
+Splits a cypher text into a list of block strings, as slice_array did,
+and into a Blocks view, then counts the repeated blocks of the ECB
+detector with a set of block strings and with Blocks.repeats. Peak
+memory is the most allocated on top of the cypher text while the call
+runs, as a multiple of its size, so it needs tracemalloc (python 3).
+
+    python -m benchmarks.bench_blocks [megabytes]
+"""
+import sys
+
+from benchmarks.bench_padding import peak
+from benchmarks.common import (
+    KEY,
+    best_of,
+    english,
+    size_name,
+    table
+)
+from cryptopals.crypto import (
+    Blocks,
+    aes_ecb_encrypt
+)
+
+
+def block_list(ct, blocksize=16):
+    """The old slice_array: a list of block strings"""
+    return [ct[i:i + blocksize] for i in range(0, len(ct), blocksize)]
+
+
+def set_repeats(ct, blocksize=16):
+    """The old ecb_score: a set of block strings"""
+    blocks = range(0, len(ct) - len(ct) % blocksize, blocksize)
+    return len(blocks) - len(set(ct[i:i + blocksize] for i in blocks))
+
+
+def main(megabytes=16):
+    ct = aes_ecb_encrypt(KEY, english(megabytes << 20, seed=0))
+    rows = []
+    for name, function in (
+        ('split: block strings', lambda: block_list(ct)),
+        ('split: Blocks', lambda: Blocks(ct).array),
+        ('repeats: set of strings', lambda: set_repeats(ct)),
+        ('repeats: Blocks', lambda: Blocks(ct).repeats()),
+    ):
+        used = peak(function)
+        rows.append((
+            name,
+            '%.2fms' % (1000 * best_of(function, 3)),
+            'n/a' if used is None else '%.2fx' % (used / float(len(ct))),
+        ))
+    print('%s cypher text, %i repeated blocks, peak memory as a multiple '
+          'of the cypher text' % (size_name(len(ct)), set_repeats(ct)))
+    table(('call', 'time', 'peak'), rows)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
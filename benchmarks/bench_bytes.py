@@ -0,0 +1,98 @@
+""" Per call overhead of the small byte helpers.
+
+The helpers are called once per oracle query or block, so their fixed
+cost matters more than their throughput. Each is timed as it was under
+python 2 (chr() padding, a chr() per random byte, translate with a
+deletion table, hexlify to read blocks as integers) and as it is now
+(table lookups, os.urandom, int.from_bytes under python 3). The old
+versions only run under python 2. The last rows feed xor a bytes
+object, a bytearray and a memoryview slice of the same data, which it
+reads without copying.
+
+    python -m benchmarks.bench_bytes
+"""
+import binascii
+import os
+
+from benchmarks.common import (
+    best_of,
+    table
+)
+from cryptopals.compat import PY2
+from cryptopals.crypto import (
+    _padding_ok,
+    pkcs7_pad,
+    pkcs7_valid,
+    xor
+)
+from cryptopals.random import random_bytes
+from cryptopals.url import encode_query
+
+NUMBER = 20000
+
+
+def old_pkcs7_pad(string, blocksize=16):
+    padding = blocksize - (len(string) % blocksize)
+    return string + (chr(padding) * padding)
+
+
+def old_random_bytes(size):
+    return ''.join(chr(c) for c in bytearray(os.urandom(size)))
+
+
+def old_encode_query(query, remove='&='):
+    return '&'.join(
+        '='.join([str(k).translate(None, remove),
+                  str(v).translate(None, remove)])
+        for k, v in query.items()
+    )
+
+
+def old_pkcs7_valid(string, blocksize=16):
+    block = bytearray(string[-blocksize:])
+    if not block:
+        return False
+    return _padding_ok(int(binascii.hexlify(block), 16), len(block))
+
+
+def main():
+    block = b'YELLOW SUBMARINE'
+    query = {'email': 'foo@bar.com', 'uid': '10', 'role': 'user'}
+    cases = [
+        ('pkcs7_pad(13B)', old_pkcs7_pad, pkcs7_pad, (block[:13],)),
+        ('random_bytes(16)', old_random_bytes, random_bytes, (16,)),
+        ('encode_query', old_encode_query, encode_query, (query,)),
+        ('pkcs7_valid(16B)', old_pkcs7_valid, pkcs7_valid, (block,)),
+    ]
+    rows = []
+    for name, old, new, args in cases:
+        after = best_of(lambda: new(*args), number=NUMBER)
+        if PY2:
+            before = best_of(lambda: old(*args), number=NUMBER)
+            rows.append((name, '%.2fus' % (1e6 * before),
+                         '%.2fus' % (1e6 * after),
+                         '%.1fx' % (before / after)))
+        else:
+            rows.append((name, 'n/a', '%.2fus' % (1e6 * after), 'n/a'))
+    print('Per call time, best of 5 runs of %i calls' % NUMBER)
+    table(('helper', 'before', 'after', 'speedup'), rows)
+
+    data = bytearray(random_bytes(4096))
+    inputs = [
+        ('bytes', bytes(data)),
+        ('bytearray', data),
+        ('memoryview', memoryview(data)[16:]),
+    ]
+    print('')
+    print('xor(input, 1 byte key) of 4KB')
+    table(('input', 'time'), [
+        (name, '%.2fus' % (1e6 * best_of(
+            lambda: xor(value, b'X'),
+            number=NUMBER // 10
+        )))
+        for name, value in inputs
+    ])
+
+
+if __name__ == '__main__':
+    main()
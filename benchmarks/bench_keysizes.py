@@ -0,0 +1,68 @@
+""" Repeating key XOR key size detection: accuracy and speed.
+
+Compares the Hamming distance engine, the index of coincidence engine
+and both combined, through cryptopals.xorbreak.rank_keysizes, for
+cypher texts from a few bytes to hundreds of MB.
+
+    python -m benchmarks.bench_keysizes [trials]
+"""
+import os
+import random
+import sys
+
+from benchmarks.common import (
+    best_of,
+    english,
+    size_name,
+    table
+)
+from cryptopals.crypto import xor
+from cryptopals.xorbreak import rank_keysizes
+
+ENGINES = (
+    ('hamming', ('hamming',)),
+    ('coincidence', ('coincidence',)),
+    ('combined', ('hamming', 'coincidence')),
+)
+
+
+def accuracy(size, trials, engines):
+    """The share of trials where the true key size ranks first"""
+    rng = random.Random(size)
+    hits = 0
+    for trial in range(trials):
+        keysize = rng.randint(2, 30)
+        ct = xor(english(size, rng.random()), os.urandom(keysize))
+        ranked = rank_keysizes(ct, 40, engines=engines)
+        hits += bool(ranked) and ranked[0][0] == keysize
+    return hits / float(trials)
+
+
+def main(trials=100):
+    rows = []
+    for size in (64, 128, 256, 1024, 4096):
+        rows.append([size_name(size)] + [
+            '%.0f%%' % (100 * accuracy(size, trials, engines))
+            for name, engines in ENGINES
+        ])
+    print('Key size ranked first (key sizes 2-30, %i trials)' % trials)
+    table(['ciphertext'] + [name for name, engines in ENGINES], rows)
+
+    rows = []
+    for size in (1 << 10, 1 << 20, 100 << 20):
+        ct = xor(english(1 << 20, size) * (size >> 20 or 1), b'Terminator X')
+        ct = ct[:size]
+        rows.append([size_name(size)] + [
+            '%.2fms' % (1000 * best_of(
+                lambda: rank_keysizes(ct, 40, engines=engines),
+                repeat=3
+            ))
+            for name, engines in ENGINES
+        ])
+    print('')
+    print('Time to rank key sizes 2-40')
+    table(['ciphertext'] + [name for name, engines in ENGINES], rows)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
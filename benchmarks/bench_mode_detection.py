@@ -0,0 +1,60 @@
+""" ECB/CBC mode detection: classifier speed and trials per second.
+
+Classifies the same seeded oracle cypher texts with
+cryptopals.detect.detect_ecb, which counts repeats among every block,
+with classify, which compares the two blocks the chosen plain text
+fills, and with classify_batch, which does that for all of them in one
+numpy comparison. Then runs whole trials through run_trials.
+
+    python -m benchmarks.bench_mode_detection [trials] [workers]
+"""
+import sys
+
+import numpy as np
+
+from benchmarks.common import (
+    best_of,
+    table
+)
+from cryptopals.challenges.s2_c11_ecb_cbc_detection_oracle import (
+    chosen_plaintext,
+    classify,
+    classify_batch,
+    encryption_oracle,
+    run_trials
+)
+from cryptopals.detect import detect_ecb
+from cryptopals.random import RandomPool
+
+
+def main(trials=100000, workers=2):
+    random = RandomPool(seed=0)
+    pt = chosen_plaintext()
+    cts = [encryption_oracle(pt, random)[1] for i in range(10000)]
+    batch = np.array([np.frombuffer(ct, dtype=np.uint8) for ct in cts])
+    rows = []
+    for name, function in (
+        ('detect_ecb', lambda: [detect_ecb(ct) for ct in cts]),
+        ('classify', lambda: [classify(ct) for ct in cts]),
+        ('classify_batch', lambda: classify_batch(batch)),
+    ):
+        rows.append((name, '%.0f' % (len(cts) / best_of(function, 3))))
+    print('Cypher texts classified per second')
+    table(('classifier', 'per second'), rows)
+
+    rows = []
+    for pool in (None, workers):
+        result = run_trials(trials, seed=0, workers=pool)
+        rows.append((
+            pool or 1,
+            result['trials'],
+            '%.6f' % result['accuracy'],
+            '%.0f' % result['trials_per_second'],
+        ))
+    print('')
+    print('Whole trials: oracle call and classification')
+    table(('workers', 'trials', 'accuracy', 'trials/s'), rows)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
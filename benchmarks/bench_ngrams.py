@@ -0,0 +1,82 @@
+""" n-gram scoring: key recovery against column length.
+
+A repeating XOR key of k bytes leaves len / k cypher text bytes per key
+byte, about 70 in set1/6. Each scorer solves random keys of known size
+with cryptopals.xorbreak.solve_columns, so only the column length
+decides whether a key byte is right.
+
+    python -m benchmarks.bench_ngrams [trials]
+"""
+import os
+import random
+import sys
+
+from benchmarks.common import (
+    best_of,
+    english,
+    table
+)
+from cryptopals.crypto import xor
+from cryptopals.scoring import get_scorer
+from cryptopals.xorbreak import solve_columns
+
+NAMES = ('unigram', 'chi-squared', 'bigram', 'ngram2', 'ngram3')
+KEYSIZE = 20
+LENGTHS = (4, 6, 8, 16, 24, 32, 48, 70, 100)
+
+
+def column_accuracy(name, length, trials):
+    """The shares of key bytes and of whole keys recovered"""
+    rng = random.Random(length)
+    right = 0
+    keys = 0
+    for trial in range(trials):
+        key = os.urandom(KEYSIZE)
+        ct = xor(english(length * KEYSIZE, rng.random()), key)
+        found = solve_columns(ct, KEYSIZE, name)[0]
+        right += sum(a == b for a, b in zip(key, found))
+        keys += key == found
+    return right / float(trials * KEYSIZE), keys / float(trials)
+
+
+def main(trials=20):
+    byte_rows = []
+    key_rows = []
+    for name in NAMES:
+        results = [
+            column_accuracy(name, length, trials) for length in LENGTHS
+        ]
+        byte_rows.append(
+            [name] + ['%.0f%%' % (100 * b) for b, k in results]
+        )
+        key_rows.append(
+            [name] + ['%.0f%%' % (100 * k) for b, k in results]
+        )
+    headers = ['scorer'] + ['%iB' % length for length in LENGTHS]
+    print('Key bytes recovered by column length (%i byte keys, %i trials)'
+          % (KEYSIZE, trials))
+    table(headers, byte_rows)
+    print('')
+    print('Whole keys recovered by column length')
+    table(headers, key_rows)
+
+    ct = xor(english(70, 0), b'X')
+    column = xor(english(70 * KEYSIZE, 0), os.urandom(KEYSIZE))
+    rows = []
+    for name in NAMES:
+        scorer = get_scorer(name)
+        rows.append([
+            name,
+            '%.0f/s' % (1 / best_of(lambda: scorer.key_scores(ct), 3, 20)),
+            '%.2fms' % (1000 * best_of(
+                lambda: solve_columns(column, KEYSIZE, scorer),
+                repeat=3
+            )),
+        ])
+    print('')
+    print('Speed: all 256 keys of a 70B column, a 20 byte key of 1400B')
+    table(['scorer', 'key_scores', 'solve_columns'], rows)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,86 @@
+""" Peak memory and time of padded ECB/CBC encryption and decryption.
+
+Pads and encrypts a message the old way, pkcs7_pad() then a single
+encrypt, and with the fused functions, which encrypt the block aligned
+prefix from a memoryview and build only the final block, both returning
+bytes and writing into a preallocated `out`. Decryption is measured the
+same way. Peak memory is the most allocated on top of the message
+while the call runs, as a multiple of the message size, so it needs
+tracemalloc (python 3).
+
+    python -m benchmarks.bench_padding [megabytes]
+"""
+import sys
+
+from benchmarks.common import (
+    IV,
+    KEY,
+    best_of,
+    size_name,
+    table
+)
+from cryptopals.crypto import (
+    AESContext,
+    aes_cbc_decrypt,
+    aes_cbc_encrypt,
+    aes_ecb_decrypt,
+    aes_ecb_encrypt,
+    pkcs7_pad,
+    pkcs7_unpad
+)
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def peak(function):
+    """The peak memory a call allocates, None without tracemalloc"""
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(megabytes=16):
+    size = megabytes << 20
+    pt = bytes(bytearray(size - 5))
+    context = AESContext(KEY)
+    ecb = aes_ecb_encrypt(context, pt)
+    cbc = aes_cbc_encrypt(context, pt, IV)
+    out = bytearray(len(ecb))
+    rows = []
+    for name, function in (
+        ('ecb encrypt: pad, encrypt',
+         lambda: context.encrypt(pkcs7_pad(pt))),
+        ('ecb encrypt', lambda: aes_ecb_encrypt(context, pt)),
+        ('ecb encrypt, out', lambda: aes_ecb_encrypt(context, pt, out=out)),
+        ('cbc encrypt', lambda: aes_cbc_encrypt(context, pt, IV)),
+        ('cbc encrypt, out',
+         lambda: aes_cbc_encrypt(context, pt, IV, out=out)),
+        ('ecb decrypt: decrypt, unpad',
+         lambda: pkcs7_unpad(context.decrypt(ecb))),
+        ('ecb decrypt', lambda: aes_ecb_decrypt(context, ecb)),
+        ('ecb decrypt, out', lambda: aes_ecb_decrypt(context, ecb, out=out)),
+        ('cbc decrypt', lambda: aes_cbc_decrypt(context, cbc, IV)),
+        ('cbc decrypt, out',
+         lambda: aes_cbc_decrypt(context, cbc, IV, out=out)),
+    ):
+        used = peak(function)
+        rows.append((
+            name,
+            '%.2fms' % (1000 * best_of(function, 3)),
+            'n/a' if used is None else '%.2fx' % (used / float(size)),
+        ))
+    print('%s message, peak memory as a multiple of the message' %
+          size_name(size))
+    table(('call', 'time', 'peak'), rows)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
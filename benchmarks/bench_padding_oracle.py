@@ -0,0 +1,55 @@
+""" Padding oracle queries per second.
+
+Compares the old check, which CBC decrypted the whole ciphertext and
+then looked at the padding, with aes_cbc_padding_valid, which decrypts
+only the final block.
+
+    python -m benchmarks.bench_padding_oracle
+"""
+import os
+
+from benchmarks.common import (
+    IV,
+    KEY,
+    best_of,
+    size_name,
+    table
+)
+from cryptopals.crypto import (
+    aes_cbc_decrypt,
+    aes_cbc_encrypt,
+    aes_cbc_padding_valid
+)
+
+
+def full_decrypt_oracle(ct):
+    """The padding check as it was: decrypt everything, then validate"""
+    return aes_cbc_decrypt(
+        KEY,
+        ct,
+        IV,
+        unpadder=lambda s: len(set(s[-ord(s[-1:]):])) == 1
+    )
+
+
+def main(number=2000):
+    rows = []
+    for size in (32, 64, 1024, 16 << 10):
+        ct = aes_cbc_encrypt(KEY, os.urandom(size - 1), IV)
+        before = best_of(lambda: full_decrypt_oracle(ct), number=number)
+        after = best_of(
+            lambda: aes_cbc_padding_valid(KEY, ct, IV),
+            number=number
+        )
+        rows.append((
+            size_name(len(ct)),
+            '%i' % (1 / before),
+            '%i' % (1 / after),
+            '%.1fx' % (before / after),
+        ))
+    print('Padding oracle queries/second')
+    table(('ciphertext', 'full decrypt', 'final block', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
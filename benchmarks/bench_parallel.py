@@ -0,0 +1,66 @@
+""" Pick the input size at which the process pool starts to pay off.
+
+Times single process and pooled CBC decryption for growing inputs and
+prints the smallest size from which the pool is faster at every larger
+size. Use it to set cryptopals.parallel.PARALLEL_THRESHOLD for the
+machine.
+
+    python -m benchmarks.bench_parallel [workers] [max MB]
+"""
+import multiprocessing
+import os
+import sys
+
+from benchmarks.common import (
+    IV,
+    KEY,
+    best_of,
+    size_name,
+    table
+)
+from cryptopals.parallel import parallel_crypt
+
+
+def main(workers=None, max_size=64 << 20):
+    workers = workers or multiprocessing.cpu_count()
+    rows = []
+    crossover = None
+    size = 64 << 10
+    while size <= max_size:
+        data = os.urandom(size)
+        single = best_of(
+            lambda: parallel_crypt('cbc_decrypt', KEY, data, 1, IV),
+            repeat=3
+        )
+        pooled = best_of(
+            lambda: parallel_crypt(
+                'cbc_decrypt', KEY, data, workers, IV, threshold=0
+            ),
+            repeat=3
+        )
+        if pooled < single:
+            crossover = crossover or size
+        else:
+            crossover = None
+        rows.append((
+            size_name(size),
+            '%.1f' % (size / single / (1 << 20)),
+            '%.1f' % (size / pooled / (1 << 20)),
+        ))
+        size *= 2
+    print('CBC decrypt with %i workers (MB/s)' % workers)
+    table(('size', 'single', 'pooled'), rows)
+    if crossover:
+        print('PARALLEL_THRESHOLD = %i  # %s' % (
+            crossover,
+            size_name(crossover)
+        ))
+    else:
+        print('The pool never pays off, keep PARALLEL_THRESHOLD high')
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else None,
+        int(sys.argv[2]) << 20 if len(sys.argv) > 2 else 64 << 20
+    )
@@ -0,0 +1,62 @@
+""" RandomPool against an os.urandom call per request.
+
+The oracles take 16 byte keys and IVs and small random integers. Each
+row times one request, with os.urandom called directly, with a pool
+reading from os.urandom and with a seeded, deterministic pool.
+
+    python -m benchmarks.bench_random
+"""
+import os
+
+from benchmarks.common import (
+    best_of,
+    table
+)
+from cryptopals.random import RandomPool
+
+NUMBER = 20000
+
+
+def urandom_int(start, end):
+    """The old random_int: one system call and a biased modulo"""
+    return bytearray(os.urandom(1))[0] % (end - start + 1) + start
+
+
+def main():
+    pool = RandomPool()
+    seeded = RandomPool(seed=0)
+    rows = []
+    for name, direct, pooled, deterministic in (
+        ('bytes(16)',
+         lambda: os.urandom(16),
+         lambda: pool.bytes(16),
+         lambda: seeded.bytes(16)),
+        ('view(16)',
+         lambda: memoryview(os.urandom(16)),
+         lambda: pool.view(16),
+         lambda: seeded.view(16)),
+        ('random_int(5, 10)',
+         lambda: urandom_int(5, 10),
+         lambda: pool.random_int(5, 10),
+         lambda: seeded.random_int(5, 10)),
+    ):
+        times = [
+            best_of(function, number=NUMBER)
+            for function in (direct, pooled, deterministic)
+        ]
+        rows.append([name] + ['%.2fus' % (1e6 * t) for t in times] + [
+            '%.1fx' % (times[0] / times[1])
+        ])
+    print('Per call time, best of 5 runs of %i calls' % NUMBER)
+    table(('request', 'os.urandom', 'pool', 'seeded pool', 'speedup'), rows)
+
+    counted = RandomPool()
+    for i in range(NUMBER):
+        counted.bytes(16)
+    print('')
+    print('%i requests of 16 bytes: %i os.urandom reads direct, %i pooled'
+          % (NUMBER, NUMBER, counted.refills))
+
+
+if __name__ == '__main__':
+    main()
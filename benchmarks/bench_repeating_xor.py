@@ -0,0 +1,124 @@
+""" Break the set1/6 challenge file: the original script against
+cryptopals.xorbreak.break_repeating_xor.
+
+The original script compared every ordered pair of distinct slices for
+each key size from 2 to 49, then brute forced 255 keys per column of
+the 5 best sizes, decrypting and scoring each one. Its functions are
+reproduced here as they were, except that find_keys_for_length uses its
+length argument rather than a global and they are ported to python 3:
+they still work on native str, which the cypher text crosses over to
+with to_str.
+
+    python -m benchmarks.bench_repeating_xor
+"""
+import base64
+import itertools
+import os
+import time
+
+try:
+    from itertools import izip_longest as zip_longest
+except ImportError:
+    from itertools import zip_longest
+
+from benchmarks.common import (
+    best_of,
+    table
+)
+from cryptopals.compat import (
+    to_bytes,
+    to_str
+)
+from cryptopals.scoring import LETTER_FREQ
+from cryptopals.xorbreak import break_repeating_xor
+
+CHALLENGE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'set1',
+    '6.txt'
+)
+
+
+def script_xor(c, k):
+    k = (k * -(-len(c) // len(k)))[:len(c)]
+    return ''.join(chr(ord(a) ^ ord(b)) for (a, b) in zip(c, k))
+
+
+def script_hamming_length(a, b):
+    return ''.join(
+        format(x, '08b')
+        for x in bytearray(to_bytes(script_xor(a, b)))
+    ).count('1')
+
+
+def script_calc_keysize(ct, keysize):
+    slices = list(set([
+        ct[i:i + keysize]
+        for i in range(0, len(ct), keysize)
+    ]))
+    hamming_lengths = [
+        script_hamming_length(i[0], i[1]) / (keysize + 0.0)
+        for i in itertools.permutations(slices, 2)
+    ]
+    return [keysize, sum(hamming_lengths) / (len(hamming_lengths) + 0.0)]
+
+
+def script_score(string):
+    return sum(LETTER_FREQ.get(char, -5) for char in string.lower())
+
+
+def script_find_keys_for_length(ct, keysize):
+    slices = list(set([
+        ct[i:i + keysize]
+        for i in range(0, len(ct), keysize)
+    ]))
+    transpose = [
+        ''.join(list(x))
+        for x in zip_longest(*slices, fillvalue=chr(0))
+    ]
+    return ''.join(
+        chr(max(
+            ((script_xor(t, chr(i)), i) for i in range(0, 255)),
+            key=lambda x: script_score(x[0])
+        )[1])
+        for t in transpose
+    )
+
+
+def script_break(ct):
+    """The original set1/6 script, returning its best key"""
+    results = [script_calc_keysize(ct, keysize) for keysize in range(2, 50)]
+    top_keysizes = [
+        result[0]
+        for result in sorted(results, key=lambda x: x[1])
+    ][:5]
+    top_keys = [
+        script_find_keys_for_length(ct, keysize)
+        for keysize in top_keysizes
+    ]
+    return max(top_keys, key=lambda k: script_score(script_xor(ct, k)))
+
+
+def main():
+    with open(CHALLENGE, 'rb') as f:
+        ct = base64.b64decode(f.read())
+
+    start = time.time()
+    script_key = to_bytes(script_break(to_str(ct)))
+    script_seconds = time.time() - start
+
+    key = break_repeating_xor(ct, candidates=5, max_keysize=49)[0][0]
+    seconds = best_of(
+        lambda: break_repeating_xor(ct, candidates=5, max_keysize=49),
+        number=10
+    )
+    print('Breaking set1/6.txt (%i bytes, key sizes 2-49)' % len(ct))
+    table(('method', 'seconds', 'key'), [
+        ('set1/6 script', '%.3f' % script_seconds, repr(script_key)),
+        ('break_repeating_xor', '%.4f' % seconds, repr(key)),
+    ])
+    print('speedup: %.0fx' % (script_seconds / seconds))
+
+
+if __name__ == '__main__':
+    main()
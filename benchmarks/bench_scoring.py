@@ -0,0 +1,100 @@
+""" Plain text scorers: speed and key recovery accuracy.
+
+Compares every scorer in cryptopals.scoring at scoring buffers, at
+ranking the 256 keys of a single byte XOR cypher text and at recovering
+single byte and repeating XOR keys from short English cypher texts.
+
+    python -m benchmarks.bench_scoring [trials]
+"""
+import os
+import random
+import sys
+
+from benchmarks.common import (
+    best_of,
+    english,
+    table
+)
+from cryptopals.compat import BYTES
+from cryptopals.crypto import xor
+from cryptopals.scoring import (
+    SCORERS,
+    get_scorer
+)
+from cryptopals.xorbreak import (
+    best_single_byte_key,
+    break_repeating_xor
+)
+
+NAMES = sorted(SCORERS)
+
+
+def single_byte_accuracy(name, size, trials):
+    """The share of trials where the single byte key ranks first"""
+    rng = random.Random(size)
+    hits = 0
+    for trial in range(trials):
+        key = rng.randint(0, 255)
+        ct = xor(english(size, rng.random()), BYTES[key])
+        hits += best_single_byte_key(ct, 1, name)[0][0] == key
+    return hits / float(trials)
+
+
+def repeating_accuracy(name, size, trials):
+    """The share of trials where the repeating key ranks first"""
+    rng = random.Random(size)
+    hits = 0
+    for trial in range(trials):
+        key = os.urandom(rng.randint(2, 30))
+        ct = xor(english(size, rng.random()), key)
+        results = break_repeating_xor(ct, scorer=name)
+        hits += bool(results) and results[0][0] == key
+    return hits / float(trials)
+
+
+def main(trials=100):
+    data = english(1 << 20, 0)
+    ct = xor(data[:4096], b'X')
+    cts = [data[i:i + 64] for i in range(0, 1 << 18, 64)]
+    rows = []
+    for name in NAMES:
+        scorer = get_scorer(name)
+        rows.append([
+            name,
+            '%.0fMB/s' % (1 / best_of(lambda: scorer.score(data), 3)),
+            '%.0f/s' % (1 / best_of(lambda: scorer.key_scores(ct), 3, 20)),
+            '%.0f lines/s' % (len(cts) / best_of(
+                lambda: scorer.batch_key_scores(cts),
+                repeat=3
+            )),
+        ])
+    print('Speed: score 1MB, all keys of 4KB, all keys of 64B lines')
+    table(['scorer', 'score', 'key_scores', 'batch_key_scores'], rows)
+
+    sizes = (8, 16, 32, 64)
+    rows = [
+        [name] + [
+            '%.0f%%' % (100 * single_byte_accuracy(name, size, trials))
+            for size in sizes
+        ]
+        for name in NAMES
+    ]
+    print('')
+    print('Single byte key ranked first (%i trials)' % trials)
+    table(['scorer'] + ['%iB' % size for size in sizes], rows)
+
+    sizes = (256, 512, 1024)
+    rows = [
+        [name] + [
+            '%.0f%%' % (100 * repeating_accuracy(name, size, trials // 4))
+            for size in sizes
+        ]
+        for name in NAMES
+    ]
+    print('')
+    print('Repeating key (2-30 bytes) recovered (%i trials)' % (trials // 4))
+    table(['scorer'] + ['%iB' % size for size in sizes], rows)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,79 @@
+""" Helpers shared by the benchmarks."""
+import random
+import timeit
+
+KEY = b'YELLOW SUBMARINE'
+IV = b'ORANGE SUBMARINE'
+
+ENGLISH = (
+    "It was the best of times, it was the worst of times, it was the age "
+    "of wisdom, it was the age of foolishness, it was the epoch of belief, "
+    "it was the epoch of incredulity, it was the season of Light, it was "
+    "the season of Darkness, it was the spring of hope, it was the winter "
+    "of despair, we had everything before us, we had nothing before us, we "
+    "were all going direct to Heaven, we were all going direct the other "
+    "way. In short, the period was so far like the present period, that "
+    "some of its noisiest authorities insisted on its being received, for "
+    "good or for evil, in the superlative degree of comparison only. There "
+    "were a king with a large jaw and a queen with a plain face, on the "
+    "throne of England; there were a king with a large jaw and a queen "
+    "with a fair face, on the throne of France. In both countries it was "
+    "clearer than crystal to the lords of the State preserves of loaves "
+    "and fishes, that things in general were settled for ever."
+)
+
+
+def best_of(function, repeat=5, number=1):
+    """Time a function and keep the best run.
+
+    :param function: The function to call with no arguments
+    :param repeat: The number of runs
+    :param number: The number of calls per run
+    :returns: The best time per call in seconds
+    :rtype: float
+
+    """
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+
+def table(headers, rows):
+    """Print rows as a plain text table
+
+    :param headers: The column names
+    :param rows: A list of tuples of column values
+
+    """
+    rows = [[str(c) for c in row] for row in [headers] + list(rows)]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(headers))]
+    for row in rows:
+        print('  '.join(c.rjust(w) for c, w in zip(row, widths)))
+
+
+def size_name(size):
+    """A short human readable name for a byte count"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return '%i%s' % (size, unit)
+        size //= 1024
+    return '%iGB' % size
+
+
+def english(size, seed=None):
+    """Random English looking text: words of ENGLISH in random order, so
+    the text does not repeat with a fixed period.
+
+    :param size: The length of the text
+    :param seed: Seed for the word order
+    :returns: The text
+    :rtype: bytes
+
+    """
+    rng = random.Random(seed)
+    words = ENGLISH.split()
+    text = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        text.append(word)
+        length += len(word) + 1
+    return ' '.join(text)[:size].encode('ascii')
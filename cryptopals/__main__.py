@@ -0,0 +1,5 @@
+import sys
+
+from cryptopals.cli import main
+
+sys.exit(main())
@@ -1,9 +1,16 @@
+import binascii
+
+from cryptopals.compat import (
+    to_bytes,
+    to_str
+)
 from cryptopals.crypto import (
+    Blocks,
     aes_ecb_encrypt,
     aes_ecb_decrypt
 )
 from cryptopals.random import (
-    random_bytes
+    get_pool
 )
 from cryptopals.url import (
     encode_query,
@@ -99,15 +106,17 @@ class ProfileCrypt():
     """A class to encrypt object profiles.
     It will generate use the same key for the objects lifespan. """
 
-    def __init__(self, profile=None):
+    def __init__(self, profile=None, seed=None):
         """Take no arguments
 
         :param profile: A profile to work on
+        :param seed: A seed or pool for the key, see
+            cryptopals.random.get_pool
         :returns: a
         :rtype: ProfileCrypt
 
         """
-        self.key = random_bytes(16)
+        self.key = get_pool(seed).bytes(16)
         self.profile = profile
 
     def encrypt(self, profile=None):
@@ -121,7 +130,7 @@ class ProfileCrypt():
         profile_query = encode_profile(profile if profile else self.profile)
         self.encrypted_profile = aes_ecb_encrypt(
             self.key,
-            profile_query
+            to_bytes(profile_query)
         )
         return self.encrypted_profile
 
@@ -137,11 +146,11 @@ class ProfileCrypt():
             self.key,
             encrypted_query
         )
-        profile = decode_query(decrypted_query)
+        profile = decode_query(to_str(decrypted_query))
         return profile
 
 
-def main():
+def main(seed=None):
     """Vary the length and contents of the email profile parameter to
     create custom bocks that can then be cut and pasted together to
     create a new block with 'role=admin'. We create one block ending
@@ -150,33 +159,34 @@ def main():
     admin ends with a valid query pair 'key=value' and has valid PKCS7
     padding for removal.
 
+    :param seed: A seed or pool for the key, see
+        cryptopals.random.get_pool
     :returns: Newly created and profile / cookie
     :rtype: dict
 
     """
-    pc = ProfileCrypt()
+    pc = ProfileCrypt(seed=seed)
 
     # Generate block 'admin&uid=10&rol'
     profile = profile_for('A' * 10 + 'admin')
-    encrypted_profile = pc.encrypt(profile)
-    admin = encrypted_profile[16:32]
+    admin = Blocks(pc.encrypt(profile))[1]
 
     # Generate block 'AAA&uid=10&role='
     profile = profile_for('A' * 13)
-    encrypted_profile = pc.encrypt(profile)
-    role = encrypted_profile[16:32]
+    role = Blocks(pc.encrypt(profile))[1]
 
-    # Generate block '=user'
+    # Generate blocks 'email=AAAAAAAAAA' and '=user'
     profile = profile_for('A' * 14)
-    encrypted_profile = pc.encrypt(profile)
-    padding = encrypted_profile[32:]
+    email = Blocks(pc.encrypt(profile))
 
-    encrypted_profile = encrypted_profile[:16] + role + admin + padding
+    blocks = Blocks(bytearray(4 * 16))
+    for i, block in enumerate((email[0], role, admin, email[2])):
+        blocks[i] = block
+    encrypted_profile = blocks.tobytes()
 
-    for i in range(0, len(encrypted_profile), 16):
-        block = encrypted_profile[i:i+16]
+    for i, block in enumerate(blocks):
         logger.debug('block %i: %s' % (
-            i // 16,
+            i,
             aes_ecb_decrypt(pc.key, block, unpadder=lambda x: x)
         ))
 
@@ -186,11 +196,10 @@ def main():
     decrypted_profile = pc.decrypt(encrypted_profile)
 
     logger.info('Decrypted profile: ' + str(decrypted_profile))
-    logger.info(
-        'Hex encoded encrypted profile: %s' % encrypted_profile.encode('hex')
-    )
+    encoded = to_str(binascii.hexlify(encrypted_profile))
+    logger.info('Hex encoded encrypted profile: %s' % encoded)
 
-    return encrypted_profile.encode('hex')
+    return encoded
 
 if __file__ == '__main__':
     main()
@@ -0,0 +1,230 @@
+"""An ECB/CBC detection oracle
+
+    python -m cryptopals.challenges.s2_c11_ecb_cbc_detection_oracle \\
+        --trials 1000000 --workers 4
+
+The oracle puts 5-10 random bytes before and after the chosen plain
+text and encrypts under a random key, in ECB or CBC mode at random. A
+chosen plain text of one repeated byte that is long enough to fill the
+two blocks after the longest prefix makes those two blocks equal under
+ECB, and equal under CBC only by chance, so comparing them is the
+whole test. The comparison is constant time, and a batch of trials is
+classified with one numpy comparison.
+
+Trials run in shards, optionally on a pool of worker processes, see
+cryptopals.lines.map_batches. Seeded runs give each shard a seed of
+its own, so the results depend on the seed and the shard size but not
+on the number of workers. A run without a seed of its own takes the
+seed of the default pool, if it has one, see cryptopals.random.seed.
+"""
+import argparse
+import hmac
+import sys
+import time
+
+import numpy as np
+
+from cryptopals.crypto import (
+    AESContext,
+    Blocks,
+    aes_cbc_encrypt,
+    aes_ecb_encrypt
+)
+from cryptopals.lines import map_batches
+from cryptopals.random import (
+    RandomPool,
+    get_pool
+)
+
+MIN_NOISE = 5
+MAX_NOISE = 10
+
+
+def encryption_oracle(pt, random=None, blocksize=16):
+    """Encrypt noise || pt || noise under a random key and mode
+
+    :param pt: The chosen plain text
+    :param random: The RandomPool to draw from, the default pool if None
+    :param blocksize: the block size in bytes
+    :returns: The mode used and the cypher text
+    :rtype: tuple
+
+    """
+    random = random or get_pool()
+    context = AESContext(random.bytes(16))
+    before = random.bytes(random.random_int(MIN_NOISE, MAX_NOISE))
+    after = random.bytes(random.random_int(MIN_NOISE, MAX_NOISE))
+    pt = before + pt + after
+    if random.random_int(0, 1):
+        return 'cbc', aes_cbc_encrypt(context, pt, random.bytes(blocksize))
+    return 'ecb', aes_ecb_encrypt(context, pt)
+
+
+def repeated_block(blocksize=16):
+    """The first of the two blocks the chosen plain text fills whatever
+    the prefix length
+
+    :param blocksize: the block size in bytes
+    :returns: The block number
+    :rtype: int
+
+    """
+    return -(-MAX_NOISE // blocksize)
+
+
+def chosen_plaintext(blocksize=16, filler=b'\x00'):
+    """The shortest plain text that fills two whole blocks after any
+    prefix
+
+    :param blocksize: the block size in bytes
+    :param filler: The byte to repeat
+    :returns: The plain text
+    :rtype: bytes
+
+    """
+    return filler * ((repeated_block(blocksize) + 2) * blocksize - MIN_NOISE)
+
+
+def classify(ct, blocksize=16):
+    """Guess the mode of a cypher text of chosen_plaintext() by comparing
+    its two repeated blocks in constant time
+
+    :param ct: The cypher text
+    :param blocksize: the block size in bytes
+    :returns: 'ecb' or 'cbc'
+    :rtype: str
+
+    """
+    blocks = Blocks(ct, blocksize)
+    first = repeated_block(blocksize)
+    return 'ecb' if hmac.compare_digest(
+        blocks[first].tobytes(),
+        blocks[first + 1].tobytes()
+    ) else 'cbc'
+
+
+def classify_batch(cts, blocksize=16):
+    """Guess the modes of many cypher texts of chosen_plaintext() at once
+
+    :param cts: A (trials, bytes) uint8 array of cypher texts, cut to
+        at least the repeated blocks
+    :param blocksize: the block size in bytes
+    :returns: Whether each cypher text looks like ECB
+    :rtype: numpy.ndarray
+
+    """
+    start = repeated_block(blocksize) * blocksize
+    first = cts[:, start:start + blocksize]
+    second = cts[:, start + blocksize:start + 2 * blocksize]
+    return (first == second).all(axis=1)
+
+
+def _shard_seed(seed, shard):
+    return None if seed is None else '%s/%i' % (seed, shard)
+
+
+def _run_shard(job):
+    """Run and classify one shard of trials. Returns the number of
+    trials, the number classified correctly, the ECB trials and the
+    trials classified as ECB."""
+    shard, trials, seed, blocksize = job
+    random = get_pool() if seed is None else RandomPool(seed=seed)
+    pt = chosen_plaintext(blocksize)
+    width = (repeated_block(blocksize) + 2) * blocksize
+    cts = np.empty((trials, width), dtype=np.uint8)
+    ecb = np.empty(trials, dtype=bool)
+    for trial in range(trials):
+        mode, ct = encryption_oracle(pt, random, blocksize)
+        cts[trial] = np.frombuffer(ct, dtype=np.uint8, count=width)
+        ecb[trial] = mode == 'ecb'
+    guesses = classify_batch(cts, blocksize)
+    return (
+        trials,
+        int((guesses == ecb).sum()),
+        int(ecb.sum()),
+        int(guesses.sum())
+    )
+
+
+def run_trials(trials, seed=None, workers=None, shardsize=10000,
+               blocksize=16):
+    """Run oracle trials and measure how often the mode is detected
+
+    :param trials: The number of oracle calls
+    :param seed: Seed the oracles for a replayable run, None for the
+        seed of the default pool or os.urandom if it has none
+    :param workers: The number of worker processes, None for none
+    :param shardsize: The number of trials in a job
+    :param blocksize: the block size in bytes
+    :returns: The trial count, correct count, accuracy, ECB count,
+        ECB guess count, seconds and trials per second
+    :rtype: dict
+
+    """
+    if seed is None:
+        # Forked workers would all carry on the default pool's stream
+        seed = get_pool().seed
+    jobs = (
+        (shard, min(shardsize, trials - start), _shard_seed(seed, shard),
+         blocksize)
+        for shard, start in enumerate(range(0, trials, shardsize))
+    )
+    start = time.time()
+    totals = [0, 0, 0, 0]
+    for result in map_batches(_run_shard, jobs, workers):
+        totals = [a + b for a, b in zip(totals, result)]
+    seconds = max(time.time() - start, 1e-9)
+    return {
+        'trials': totals[0],
+        'correct': totals[1],
+        'accuracy': totals[1] / float(max(1, totals[0])),
+        'ecb': totals[2],
+        'ecb_guesses': totals[3],
+        'seconds': seconds,
+        'trials_per_second': totals[0] / seconds,
+    }
+
+
+def parser():
+    """Build the argument parser
+
+    :returns: The parser for the command line
+    :rtype: argparse.ArgumentParser
+
+    """
+    p = argparse.ArgumentParser(
+        prog='python -m cryptopals.challenges.s2_c11_ecb_cbc_detection_oracle',
+        description='Measure ECB/CBC detection over many oracle calls.'
+    )
+    p.add_argument('--trials', type=int, default=100000)
+    p.add_argument('--seed', help='Seed the oracles for a replayable run')
+    p.add_argument('--workers', type=int, help='Worker processes to use')
+    p.add_argument('--shardsize', type=int, default=10000)
+    return p
+
+
+def main(argv=None):
+    """Run the command line and print the results
+
+    :param argv: The arguments, defaults to sys.argv
+    :returns: The exit status
+    :rtype: int
+
+    """
+    args = parser().parse_args(argv)
+    result = run_trials(args.trials, args.seed, args.workers, args.shardsize)
+    print('Trials: %i (%i ECB)' % (result['trials'], result['ecb']))
+    print('Accuracy: %.6f (%i wrong)' % (
+        result['accuracy'],
+        result['trials'] - result['correct']
+    ))
+    sys.stderr.write('Ran %i trials in %.3fs (%.0f trials/s)\n' % (
+        result['trials'],
+        result['seconds'],
+        result['trials_per_second']
+    ))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
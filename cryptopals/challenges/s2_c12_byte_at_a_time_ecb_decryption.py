@@ -0,0 +1,181 @@
+import base64
+import time
+
+from cryptopals.compat import BYTES
+from cryptopals.crypto import aes_ecb_encrypt
+from cryptopals.random import get_pool
+
+"""Byte-at-a-time ECB decryption
+
+An oracle encrypts AES-128-ECB(prefix || your-string || unknown-string,
+random-key). Feeding it chosen input recovers unknown-string one byte at
+a time.
+
+The attacker only ever compares the block holding the byte being
+recovered. Each byte needs one reference response (the block with the
+unknown byte in its last position) and one dictionary query. Reference
+responses only depend on how many filler bytes were sent, so there are
+at most a block size of them for the whole secret and they are cached.
+The dictionary query packs all 256 candidate blocks into one input, so
+each recovered byte costs a single oracle call.
+"""
+
+SECRET = base64.b64decode(
+    'Um9sbGluJyBpbiBteSA1LjAKV2l0aCBteSByYWctdG9wIGRvd24gc28gbXkg'
+    'aGFpciBjYW4gYmxvdwpUaGUgZ2lybGllcyBvbiBzdGFuZGJ5IHdhdmluZyBq'
+    'dXN0IHRvIHNheSBoaQpEaWQgeW91IHN0b3A/IE5vLCBJIGp1c3QgZHJvdmUg'
+    'YnkK'
+)
+
+
+class ECBOracle(object):
+    """Encrypt chosen input between a fixed prefix and an unknown secret
+    under a random key that is kept for the object's lifespan."""
+
+    def __init__(self, secret=SECRET, prefix=b'', seed=None):
+        self.key = get_pool(seed).bytes(16)
+        self.secret = secret
+        self.prefix = prefix
+
+    def __call__(self, pt):
+        return aes_ecb_encrypt(self.key, self.prefix + pt + self.secret)
+
+
+class ByteAtATimeECB(object):
+    """Recover the secret an ECB oracle appends to chosen input."""
+
+    def __init__(self, oracle, filler=b'A', max_blocksize=64):
+        """Wrap an oracle
+
+        :param oracle: A callable encrypting prefix || input || secret
+        :param filler: The byte to pad chosen input with
+        :param max_blocksize: The largest block size to look for
+        :returns: An attacker
+        :rtype: ByteAtATimeECB
+
+        """
+        self.oracle = oracle
+        self.filler = filler
+        self.max_blocksize = max_blocksize
+        self.calls = 0
+        self.blocksize = None
+        self.prefix_length = None
+        self.secret_length = None
+        self._hidden_length = None
+        self._responses = {}
+
+    @property
+    def spacer(self):
+        """The byte that aligns chosen input to a block boundary, never
+        the filler or the second filler of _filler_blocks"""
+        return BYTES[ord(self.filler) ^ 2]
+
+    def query(self, pt):
+        """Call the oracle, caching the response for each input
+
+        :param pt: The chosen input
+        :returns: The oracle's cypher text
+        :rtype: bytes
+
+        """
+        if pt not in self._responses:
+            self.calls += 1
+            self._responses[pt] = self.oracle(pt)
+        return self._responses[pt]
+
+    def detect_block_size(self):
+        """Grow the input one byte at a time until the cypher text grows.
+        The size of the jump is the block size and where it happens gives
+        the combined length of the prefix and secret.
+
+        :returns: The block size
+        :rtype: int
+
+        """
+        empty = len(self.query(b''))
+        for i in range(1, self.max_blocksize + 1):
+            size = len(self.query(self.filler * i))
+            if size != empty:
+                self.blocksize = size - empty
+                self._hidden_length = empty - i
+                return self.blocksize
+        raise ValueError('No block size up to %i' % self.max_blocksize)
+
+    def _filler_blocks(self, align):
+        """The offset of the first pair of equal adjacent blocks made of
+        our filler when sending two blocks of it behind align bytes, or
+        None. Two fillers are sent and the pair must change with the
+        filler, so repeats inside the prefix or secret are ignored."""
+        size = self.blocksize
+        other = BYTES[ord(self.filler) ^ 1]
+        first = self.query(self.spacer * align + self.filler * 2 * size)
+        second = self.query(self.spacer * align + other * 2 * size)
+        for i in range(0, min(len(first), len(second)) - size, size):
+            block = first[i:i + size]
+            if block != first[i + size:i + 2 * size]:
+                continue
+            if second[i:i + size] != second[i + size:i + 2 * size]:
+                continue
+            if block != second[i:i + size]:
+                return i
+
+    def detect_prefix(self):
+        """Send two blocks of filler behind 0 to blocksize - 1 alignment
+        bytes until two equal adjacent blocks of filler appear. That
+        proves ECB and locates the end of the prefix.
+
+        :returns: The prefix length
+        :rtype: int
+
+        """
+        if self.blocksize is None:
+            self.detect_block_size()
+        for align in range(self.blocksize):
+            offset = self._filler_blocks(align)
+            if offset is not None:
+                self.prefix_length = offset - align
+                self.secret_length = self._hidden_length - self.prefix_length
+                return self.prefix_length
+        raise ValueError('No repeated blocks, the oracle is not using ECB')
+
+    def recover(self):
+        """Recover the secret
+
+        :returns: The secret, the oracle calls made and per recovered
+            byte, and the seconds taken
+        :rtype: dict
+
+        """
+        start = time.time()
+        if self.prefix_length is None:
+            self.detect_prefix()
+        size = self.blocksize
+        align = -self.prefix_length % size
+        base = self.prefix_length + align
+        head = self.spacer * align
+        secret = b''
+        for n in range(self.secret_length):
+            pad = self.filler * (size - 1 - n % size)
+            target = base + n - n % size
+            reference = self.query(head + pad)[target:target + size]
+
+            window = (pad + secret)[-(size - 1):]
+            probes = b''.join(window + BYTES[c] for c in range(256))
+            ct = self.query(head + probes)
+            for c in range(256):
+                block = base + c * size
+                if ct[block:block + size] == reference:
+                    secret += BYTES[c]
+                    break
+            else:
+                raise ValueError('No match for byte %i' % n)
+        return {
+            'secret': secret,
+            'calls': self.calls,
+            'calls_per_byte': self.calls / float(max(1, len(secret))),
+            'seconds': time.time() - start
+        }
+
+
+def challenge_12(seed=None):
+    return ByteAtATimeECB(ECBOracle(seed=seed)).recover()['secret']
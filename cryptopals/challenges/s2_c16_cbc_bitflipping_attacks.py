@@ -1,16 +1,39 @@
+import time
+
+from cryptopals.compat import BYTES
 from cryptopals.crypto import (
+    Blocks,
     aes_cbc_encrypt,
-    aes_cbc_decrypt
+    aes_cbc_decrypt,
+    xor
 )
+from cryptopals.random import get_pool
+
+"""CBC bit flipping
+
+A 1-bit change in a CBC cypher text block scrambles that block's plain
+text and makes the same 1-bit change in the next block's. The cookie
+oracle strips ";" and "=" from the userdata, so the payload is sent as
+filler behind a sacrificial block and the sacrificial cypher text block
+is XORed with filler ^ target to turn the filler into the target.
+
+The IV is fixed, so two cookies agree up to the block where their
+userdata first differs. Comparing two fillers finds the block the
+userdata starts in, and a binary search over how much filler it takes
+to make that block match finds the prefix length, in 2 + log2(blocksize)
+oracle calls. The forged cookie takes one more.
+"""
 
+ADMIN = b';admin=true;'
 
-def clean_str(data, remove=''):
+
+def clean_str(data, remove=b''):
     """Removes the specified characters from a string
 
     :param data: The data to clean
     :param remove: The characters to remove
     :returns: The clean string
-    :rtype: str
+    :rtype: bytes
 
     """
     return data.translate(None, remove)
@@ -21,11 +44,11 @@ def sandwich_userdata(userdata):
 
     :param userdata: the data to sandwich_userdata
     :returns: The whole cookie
-    :rtype: str
+    :rtype: bytes
 
     """
-    pre = "comment1=cooking%20MCs;userdata="
-    post = ";comment2=%20like%20a%20pound%20of%20bacon"
+    pre = b"comment1=cooking%20MCs;userdata="
+    post = b";comment2=%20like%20a%20pound%20of%20bacon"
     return pre + userdata + post
 
 
@@ -34,12 +57,12 @@ def encrypt_cookie(userdata, key=None):
 
     :param userdata: The userdata
     :returns: An encrypted cookie
-    :rtype: str
+    :rtype: bytes
 
     """
-    key = key if key else 'YELLOW SUBMARINE'
+    key = key if key else b'YELLOW SUBMARINE'
     cookie = sandwich_userdata(
-        clean_str(userdata, '=;')
+        clean_str(userdata, b'=;')
     )
     return aes_cbc_encrypt(key, cookie)
 
@@ -50,9 +73,9 @@ def decrypt_cookie(cookie, key=None):
     :param cookie: The encrypted cookie to decrypt
     :param key: the key to use for decryption
     :returns: The decrypted cookie text
-    :rtype: str
+    :rtype: bytes
     """
-    key = key if key else 'YELLOW SUBMARINE'
+    key = key if key else b'YELLOW SUBMARINE'
     return aes_cbc_decrypt(key, cookie)
 
 
@@ -63,25 +86,22 @@ def check_is_admin(cookie):
     :returns: A boolean indication if a use is an admin
     :rtype: bool
     """
-    return ';admin=true;' in cookie
+    return b';admin=true;' in cookie
 
 
 def bit_fliping_userdata(padding):
     """The userdata to use in the bit flipping attack
 
     :returns: The string to use for userdata
-    :rtype: str
+    :rtype: bytes
 
     """
-    padding_block = 'P' * padding
-    flipping_block = 'F' * 16
-
-    semi_colon = flipbit(';', 0)
-    equals = flipbit('=', 0)
-    admin_block = '{s}admin{e}true'.format(
-        s=semi_colon,
-        e=equals
-    )
+    padding_block = b'P' * padding
+    flipping_block = b'F' * 16
+
+    semi_colon = flipbit(b';', 0)
+    equals = flipbit(b'=', 0)
+    admin_block = semi_colon + b'admin' + equals + b'true'
     return padding_block + flipping_block + admin_block
 
 
@@ -91,20 +111,124 @@ def flipbit(string, location):
     :param string: The string to modify
     :param location: The byte that contains the bit to flip
     :returns: The modified string
-    :rtype: str
+    :rtype: bytes
     """
-    char = ord(string[location])
-    if char % 2 == 0:
-        char = chr(char + 1)
-    else:
-        char = chr(char - 1)
+    char = BYTES[ord(string[location:location + 1]) ^ 1]
     return string[:location] + char + string[location + 1:]
 
 
-def challenge_16():
-    userdata = bit_fliping_userdata(3)
-    encrypted_cookie = encrypt_cookie(userdata)
-    flipped_cookie = flipbit(encrypted_cookie, 35)
-    flipped_cookie = flipbit(flipped_cookie, 41)
-    decrypted_cookie = decrypt_cookie(flipped_cookie)
-    return decrypted_cookie
+class CookieOracle(object):
+    """Encrypt and check cookies under a key that is kept for the
+    object's lifespan."""
+
+    def __init__(self, key=None, seed=None):
+        self.key = key if key else get_pool(seed).bytes(16)
+
+    def encrypt(self, userdata):
+        return encrypt_cookie(userdata, self.key)
+
+    def is_admin(self, cookie):
+        return check_is_admin(decrypt_cookie(cookie, self.key))
+
+
+class BitFlippingCBC(object):
+    """Forge CBC cypher text that decrypts to a chosen string by flipping
+    bits in the block before it."""
+
+    def __init__(self, oracle, blocksize=16, filler=b'A'):
+        """Wrap an oracle
+
+        :param oracle: A callable encrypting prefix || input || suffix
+            in CBC mode with a fixed key and IV
+        :param blocksize: the block size in bytes
+        :param filler: The byte to send as chosen input
+        :returns: An attacker
+        :rtype: BitFlippingCBC
+
+        """
+        self.oracle = oracle
+        self.blocksize = blocksize
+        self.filler = filler
+        self.calls = 0
+        self.oracle_seconds = 0.0
+        self.prefix_length = None
+
+    def query(self, userdata):
+        """Call the oracle, counting calls and the time spent in them
+
+        :param userdata: The chosen input
+        :returns: The oracle's cypher text
+        :rtype: bytes
+
+        """
+        start = time.time()
+        ct = self.oracle(userdata)
+        self.oracle_seconds += time.time() - start
+        self.calls += 1
+        return ct
+
+    def detect_prefix(self):
+        """Find the block the userdata starts in, where cypher texts of
+        two different fillers first differ, then binary search for the
+        fewest filler bytes that make that block match the first
+        filler's. Those bytes complete the prefix's last block.
+
+        :returns: The prefix length
+        :rtype: int
+
+        """
+        size = self.blocksize
+        other = BYTES[ord(self.filler) ^ 1]
+        first = self.query(self.filler * size)
+        second = self.query(other * size)
+        for block in range(0, min(len(first), len(second)), size):
+            if first[block:block + size] != second[block:block + size]:
+                break
+        else:
+            raise ValueError('The input does not change the cypher text')
+        low, high = 1, size
+        while low < high:
+            middle = (low + high) // 2
+            ct = self.query(self.filler * middle + other * (size - middle))
+            if ct[block:block + size] == first[block:block + size]:
+                high = middle
+            else:
+                low = middle + 1
+        self.prefix_length = block + size - low
+        return self.prefix_length
+
+    def forge(self, target=ADMIN):
+        """Forge a cypher text with target at the start of a block. The
+        block before it decrypts to garbage.
+
+        :param target: The string to appear, at most a block long
+        :returns: The cypher text, the prefix length, the oracle calls
+            made, the seconds taken and the seconds spent in the oracle
+        :rtype: dict
+
+        """
+        start = time.time()
+        size = self.blocksize
+        if not 0 < len(target) <= size:
+            raise ValueError('The target must be 1 to %i bytes' % size)
+        if self.prefix_length is None:
+            self.detect_prefix()
+        align = -self.prefix_length % size
+        sacrificial = (self.prefix_length + align) // size
+        payload = self.filler * len(target)
+        ct = bytearray(self.query(self.filler * (align + size) + payload))
+        delta = xor(payload, target) + b'\x00' * (size - len(target))
+        Blocks(ct, size).xor(sacrificial, delta)
+        return {
+            'ct': bytes(ct),
+            'prefix_length': self.prefix_length,
+            'calls': self.calls,
+            'seconds': time.time() - start,
+            'oracle_seconds': self.oracle_seconds
+        }
+
+
+def challenge_16(seed=None):
+    oracle = CookieOracle(seed=seed)
+    result = BitFlippingCBC(oracle.encrypt).forge()
+    return decrypt_cookie(result['ct'], oracle.key)
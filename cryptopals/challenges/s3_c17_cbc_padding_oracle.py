@@ -1,45 +1,62 @@
-from cryptopals.random import (
-    random_int,
-    random_bytes
-)
+import string
+import time
+from multiprocessing.pool import ThreadPool
+
+from cryptopals.compat import BYTES
+from cryptopals.random import get_pool
 from cryptopals.crypto import (
+    Blocks,
     aes_cbc_encrypt,
-    aes_cbc_decrypt
+    aes_cbc_padding_valid,
+    pkcs7_unpad,
+    pkcs7_valid
 )
 
 
 class s3_c17_cbc_padding_oracle(object):
-    def __init__(self):
-        self.key = random_bytes(16)
-        self.iv = random_bytes(16)
+    def __init__(self, seed=None):
+        """Pick a key, an IV and a string to encrypt
+
+        :param seed: A seed or pool for the key, IV and string, see
+            cryptopals.random.get_pool
+        :returns: An oracle
+        :rtype: s3_c17_cbc_padding_oracle
+
+        """
+        self.random = get_pool(seed)
+        self.key = self.random.bytes(16)
+        self.iv = self.random.bytes(16)
         self._random_string = self.random_string()
 
     def random_string(self):
         """Pick a random string from the challenge.
 
         :returns: A random string from the choices
-        :rtype: str
+        :rtype: bytes
 
         """
         strings = [
-            'MDAwMDAwTm93IHRoYXQgdGhlIHBhcnR5IGlzIGp1bXBpbmc=',
+            b'MDAwMDAwTm93IHRoYXQgdGhlIHBhcnR5IGlzIGp1bXBpbmc=',
+            (
+                b'MDAwMDAxV2l0aCB0aGUgYmFzcyBraWNrZWQgaW4gYW5k'
+                b'IHRoZSBWZWdhJ3MgYXJlIHB1bXBpbic='
+            ),
             (
-                'MDAwMDAxV2l0aCB0aGUgYmFzcyBraWNrZWQgaW4gYW5k'
-                'IHRoZSBWZWdhJ3MgYXJlIHB1bXBpbic='
+                b'MDAwMDAyUXVpY2sgdG8gdGhlIHBvaW50LCB0byB0aGUgcG'
+                b'9pbnQsIG5vIGZha2luZw=='
             ),
+            b'MDAwMDAzQ29va2luZyBNQydzIGxpa2UgYSBwb3VuZCBvZiBiYWNvbg==',
             (
-                'MDAwMDAyUXVpY2sgdG8gdGhlIHBvaW50LCB0byB0aGUgcG'
-                '9pbnQsIG5vIGZha2luZw=='
+                b'MDAwMDA0QnVybmluZyAnZW0sIGlmIHlvdSBhaW4ndCBxdWljayBhbmQg'
+                b'bmltYmxl'
             ),
-            'MDAwMDAzQ29va2luZyBNQydzIGxpa2UgYSBwb3VuZCBvZiBiYWNvbg==',
-            'MDAwMDA0QnVybmluZyAnZW0sIGlmIHlvdSBhaW4ndCBxdWljayBhbmQgbmltYmxl',
-            'MDAwMDA1SSBnbyBjcmF6eSB3aGVuIEkgaGVhciBhIGN5bWJhbA==',
-            'MDAwMDA2QW5kIGEgaGlnaCBoYXQgd2l0aCBhIHNvdXBlZCB1cCB0ZW1wbw==',
-            'MDAwMDA3SSdtIG9uIGEgcm9sbCwgaXQncyB0aW1lIHRvIGdvIHNvbG8=',
-            'MDAwMDA4b2xsaW4nIGluIG15IGZpdmUgcG9pbnQgb2g=',
-            'MDAwMDA5aXRoIG15IHJhZy10b3AgZG93biBzbyBteSBoYWlyIGNhbiBibG93'
+            b'MDAwMDA1SSBnbyBjcmF6eSB3aGVuIEkgaGVhciBhIGN5bWJhbA==',
+            b'MDAwMDA2QW5kIGEgaGlnaCBoYXQgd2l0aCBhIHNvdXBlZCB1cCB0ZW1wbw==',
+            b'MDAwMDA3SSdtIG9uIGEgcm9sbCwgaXQncyB0aW1lIHRvIGdvIHNvbG8=',
+            b'MDAwMDA4b2xsaW4nIGluIG15IGZpdmUgcG9pbnQgb2g=',
+            b'MDAwMDA5aXRoIG15IHJhZy10b3AgZG93biBzbyBteSBoYWlyIGNhbiBibG93'
         ]
-        return strings[random_int(0, 9)]
+        return strings[self.random.random_int(0, 9)]
 
     def encrypt(self):
         """
@@ -60,7 +77,8 @@ class s3_c17_cbc_padding_oracle(object):
 
     def decrypt_and_validate_padding(self, iv, ct):
         """
-        Decrypt the given ciphertext and check for valid padding.
+        Decrypt the given ciphertext and check for valid padding. Only
+        the final block is decrypted.
 
         :param iv: The IV to use
         :param ct: The ciphertext to decrypt
@@ -68,23 +86,18 @@ class s3_c17_cbc_padding_oracle(object):
         :rtype: bool
 
         """
-        return aes_cbc_decrypt(
-            self.key,
-            ct,
-            iv,
-            unpadder=self.pkcs7_validator
-        )
+        return aes_cbc_padding_valid(self.key, ct, iv)
 
     def pkcs7_validator(self, string):
         """
         Check if the pkcs7 padding is valid
 
         :param string: The input string to unpad.
-        :returns: A string without padding
-        :rtype: str
+        :returns: A boolean describing the validity of the padding
+        :rtype: bool
 
         """
-        return len(set(string[-ord(string[-1]):])) == 1
+        return pkcs7_valid(string)
 
     def cycle_byte(self, string, byte):
         """The function will create a generator to cycle through all 256
@@ -97,16 +110,158 @@ class s3_c17_cbc_padding_oracle(object):
 
         """
         for i in range(0, 256):
-            yield (string[:byte] + chr(i) + string[byte+1:], i)
+            yield (string[:byte] + BYTES[i] + string[byte + 1:], i)
+
+    def padding_attack(self, workers=4):
+        """Recover the plain text of our own ciphertext using only the
+        padding oracle.
+
+        :param workers: The number of blocks to attack concurrently
+        :returns: The recovered plain text
+        :rtype: bytes
 
-    def padding_attack(self):
+        """
         encrypted = self.encrypt()
-        print(len(encrypted['ct']))
-        print(encrypted['ct'])
-        for ct in self.cycle_byte(encrypted['ct'], 48):
-            valid = self.decrypt_and_validate_padding(
-                encrypted['iv'],
-                ct[0]
-            )
-            if valid:
-                return ct[1]
+        attack = PaddingOracleAttack(
+            self.decrypt_and_validate_padding,
+            workers=workers
+        )
+        return attack.decrypt(encrypted['iv'], encrypted['ct'])['plaintext']
+
+
+def candidate_order(padding, blocksize=16):
+    """The plain text byte values to try, most likely first. Padding
+    values lead for the final block, then printable ASCII, then the
+    rest.
+
+    :param padding: Whether the block may hold padding
+    :param blocksize: the block size in bytes
+    :returns: All 256 byte values
+    :rtype: list
+
+    """
+    order = list(range(1, blocksize + 1)) if padding else []
+    order += [ord(c) for c in string.printable if ord(c) not in order]
+    return order + [i for i in range(256) if i not in order]
+
+
+class PaddingOracleAttack(object):
+    """Decrypt CBC ciphertext one block at a time with a padding oracle.
+
+    Each block is attacked with only its (previous, target) pair: the
+    forged previous block is sent as the IV and the target as a one
+    block ciphertext, so the oracle never decrypts more than a block.
+    Blocks do not depend on each other and are attacked concurrently.
+
+    """
+
+    def __init__(self, oracle, blocksize=16, workers=4):
+        """Wrap an oracle
+
+        :param oracle: A callable taking (iv, ct) and returning whether
+            the decrypted padding is valid
+        :param blocksize: the block size in bytes
+        :param workers: The number of blocks to attack concurrently
+        :returns: An attack
+        :rtype: PaddingOracleAttack
+
+        """
+        self.oracle = oracle
+        self.blocksize = blocksize
+        self.workers = workers
+
+    def first_valid(self, ivs, ct):
+        """Find a candidate IV giving valid padding. Oracles with their own
+        first_valid, such as OracleClient, can try candidates
+        concurrently, anything else is queried in order.
+
+        :param ivs: The candidate IVs, most likely first
+        :param ct: The ciphertext block
+        :returns: The index of a valid IV (or None) and the number of
+            queries sent
+        :rtype: tuple
+
+        """
+        if hasattr(self.oracle, 'first_valid'):
+            return self.oracle.first_valid(ivs, ct)
+        for i, iv in enumerate(ivs):
+            if self.oracle(iv, ct):
+                return i, i + 1
+        return None, len(ivs)
+
+    def decrypt_block(self, prev, target, last=False):
+        """Recover one plain text block
+
+        :param prev: The ciphertext block (or IV) before the target
+        :param target: The ciphertext block to decrypt
+        :param last: Whether the target is the final, padded, block
+        :returns: The plain text, oracle query count and seconds taken
+        :rtype: dict
+
+        """
+        start = time.time()
+        queries = 0
+        prev = bytearray(prev)
+        intermediate = bytearray(self.blocksize)
+        order = candidate_order(last, self.blocksize)
+        for pad in range(1, self.blocksize + 1):
+            pos = self.blocksize - pad
+            forged = bytearray(self.blocksize)
+            for j in range(pos + 1, self.blocksize):
+                forged[j] = intermediate[j] ^ pad
+            candidates = []
+            for guess in order:
+                forged[pos] = prev[pos] ^ guess ^ pad
+                candidates.append(bytes(forged))
+            while True:
+                index, sent = self.first_valid(candidates, target)
+                queries += sent
+                if index is None:
+                    raise ValueError('No valid padding for byte %i' % pos)
+                forged = bytearray(candidates[index])
+                if pad == 1 and pos:
+                    # Make sure the padding is \x01 and not a longer run
+                    forged[pos - 1] ^= 0xff
+                    queries += 1
+                    if not self.oracle(bytes(forged), target):
+                        del candidates[index]
+                        continue
+                intermediate[pos] = forged[pos] ^ pad
+                break
+        return {
+            'plaintext': bytes(bytearray(
+                i ^ p for i, p in zip(intermediate, prev)
+            )),
+            'queries': queries,
+            'seconds': time.time() - start
+        }
+
+    def decrypt(self, iv, ct, unpadder=pkcs7_unpad):
+        """Recover every block of a ciphertext
+
+        :param iv: The IV the ciphertext was encrypted with
+        :param ct: The ciphertext
+        :param unpadder: The unpadder to use
+        :returns: The plain text and per block query counts and timings
+        :rtype: dict
+
+        """
+        start = time.time()
+        blocks = Blocks(iv + ct, self.blocksize)
+        jobs = [
+            (blocks[i - 1].tobytes(), blocks[i].tobytes(),
+             i == len(blocks) - 1)
+            for i in range(1, len(blocks))
+        ]
+        pool = ThreadPool(max(1, min(self.workers, len(jobs))))
+        try:
+            results = pool.map(lambda job: self.decrypt_block(*job), jobs)
+        finally:
+            pool.close()
+            pool.join()
+        return {
+            'plaintext': unpadder(b''.join(r['plaintext'] for r in results)),
+            'blocks': results,
+            'queries': sum(r['queries'] for r in results),
+            'seconds': time.time() - start
+        }
@@ -0,0 +1,271 @@
+""" A concurrent client for remote CBC padding oracles.
+
+In practice the padding oracle of challenge 17 sits behind a network
+service and each query costs a round trip. OracleClient sends the
+candidate IVs for a byte concurrently through a pluggable transport,
+keeps at most `max_in_flight` requests outstanding, stops sending
+candidates as soon as one has valid padding, retries failed requests
+with exponential backoff and keeps a latency histogram.
+
+The package still supports python 2.7, which has no asyncio, so
+concurrency comes from a bounded thread pool instead of an event loop. Any
+transport is a callable taking (iv, ct) and returning a bool, raising
+IOError for failures worth retrying. Anything else it raises, such as the
+ValueError of HTTPTransport for a request the service rejected, is
+raised straight away.
+
+OracleServer is a local HTTP stand-in for the remote service.
+"""
+import binascii
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urllib import urlencode
+    from urllib2 import HTTPError, urlopen
+    from urlparse import parse_qs, urlparse
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.error import HTTPError
+    from urllib.parse import parse_qs, urlencode, urlparse
+    from urllib.request import urlopen
+
+from cryptopals.compat import to_str
+
+
+class LocalTransport(object):
+    """Query an in process padding oracle, optionally adding latency."""
+
+    def __init__(self, oracle, latency=0):
+        """Wrap an s3_c17_cbc_padding_oracle
+
+        :param oracle: The padding oracle object
+        :param latency: Seconds to sleep per query to mimic the network
+        :returns: A transport
+        :rtype: LocalTransport
+
+        """
+        self.oracle = oracle
+        self.latency = latency
+
+    def __call__(self, iv, ct):
+        if self.latency:
+            time.sleep(self.latency)
+        return bool(self.oracle.decrypt_and_validate_padding(iv, ct))
+
+
+class HTTPTransport(object):
+    """Query a padding oracle over HTTP. The service answers
+    GET ?iv=<hex>&ct=<hex> with 200 for valid padding and 400 for
+    invalid padding. Server errors and connection failures raise
+    IOError to be retried, any other client error raises ValueError."""
+
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+
+    def __call__(self, iv, ct):
+        query = urlencode({
+            'iv': to_str(binascii.hexlify(iv)),
+            'ct': to_str(binascii.hexlify(ct))
+        })
+        try:
+            urlopen(
+                '%s?%s' % (self.url, query),
+                timeout=self.timeout
+            ).read()
+        except HTTPError as e:
+            if e.code == 400:
+                return False
+            if e.code < 500:
+                raise ValueError(
+                    'The oracle rejected the request: %i %s' %
+                    (e.code, e.msg)
+                )
+            raise
+        return True
+
+
+class OracleClient(object):
+    """Send padding oracle queries concurrently with retries."""
+
+    def __init__(self, transport, max_in_flight=16, retries=3, backoff=0.05):
+        """Create a client
+
+        :param transport: A callable taking (iv, ct) and returning a bool
+        :param max_in_flight: The most requests outstanding at once
+        :param retries: How many times a failed request is retried
+        :param backoff: The delay before the first retry, doubled after
+        :returns: A client, use it as a context manager or call close()
+        :rtype: OracleClient
+
+        """
+        self.transport = transport
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.backoff = backoff
+        self.queries = 0
+        self.failures = 0
+        self.latencies = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPool(max_in_flight)
+
+    def close(self):
+        """Stop the worker threads"""
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _record(self, seconds, failed=False):
+        bucket = 1
+        while bucket < seconds * 1000:
+            bucket *= 2
+        with self._lock:
+            self.queries += 1
+            self.failures += failed
+            self.latencies[bucket] = self.latencies.get(bucket, 0) + 1
+
+    def __call__(self, iv, ct):
+        """Send one query, retrying failures with exponential backoff
+
+        :param iv: The IV to send
+        :param ct: The ciphertext to send
+        :returns: Whether the padding is valid
+        :rtype: bool
+
+        """
+        for attempt in range(self.retries + 1):
+            start = time.time()
+            try:
+                valid = self.transport(iv, ct)
+            except IOError:
+                self._record(time.time() - start, failed=True)
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+            else:
+                self._record(time.time() - start)
+                return valid
+
+    def first_valid(self, ivs, ct):
+        """Try candidate IVs against one ciphertext concurrently and stop
+        sending the ones after a candidate with valid padding. A query
+        that fails stops the candidates not sent yet, and its error is
+        raised once the queries in flight have finished.
+
+        :param ivs: The candidate IVs, most likely first
+        :param ct: The ciphertext block
+        :returns: The lowest index of a valid IV (or None) and the number
+            of queries sent
+        :rtype: tuple
+
+        """
+        state = {'index': None, 'sent': 0, 'stop': False}
+        lock = threading.Lock()
+
+        def query(index):
+            with lock:
+                if state['stop'] or (
+                    state['index'] is not None and state['index'] < index
+                ):
+                    return
+                state['sent'] += 1
+            try:
+                valid = self(ivs[index], ct)
+            except Exception:
+                with lock:
+                    state['stop'] = True
+                raise
+            if valid:
+                with lock:
+                    if state['index'] is None or index < state['index']:
+                        state['index'] = index
+
+        pending = [
+            self._pool.apply_async(query, (i,))
+            for i in range(len(ivs))
+        ]
+        for result in pending:
+            result.wait()
+        for result in pending:
+            result.get()
+        return state['index'], state['sent']
+
+    def histogram(self):
+        """The request latencies seen so far
+
+        :returns: (upper bound in ms, count) pairs in bucket order
+        :rtype: list
+
+        """
+        with self._lock:
+            return sorted(self.latencies.items())
+
+
+class OracleServer(ThreadingMixIn, HTTPServer):
+    """A local HTTP stand-in for a remote padding oracle service."""
+
+    daemon_threads = True
+
+    def __init__(self, oracle, address=('127.0.0.1', 0), latency=0):
+        """Serve an s3_c17_cbc_padding_oracle
+
+        :param oracle: The padding oracle object
+        :param address: The (host, port) to listen on, port 0 picks one
+        :param latency: Seconds to sleep per query to mimic the network
+        :returns: A server, call start() to serve in the background
+        :rtype: OracleServer
+
+        """
+        HTTPServer.__init__(self, address, OracleHandler)
+        self.oracle = LocalTransport(oracle, latency)
+        self.thread = None
+
+    @property
+    def url(self):
+        return 'http://%s:%i/oracle' % self.server_address
+
+    def start(self):
+        """Serve requests on a background thread
+
+        :returns: The server
+        :rtype: OracleServer
+
+        """
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.shutdown()
+        self.server_close()
+        self.thread.join()
+
+
+class OracleHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        try:
+            iv = binascii.unhexlify(query['iv'][0])
+            ct = binascii.unhexlify(query['ct'][0])
+        except (KeyError, TypeError, binascii.Error):
+            self.send_error(422)
+            return
+        valid = self.server.oracle(iv, ct)
+        self.send_response(200 if valid else 400)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
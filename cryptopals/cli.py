@@ -0,0 +1,458 @@
+""" Encrypt and decrypt files from the command line.
+
+    python -m cryptopals encrypt --key 'YELLOW SUBMARINE' --mode cbc \\
+        --framing base64 capture.bin -o capture.b64
+
+The input file is memory mapped and processed in block aligned chunks
+straight into a memory mapped output file, so large files are never
+read into python strings. With --in-place, encryption writes a
+temporary file next to the input and renames it over the input, and
+decryption checks the padding of the final block and then decrypts the
+input over itself.
+Framing (raw, hex or base64) applies to the cypher text side.
+"""
+import argparse
+import binascii
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+
+import numpy as np
+
+from cryptopals.crypto import (
+    aes_cbc_decrypt_into,
+    aes_cbc_encrypt_into,
+    aes_cbc_padding_valid,
+    aes_context,
+    as_uint8,
+    pkcs7_final_block,
+    pkcs7_length,
+    pkcs7_valid
+)
+from cryptopals.stream import MODES
+
+BLOCKSIZE = 16
+WHITESPACE = b' \t\r\n'
+
+FRAMINGS = {
+    'raw': (1, None, None),
+    'hex': (2, binascii.hexlify, binascii.unhexlify),
+    'base64': (4, binascii.b2a_base64, binascii.a2b_base64),
+}
+
+
+class MappedFile(object):
+    """A file opened and memory mapped as a numpy uint8 array."""
+
+    def __init__(self, path, size=None, writable=False):
+        """Map a file. If a size is given the file is created or resized
+        to that size first.
+
+        :param path: The path to the file
+        :param size: The size to create or resize the file to
+        :param writable: Map the file for writing
+        :returns: The mapped file
+        :rtype: MappedFile
+
+        """
+        if size is not None and not os.path.exists(path):
+            open(path, 'wb').close()
+        writable = writable or size is not None
+        self.file = open(path, 'r+b' if writable else 'rb')
+        if size is not None:
+            self.file.truncate(size)
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.mmap = None
+        if self.size:
+            self.mmap = mmap.mmap(
+                self.file.fileno(),
+                0,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            )
+            self.array = np.frombuffer(self.mmap, dtype=np.uint8)
+        else:
+            self.array = np.empty(0, dtype=np.uint8)
+
+    def close(self, size=None):
+        """Unmap and close the file, truncating it to size if given.
+
+        :param size: The final size of the file
+
+        """
+        del self.array
+        if self.mmap is not None:
+            self.mmap.flush()
+            self.mmap.close()
+        if size is not None:
+            self.file.truncate(size)
+        self.file.close()
+
+
+class FramedWriter(object):
+    """Encode bytes with a framing and write them into an array,
+    carrying partial encoding groups over to the next write."""
+
+    def __init__(self, array, framing):
+        self.array = array
+        self.group = 3 if framing == 'base64' else 1
+        self.encode = FRAMINGS[framing][1]
+        self.position = 0
+        self.carry = b''
+
+    def _write(self, data):
+        encoded = self.encode(data).rstrip(b'\n')
+        end = self.position + len(encoded)
+        self.array[self.position:end] = as_uint8(encoded)
+        self.position = end
+
+    def write(self, data):
+        data = self.carry + data
+        cut = len(data) - len(data) % self.group
+        self.carry = data[cut:]
+        if cut:
+            self._write(data[:cut])
+
+    def close(self):
+        """Flush any carried bytes
+
+        :returns: The number of encoded bytes written
+        :rtype: int
+
+        """
+        if self.carry:
+            self._write(self.carry)
+        return self.position
+
+
+def _check_mode(mode):
+    if mode not in MODES:
+        raise ValueError('Unknown mode %r, expected one of %s' % (
+            mode,
+            ', '.join(MODES)
+        ))
+
+
+def _release(tb):
+    """Clear the locals of the finished frames of a traceback. Array
+    views held there would otherwise keep a memory map from closing
+    while the exception propagates."""
+    if tb is not None and hasattr(traceback, 'clear_frames'):
+        traceback.clear_frames(tb)
+
+
+# os.replace is python 3 only, os.rename only replaces files on POSIX
+_replace = getattr(os, 'replace', os.rename)
+
+
+def framed_size(size, framing):
+    """The number of bytes size raw bytes take once framed"""
+    if framing == 'base64':
+        return 4 * -(-size // 3)
+    return size * FRAMINGS[framing][0]
+
+
+def chunk_size(chunksize):
+    """Round a chunk size down to whole blocks"""
+    return max(BLOCKSIZE, chunksize - chunksize % BLOCKSIZE)
+
+
+def _crypt(context, mode, decrypt, src, out, iv, scratch):
+    """Encrypt or decrypt the aligned src into out, returning the IV for
+    the data that follows it."""
+    if mode == 'cbc':
+        into = aes_cbc_decrypt_into if decrypt else aes_cbc_encrypt_into
+        return into(context, src, out, iv, BLOCKSIZE)
+    into = context.decrypt_into if decrypt else context.encrypt_into
+    into(src, scratch)
+    out[:] = as_uint8(scratch)[:len(src)]
+    return iv
+
+
+def _encrypt(context, mode, iv, src, size, dst, framing, chunksize):
+    aligned, final = pkcs7_final_block(src[:size], BLOCKSIZE)
+    final = as_uint8(final)
+    scratch = bytearray(chunksize + BLOCKSIZE - 1)
+    if framing == 'raw':
+        for i in range(0, aligned, chunksize):
+            j = min(i + chunksize, aligned)
+            iv = _crypt(context, mode, False, src[i:j], dst[i:j], iv, scratch)
+        _crypt(context, mode, False, final, dst[aligned:], iv, scratch)
+        return aligned + BLOCKSIZE
+    writer = FramedWriter(dst, framing)
+    out = np.empty(chunksize, dtype=np.uint8)
+    for i in range(0, aligned, chunksize):
+        j = min(i + chunksize, aligned)
+        iv = _crypt(context, mode, False, src[i:j], out[:j - i], iv, scratch)
+        writer.write(out[:j - i].tobytes())
+    _crypt(context, mode, False, final, out[:BLOCKSIZE], iv, scratch)
+    writer.write(out[:BLOCKSIZE].tobytes())
+    return writer.close()
+
+
+def _decode(src, dst, framing, chunksize):
+    """Decode framed cypher text from src into dst chunk by chunk"""
+    group = FRAMINGS[framing][0]
+    decode = FRAMINGS[framing][2]
+    position = 0
+    carry = b''
+    for i in range(0, len(src), chunksize):
+        data = carry + src[i:i + chunksize].tobytes().translate(
+            None,
+            WHITESPACE
+        )
+        cut = len(data) - len(data) % group
+        carry = data[cut:]
+        decoded = decode(data[:cut])
+        dst[position:position + len(decoded)] = as_uint8(decoded)
+        position += len(decoded)
+    if carry:
+        raise ValueError('Truncated %s input' % framing)
+    return position
+
+
+def _check_padding(context, mode, iv, src):
+    """Decrypt only the final block and check its padding, so a wrong
+    key or IV is caught before anything is written"""
+    last = src[-2 * BLOCKSIZE:].tobytes()
+    if mode == 'cbc':
+        valid = aes_cbc_padding_valid(context, last, iv, BLOCKSIZE)
+    else:
+        valid = pkcs7_valid(context.decrypt(last[-BLOCKSIZE:]), BLOCKSIZE)
+    if not valid:
+        raise ValueError('Invalid padding, is the key or IV wrong?')
+
+
+def _decrypt(context, mode, iv, src, dst, chunksize):
+    if len(src) % BLOCKSIZE or not len(src):
+        raise ValueError('Cypher text is not a whole number of blocks')
+    _check_padding(context, mode, iv, src)
+    scratch = bytearray(chunksize + BLOCKSIZE - 1)
+    for i in range(0, len(src), chunksize):
+        j = min(i + chunksize, len(src))
+        iv = _crypt(context, mode, True, src[i:j], dst[i:j], iv, scratch)
+    return pkcs7_length(dst[:len(src)], BLOCKSIZE)
+
+
+def _decrypt_framed(context, mode, iv, src, dst, framing, chunksize):
+    """Decode framed cypher text into dst, then decrypt it there"""
+    if framing != 'raw':
+        src = dst[:_decode(src, dst, framing, chunksize)]
+    return _decrypt(context, mode, iv, src, dst, chunksize)
+
+
+def _write_output(path, size, write):
+    """Map an output file of size bytes and pass its array to write. The
+    file is truncated to the bytes written, or removed if write fails.
+
+    :param path: The output file
+    :param size: The most bytes write can produce
+    :param write: A callable filling the array and returning the number
+        of bytes written
+    :returns: The number of bytes written
+    :rtype: int
+
+    """
+    dst = MappedFile(path, size)
+    written = None
+    try:
+        written = write(dst.array)
+    except Exception:
+        _release(sys.exc_info()[2])
+        raise
+    finally:
+        dst.close(written)
+        if written is None:
+            os.remove(path)
+    return written
+
+
+def encrypt_file(key, src_path, dst_path=None, mode='ecb', iv=None,
+                 framing='raw', chunksize=1 << 20):
+    """Encrypt a file into another file, or in place when no destination
+    is given. Only raw framing can be encrypted in place. The cypher text
+    then goes to a temporary file that replaces the plain text once it is
+    complete, so a failure leaves the plain text as it was.
+
+    :param key: The key, or an AESContext, to use for encryption
+    :param src_path: The plain text file
+    :param dst_path: The file to write the framed cypher text to
+    :param mode: 'ecb' or 'cbc'
+    :param iv: The Initialization vector for CBC
+    :param framing: 'raw', 'hex' or 'base64'
+    :param chunksize: The number of bytes to process at a time
+    :returns: The number of bytes written
+    :rtype: int
+
+    """
+    _check_mode(mode)
+    context = aes_context(key)
+    chunksize = chunk_size(chunksize)
+    if dst_path is None:
+        if framing != 'raw':
+            raise ValueError('Only raw framing can be encrypted in place')
+        directory, name = os.path.split(os.path.abspath(src_path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.%s.' % name, dir=directory)
+        os.close(fd)
+        try:
+            written = encrypt_file(
+                context, src_path, tmp_path, mode, iv, framing, chunksize
+            )
+            shutil.copymode(src_path, tmp_path)
+            _replace(tmp_path, src_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return written
+    src = MappedFile(src_path)
+    try:
+        ct_size = src.size - src.size % BLOCKSIZE + BLOCKSIZE
+        return _write_output(
+            dst_path,
+            framed_size(ct_size, framing),
+            lambda dst: _encrypt(
+                context, mode, iv, src.array, src.size, dst, framing,
+                chunksize
+            )
+        )
+    except Exception:
+        _release(sys.exc_info()[2])
+        raise
+    finally:
+        src.close()
+
+
+def decrypt_file(key, src_path, dst_path=None, mode='ecb', iv=None,
+                 framing='raw', chunksize=1 << 20):
+    """Decrypt a file into another file, or in place when no destination
+    is given. Only raw framing can be decrypted in place.
+
+    :param key: The key, or an AESContext, to use for decryption
+    :param src_path: The framed cypher text file
+    :param dst_path: The file to write the plain text to
+    :param mode: 'ecb' or 'cbc'
+    :param iv: The Initialization vector for CBC
+    :param framing: 'raw', 'hex' or 'base64'
+    :param chunksize: The number of bytes to process at a time
+    :returns: The number of bytes written
+    :rtype: int
+
+    """
+    _check_mode(mode)
+    context = aes_context(key)
+    chunksize = chunk_size(chunksize)
+    if dst_path is None:
+        if framing != 'raw':
+            raise ValueError('Only raw framing can be decrypted in place')
+        src = MappedFile(src_path, writable=True)
+        written = None
+        try:
+            written = _decrypt(
+                context, mode, iv, src.array, src.array, chunksize
+            )
+        except Exception:
+            _release(sys.exc_info()[2])
+            raise
+        finally:
+            src.close(written)
+        return written
+    src = MappedFile(src_path)
+    try:
+        return _write_output(
+            dst_path,
+            src.size,
+            lambda dst: _decrypt_framed(
+                context, mode, iv, src.array, dst, framing, chunksize
+            )
+        )
+    except Exception:
+        _release(sys.exc_info()[2])
+        raise
+    finally:
+        src.close()
+
+
+def _bytes_arg(value):
+    return value.encode('latin-1') if not isinstance(value, bytes) else value
+
+
+def _hex_arg(value):
+    return binascii.unhexlify(value)
+
+
+def parser():
+    """Build the argument parser
+
+    :returns: The parser for the command line
+    :rtype: argparse.ArgumentParser
+
+    """
+    p = argparse.ArgumentParser(
+        prog='python -m cryptopals',
+        description='AES encrypt or decrypt a file.'
+    )
+    p.add_argument('command', choices=['encrypt', 'decrypt'])
+    p.add_argument('input', help='The file to read')
+    target = p.add_mutually_exclusive_group(required=True)
+    target.add_argument('-o', '--output', help='The file to write')
+    target.add_argument(
+        '--in-place',
+        action='store_true',
+        help='Overwrite the input file (raw framing only)'
+    )
+    key = p.add_mutually_exclusive_group(required=True)
+    key.add_argument('--key', type=_bytes_arg)
+    key.add_argument('--key-hex', dest='key', type=_hex_arg)
+    iv = p.add_mutually_exclusive_group()
+    iv.add_argument('--iv', type=_bytes_arg)
+    iv.add_argument('--iv-hex', dest='iv', type=_hex_arg)
+    p.add_argument('--mode', choices=MODES, default='ecb')
+    p.add_argument(
+        '--framing',
+        choices=sorted(FRAMINGS),
+        default='raw',
+        help='The encoding of the cypher text'
+    )
+    p.add_argument('--chunksize', type=int, default=1 << 20)
+    return p
+
+
+def main(argv=None):
+    """Run the command line
+
+    :param argv: The arguments, defaults to sys.argv
+    :returns: The exit status
+    :rtype: int
+
+    """
+    p = parser()
+    args = p.parse_args(argv)
+    if args.in_place and args.framing != 'raw':
+        p.error('--in-place only works with raw framing')
+    crypt = encrypt_file if args.command == 'encrypt' else decrypt_file
+    size = os.path.getsize(args.input)
+    start = time.time()
+    try:
+        written = crypt(
+            args.key,
+            args.input,
+            None if args.in_place else args.output,
+            mode=args.mode,
+            iv=args.iv,
+            framing=args.framing,
+            chunksize=args.chunksize
+        )
+    except ValueError as e:
+        p.error(str(e))
+    seconds = max(time.time() - start, 1e-9)
+    print('%sed %i bytes into %i bytes in %.3fs (%.2f MB/s)' % (
+        args.command,
+        size,
+        written,
+        seconds,
+        size / seconds / (1 << 20)
+    ))
+    return 0
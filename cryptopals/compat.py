@@ -0,0 +1,64 @@
+""" Run under python 2.7 and python 3.
+
+Every function of the package takes and returns bytes: str under python
+2, bytes under python 3. bytearray, memoryview and numpy arrays are
+accepted wherever the input is only read. Text, such as the query
+strings of challenge 13, is the native str of each version and crosses
+over with to_bytes and to_str.
+"""
+import binascii
+import sys
+
+PY2 = sys.version_info[0] == 2
+
+# The single byte strings, indexed by value, so making one costs a list
+# lookup rather than a chr() or a bytes([...]) call
+BYTES = [bytes(bytearray((value,))) for value in range(256)]
+
+
+def to_bytes(text):
+    """Encode native text as bytes, one byte per character
+
+    :param text: A native str
+    :returns: The bytes
+    :rtype: bytes
+
+    """
+    if PY2 or isinstance(text, bytes):
+        return text
+    return text.encode('latin-1')
+
+
+def to_str(data):
+    """Decode bytes to native text, one character per byte
+
+    :param data: A bytes-like object
+    :returns: The text
+    :rtype: str
+
+    """
+    if PY2:
+        return bytes(data)
+    return bytes(data).decode('latin-1')
+
+
+if hasattr(int, 'from_bytes'):
+    def int_from_bytes(data):
+        """Read bytes as a big endian unsigned integer
+
+        :param data: A bytes-like object
+        :returns: The integer
+        :rtype: int
+
+        """
+        return int.from_bytes(data, 'big')
+else:
+    def int_from_bytes(data):
+        """Read bytes as a big endian unsigned integer
+
+        :param data: A bytes-like object
+        :returns: The integer
+        :rtype: int
+
+        """
+        return int(binascii.hexlify(data), 16) if len(data) else 0
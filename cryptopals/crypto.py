@@ -1,20 +1,92 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
+from cryptopals.compat import (
+    BYTES,
+    PY2,
+    int_from_bytes
+)
+
+# The padding for every padding length, so padding is one concatenation
+_PADDING = [BYTES[length] * length for length in range(256)]
+
 
 def pkcs7_pad(string, blocksize=16):
     """Pad a string using pkcs7 to the target block size.
 
     https://tools.ietf.org/html/rfc5652#section-6.3
 
-    :param string: The input string to be padded
+    :param string: The input bytes to be padded
+    :param blocksize: The target blocksize
+    :returns: The padded bytes
+    :rtype: bytes
+
+    """
+    return string + _PADDING[blocksize - (len(string) % blocksize)]
+
+
+def _padding_ok(value, length):
+    """Check pkcs7 padding on a block given as a big endian integer. The
+    padding value is XORed over the whole block and the padding bytes
+    masked out in one go, so the work does not depend on the padding."""
+    pad = value & 0xff
+    ones = (256 ** length - 1) // 255
+    diff = (value ^ pad * ones) & ((1 << 8 * pad) - 1)
+    return diff == 0 and 0 < pad <= length
+
+
+def pkcs7_valid(string, blocksize=16):
+    """Check the pkcs7 padding at the end of a string. Every byte of the
+    final block is compared against the padding value whatever the
+    padding length.
+
+    :param string: The padded string, only the final block is read
+    :param blocksize: The blocksize the string was padded to
+    :returns: Whether the padding is valid
+    :rtype: bool
+
+    """
+    block = bytearray(string[-blocksize:])
+    if not block:
+        return False
+    return _padding_ok(int_from_bytes(block), len(block))
+
+
+def pkcs7_final_block(string, blocksize=16):
+    """Split a string for padding without copying it. Everything before
+    the last partial block is left where it is to be encrypted in place,
+    and only the final padded block is built.
+
+    :param string: The bytes to be padded
     :param blocksize: The target blocksize
-    :returns: A padded string
-    :rtype: str
+    :returns: The length of the block aligned prefix and the final
+        padded block
+    :rtype: tuple
 
     """
-    padding = blocksize - (len(string) % blocksize)
-    return string + (chr(padding) * padding)
+    aligned = len(string) - len(string) % blocksize
+    tail = memoryview(string)[aligned:].tobytes()
+    return aligned, pkcs7_pad(tail, blocksize)
+
+
+def pkcs7_length(string, blocksize=16):
+    """The length of a pkcs7 padded string once unpadded. Raise an error
+    if the padding is not valid. Slicing a memoryview to this length
+    unpads without copying.
+
+    :param string: The padded string, only the final block is read
+    :param blocksize: The blocksize the string was padded to
+    :returns: The length without the padding
+    :rtype: int
+
+    """
+    if not pkcs7_valid(string, blocksize):
+        raise ValueError
+    return len(string) - bytearray(string[-1:])[0]
 
 
 def pkcs7_unpad(string):
@@ -23,130 +95,669 @@ def pkcs7_unpad(string):
 
     :param string: The input string to unpad.
     :returns: A string without padding
-    :rtype: str
+    :rtype: bytes
 
     """
-    if len(set(string[-ord(string[-1]):])) != 1:
-        raise ValueError
-    return string[:-ord(string[-1])]
+    return string[:pkcs7_length(string)]
+
+
+class AESContext(object):
+    """A prepared AES cipher for a single key.
+
+    ECB carries no state from one block to the next, so one encryptor
+    and one decryptor are built for the key (running the key schedule
+    once) and kept open for the life of the object. Only whole blocks
+    can be passed through them. Calls are serialised with a lock so a
+    cached context can be shared between threads.
+
+    """
+    blocksize = 16
+
+    def __init__(self, key):
+        """Prepare the cipher contexts for a key
+
+        :param key: The AES key
+        :returns: A context for the key
+        :rtype: AESContext
+
+        """
+        self.key = bytes(key)
+        cipher = Cipher(
+            algorithms.AES(self.key),
+            modes.ECB(),
+            backend=default_backend()
+        )
+        self._encryptor = cipher.encryptor()
+        self._decryptor = cipher.decryptor()
+        self._lock = threading.Lock()
+
+    def _check_blocks(self, data):
+        if len(data) % self.blocksize:
+            raise ValueError(
+                'The length of the provided data is not a multiple of '
+                'the block length.'
+            )
+
+    def encrypt(self, data):
+        """ECB encrypt whole blocks
+
+        :param data: Block aligned plain text
+        :returns: cypher text
+        :rtype: bytes
+
+        """
+        self._check_blocks(data)
+        with self._lock:
+            return self._encryptor.update(data)
+
+    def decrypt(self, data):
+        """ECB decrypt whole blocks
+
+        :param data: Block aligned cypher text
+        :returns: Plain text
+        :rtype: bytes
 
+        """
+        self._check_blocks(data)
+        with self._lock:
+            return self._decryptor.update(data)
 
-def aes_ecb_encrypt(key, pt, padder=pkcs7_pad):
+    def encrypt_into(self, data, buf):
+        """ECB encrypt whole blocks into a writable buffer. The buffer
+        must be at least len(data) + blocksize - 1 bytes long.
+
+        :param data: Block aligned plain text
+        :param buf: The buffer to write the cypher text to
+        :returns: The number of bytes written
+        :rtype: int
+
+        """
+        self._check_blocks(data)
+        with self._lock:
+            return self._encryptor.update_into(data, buf)
+
+    def decrypt_into(self, data, buf):
+        """ECB decrypt whole blocks into a writable buffer. The buffer
+        must be at least len(data) + blocksize - 1 bytes long.
+
+        :param data: Block aligned cypher text
+        :param buf: The buffer to write the plain text to
+        :returns: The number of bytes written
+        :rtype: int
+
+        """
+        self._check_blocks(data)
+        with self._lock:
+            return self._decryptor.update_into(data, buf)
+
+
+class AESContextCache(object):
+    """A bounded least recently used cache of AESContext objects keyed by
+    the key bytes. Hits and misses are counted."""
+
+    def __init__(self, maxsize=128):
+        """Create an empty cache
+
+        :param maxsize: The most contexts to keep
+        :returns: A context cache
+        :rtype: AESContextCache
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._contexts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get the context for a key, building it on a miss. An AESContext
+        passed as the key is returned as is.
+
+        :param key: The AES key or an AESContext
+        :returns: The context for the key
+        :rtype: AESContext
+
+        """
+        if isinstance(key, AESContext):
+            return key
+        key = bytes(key)
+        with self._lock:
+            try:
+                context = self._contexts.pop(key)
+                self.hits += 1
+            except KeyError:
+                context = AESContext(key)
+                self.misses += 1
+                if len(self._contexts) >= self.maxsize:
+                    self._contexts.popitem(last=False)
+            self._contexts[key] = context
+        return context
+
+    def clear(self):
+        """Drop every cached context and reset the counters"""
+        with self._lock:
+            self._contexts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Report the cache statistics
+
+        :returns: The hits, misses, maxsize and current size
+        :rtype: dict
+
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'maxsize': self.maxsize,
+            'size': len(self._contexts)
+        }
+
+
+context_cache = AESContextCache()
+
+
+def aes_context(key):
+    """Get a cached AESContext for the key
+
+    :param key: The AES key or an AESContext
+    :returns: The context for the key
+    :rtype: AESContext
+
+    """
+    return context_cache.get(key)
+
+
+def _output(out, length):
+    """The buffer to write length bytes of output to, a new bytearray
+    unless one was given"""
+    if out is None:
+        return bytearray(length)
+    if len(out) < length:
+        raise ValueError('The output buffer must be %i bytes' % length)
+    return out
+
+
+def _result(result, out):
+    """Return a result as bytes, or write it into out and return out"""
+    if out is None:
+        return result
+    memoryview(out)[:len(result)] = result
+    return out
+
+
+def _ecb_decrypt_into(context, ct, out):
+    """ECB decrypt into a buffer of exactly len(ct) bytes. update_into()
+    wants a block of slack after its output, so all but the final block
+    go straight into out and the final block is copied in."""
+    context._check_blocks(ct)
+    data = memoryview(ct)
+    view = memoryview(out)
+    last = max(0, len(data) - context.blocksize)
+    if last:
+        context.decrypt_into(data[:last], view)
+    view[last:len(data)] = context.decrypt(data[last:])
+
+
+def _unpad_view(pt, length, unpadder, out):
+    """Unpad the first length bytes of plain text in pt. With the default
+    unpadder the plain text is only cut to the unpadded length, a view of
+    out is returned when out was given and a single copy otherwise."""
+    view = memoryview(pt)[:length]
+    if unpadder is pkcs7_unpad:
+        view = view[:pkcs7_length(view)]
+        return view if out is not None else view.tobytes()
+    return unpadder(view if out is not None else view.tobytes())
+
+
+def _parallel_unpad(pt, unpadder, out):
+    """Unpad plain text from a process pool, copying it into out first
+    when out was given"""
+    if out is None:
+        return unpadder(pt)
+    memoryview(_output(out, len(pt)))[:len(pt)] = pt
+    return _unpad_view(out, len(pt), unpadder, out)
+
+
+def aes_ecb_encrypt(key, pt, padder=pkcs7_pad, workers=None, out=None):
     """Encrypt a string using AES in (E)lectionic (C)ode(B)ook mode with a
     given key. It will pad the input string using PKCS7 to a 16byte blocksize.
 
-    :param key: The key to use for encryption
+    With the default padder the plain text is never copied: its block
+    aligned prefix is encrypted from a memoryview straight into the
+    output and only the final padded block is built on its own.
+
+    :param key: The key, or an AESContext, to use for encryption
     :param pt:  The plaintext to encrypt.
     :param padder: The padder to use. This must return a string
-    :returns: cypher text
-    :rtype: str
+    :param workers: Spread large inputs over this many processes
+    :param out: An optional writable buffer for the cypher text, at
+        least the padded length of pt
+    :returns: cypher text, or `out` if it was given
+    :rtype: bytes
 
     """
-    cipher = Cipher(
-        algorithms.AES(key),
-        modes.ECB(),
-        backend=default_backend()
-    )
-    encryptor = cipher.encryptor()
-    return encryptor.update(padder(pt)) + encryptor.finalize()
+    if workers:
+        from cryptopals.parallel import parallel_crypt
+        return _result(
+            parallel_crypt('ecb_encrypt', key, padder(pt), workers),
+            out
+        )
+    context = aes_context(key)
+    if padder is not pkcs7_pad:
+        return _result(context.encrypt(padder(pt)), out)
+    aligned, final = pkcs7_final_block(pt, context.blocksize)
+    ct = _output(out, aligned + len(final))
+    view = memoryview(ct)
+    if aligned:
+        context.encrypt_into(memoryview(pt)[:aligned], view)
+    view[aligned:aligned + len(final)] = context.encrypt(final)
+    return out if out is not None else bytes(ct)
 
 
-def aes_ecb_decrypt(key, ct, unpadder=pkcs7_unpad):
+def aes_ecb_decrypt(key, ct, unpadder=pkcs7_unpad, workers=None, out=None):
     """Encrypt a string using AES in (E)lectionic (C)ode(B)ook mode with a
     given key. It will pad the input string using PKCS7 to a 16byte blocksize.
 
-    :param key: The key to use for decryption
+    The plain text is decrypted into one buffer and the default unpadder
+    only cuts it to length, so the padding is removed without a copy.
+
+    :param key: The key, or an AESContext, to use for decryption
     :param ct: The cyphertext to decode
     :param unpadder: Function to remove the padding.
-    :returns: Plain text
-    :rtype: str
+    :param workers: Spread large inputs over this many processes
+    :param out: An optional writable buffer of at least len(ct) bytes
+        for the plain text
+    :returns: Plain text, a memoryview of `out` if it was given
+    :rtype: bytes
 
     """
-    cipher = Cipher(
-        algorithms.AES(key),
-        modes.ECB(),
-        backend=default_backend()
-    )
-    decryptor = cipher.decryptor()
-    return unpadder(decryptor.update(ct) + decryptor.finalize())
+    if workers:
+        from cryptopals.parallel import parallel_crypt
+        return _parallel_unpad(
+            parallel_crypt('ecb_decrypt', key, ct, workers),
+            unpadder,
+            out
+        )
+    context = aes_context(key)
+    if out is None and unpadder is not pkcs7_unpad:
+        return unpadder(context.decrypt(ct))
+    pt = _output(out, len(ct))
+    _ecb_decrypt_into(context, ct, pt)
+    return _unpad_view(pt, len(ct), unpadder, out)
+
+
+def as_uint8(data):
+    """View a bytes-like object as a flat numpy uint8 array without
+    copying it.
+
+    :param data: A str, bytearray, memoryview or numpy array
+    :returns: A uint8 array sharing memory with the input
+    :rtype: numpy.ndarray
+
+    """
+    if isinstance(data, np.ndarray):
+        return data.reshape(-1).view(np.uint8)
+    if isinstance(data, memoryview):
+        return np.asarray(data).reshape(-1).view(np.uint8)
+    return np.frombuffer(data, dtype=np.uint8)
+
 
+def xor(string1, string2, out=None):
+    """XOR two strings together. If string2 is shorter than string1 it
+    is repeated as a key until it covers string1, if it is longer it is
+    truncated.
 
-def xor(string1, string2):
-    """XOR two strings together. If they are not the same length then
+    The whole buffer is processed at once, the key is broadcast over
+    rows of len(string2) bytes so no per-byte python objects are made.
 
-    :param c: The plaintext tring
-    :param k: The key to
-    :returns:
-    :rtype:
+    :param string1: The plaintext bytes (str, bytearray or memoryview)
+    :param string2: The key bytes (str, bytearray or memoryview)
+    :param out: An optional writable buffer of len(string1) bytes to
+        write the result into. This may be string1 itself.
+    :returns: The XORed string, or `out` if it was given
+    :rtype: bytes
 
     """
-    string2 = (string2 * -(-len(string1) / len(string2)))[:len(string1)]
-    return ''.join(
-        chr(ord(a) ^ ord(b))
-        for (a, b) in zip(string1, string2)
+    data = as_uint8(string1)
+    key = as_uint8(string2)
+    if not len(key):
+        raise ValueError('xor key must not be empty')
+    result = as_uint8(out) if out is not None else np.empty_like(data)
+    if len(result) != len(data):
+        raise ValueError('xor output buffer must be len(string1) bytes')
+
+    width = len(key)
+    full = len(data) - len(data) % width
+    if full:
+        np.bitwise_xor(
+            data[:full].reshape(-1, width),
+            key,
+            out=result[:full].reshape(-1, width)
+        )
+    np.bitwise_xor(
+        data[full:],
+        key[:len(data) - full],
+        out=result[full:]
     )
+    return out if out is not None else result.tobytes()
 
 
-def slice_array(arr, size):
-    """Take an array and slice it into chunks
+class Blocks(object):
+    """The fixed size blocks of one buffer, viewed without copying.
 
-    :param arr: The array to slice
-    :param size: The size of the chunks
-    :returns: An array of arrays
-    :rtype: array
+    Indexing gives a memoryview of a block and slicing a Blocks of a run
+    of blocks, both sharing the buffer, as does `array`. Trailing bytes
+    that do not fill a block are not part of any block. The blocks of a
+    writable buffer, such as a bytearray, can be assigned, XORed and
+    swapped in place. Blocks of an immutable buffer hash by their bytes.
 
     """
-    return [
-        arr[i:i + size]
-        for i in range(0, len(arr), size)
-    ]
 
+    # Below this many blocks a set of block strings counts repeats faster
+    # than sorting them, and the strings cost next to nothing
+    _SET_BLOCKS = 64
 
-def aes_cbc_encrypt(key, pt, iv=None, blocksize=16, padder=pkcs7_pad):
-    cipher = Cipher(
-        algorithms.AES(key),
-        modes.ECB(),
-        backend=default_backend()
-    )
-    iv = iv if iv else chr(0) * blocksize
-    slices = slice_array(padder(pt), blocksize)
-    ct = []
-    for i, s in enumerate(slices):
-        encryptor = cipher.encryptor()
-        ct.append(
-            encryptor.update(xor(s, iv)) + encryptor.finalize()
+    def __init__(self, data, blocksize=16):
+        """View a buffer as blocks
+
+        :param data: A str, bytearray, memoryview or numpy array
+        :param blocksize: the block size in bytes
+        :returns: The blocks of data
+        :rtype: Blocks
+
+        """
+        self.blocksize = blocksize
+        if isinstance(data, np.ndarray):
+            data = as_uint8(data)
+        view = memoryview(data)
+        self._view = view[:len(view) - len(view) % blocksize]
+        self._array = None
+
+    @property
+    def array(self):
+        """The blocks as a (blocks, blocksize) uint8 array sharing the
+        buffer"""
+        if self._array is None:
+            self._array = as_uint8(self._view).reshape(-1, self.blocksize)
+        return self._array
+
+    def __len__(self):
+        return len(self._view) // self.blocksize
+
+    def _index(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('block index out of range')
+        return index * self.blocksize
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError('Blocks can only be sliced with a step of 1')
+            stop = max(start, stop)
+            return Blocks(
+                self._view[start * self.blocksize:stop * self.blocksize],
+                self.blocksize
+            )
+        start = self._index(index)
+        return self._view[start:start + self.blocksize]
+
+    def __setitem__(self, index, block):
+        if len(block) != self.blocksize:
+            raise ValueError('A block must be %i bytes' % self.blocksize)
+        self.array[self._index(index) // self.blocksize] = as_uint8(block)
+
+    def __iter__(self):
+        view = self._view
+        for i in range(0, len(view), self.blocksize):
+            yield view[i:i + self.blocksize]
+
+    def __eq__(self, other):
+        if not isinstance(other, Blocks):
+            return NotImplemented
+        if self.blocksize != other.blocksize:
+            return False
+        if self.array.shape != other.array.shape:
+            return False
+        return bool((self.array == other.array).all())
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        if PY2:
+            return hash(self._view.tobytes())
+        return hash(self._view)
+
+    def tobytes(self):
+        """Copy the blocks out
+
+        :returns: The bytes of every block
+        :rtype: bytes
+
+        """
+        return self._view.tobytes()
+
+    def xor(self, index, block):
+        """XOR a block in place
+
+        :param index: The block to change
+        :param block: blocksize bytes to XOR into it
+
+        """
+        row = self.array[self._index(index) // self.blocksize]
+        np.bitwise_xor(row, as_uint8(block), out=row)
+
+    def swap(self, first, second):
+        """Swap two blocks in place
+
+        :param first: The index of a block
+        :param second: The index of the block to swap it with
+
+        """
+        rows = [
+            self._index(first) // self.blocksize,
+            self._index(second) // self.blocksize
+        ]
+        self.array[rows] = self.array[rows[::-1]]
+
+    def repeats(self):
+        """Count the blocks that repeat an earlier block. Many blocks are
+        sorted as one array of blocksize byte values, a copy of the
+        buffer, rather than hashed into a set of per-block strings.
+
+        :returns: The number of repeated blocks
+        :rtype: int
+
+        """
+        if len(self) < self._SET_BLOCKS:
+            data = self._view.tobytes()
+            size = self.blocksize
+            return len(self) - len(set(
+                data[i:i + size] for i in range(0, len(data), size)
+            ))
+        ordered = np.sort(
+            self.array.reshape(-1).view(np.dtype('V%i' % self.blocksize))
+        )
+        return int((ordered[1:] == ordered[:-1]).sum())
+
+
+def _check_aligned(data, blocksize):
+    if len(data) % blocksize:
+        raise ValueError(
+            'The length of the provided data is not a multiple of '
+            'the block length.'
         )
-        iv = ct[-1]
-    return ''.join(ct)
 
 
-def aes_cbc_decrypt(key, ct, iv=None, blocksize=16, unpadder=pkcs7_unpad):
+def aes_cbc_encrypt_into(key, pt, out, iv=None, blocksize=16):
+    """CBC encrypt block aligned plain text into a writable buffer
+    without padding it. The buffer may be the plain text itself.
+
+    :param key: The key, or an AESContext, to use for encryption
+    :param pt: The block aligned plain text to encrypt
+    :param out: A writable buffer of len(pt) bytes for the cypher text
+    :param iv: The Initialization vector for the first block
+    :param blocksize: the block size in bytes
+    :returns: The last cypher block, the IV for the following data
+    :rtype: bytes
+
+    """
+    _check_aligned(pt, blocksize)
+    iv = iv if iv else b'\x00' * blocksize
+    context = aes_context(key)
+    data = Blocks(pt, blocksize).array
+    ct = Blocks(out, blocksize).array
+    view = memoryview(out)
+    block = np.empty(blocksize, dtype=np.uint8)
+    scratch = bytearray(2 * blocksize - 1)
+    prev = as_uint8(iv)
+    # update_into() needs blocksize - 1 bytes of slack after its output,
+    # which the last block does not have
+    last = len(data) - 1
+    for i in range(len(data)):
+        np.bitwise_xor(data[i], prev, out=block)
+        if i < last:
+            context.encrypt_into(block, view[i * blocksize:])
+        else:
+            context.encrypt_into(block, scratch)
+            ct[i] = as_uint8(scratch)[:blocksize]
+        prev = ct[i]
+    return prev.tobytes()
+
+
+def aes_cbc_encrypt(key, pt, iv=None, blocksize=16, padder=pkcs7_pad,
+                    out=None):
+    """Encrypt a string using Cipher Block Chaining
+
+    The cached ECB encryptor for the key is used for the whole
+    message. Each block is XORed with the previous cipher block into a
+    scratch buffer and encrypted straight into the preallocated output.
+    With the default padder the block aligned prefix of the plain text
+    is read through a memoryview and only the final padded block is
+    built, so the plain text is never copied.
+
+    :param key: The key, or an AESContext, to use for encryption
+    :param pt: The plain text to encrypt
+    :param iv: The Initialization vector for the first block
+    :param blocksize: the block size in bytes
+    :param padder: The padder to use. This must return a string
+    :param out: An optional writable buffer for the cypher text, at
+        least the padded length of pt
+    :returns: cypher text, or `out` if it was given
+    :rtype: bytes
+
+    """
+    if padder is pkcs7_pad:
+        aligned, final = pkcs7_final_block(pt, blocksize)
+    else:
+        pt = padder(pt)
+        aligned, final = len(pt), b''
+    ct = _output(out, aligned + len(final))
+    view = memoryview(ct)
+    iv = aes_cbc_encrypt_into(
+        key,
+        memoryview(pt)[:aligned],
+        view[:aligned],
+        iv,
+        blocksize
+    )
+    if final:
+        aes_cbc_encrypt_into(key, final, view[aligned:], iv, blocksize)
+    return out if out is not None else bytes(ct)
+
+
+def _cbc_unchain(pt, ct, iv):
+    """XOR ECB decrypted blocks in place with the IV and the cypher text
+    blocks before them, both (blocks, blocksize) arrays"""
+    np.bitwise_xor(pt[:1], as_uint8(iv), out=pt[:1])
+    np.bitwise_xor(pt[1:], ct[:-1], out=pt[1:])
+
+
+def aes_cbc_decrypt_into(key, ct, out, iv=None, blocksize=16):
+    """CBC decrypt block aligned cypher text into a writable buffer
+    without unpadding it. The buffer may be the cypher text itself.
+
+    :param key: The key, or an AESContext, to use for decryption
+    :param ct: The block aligned cypher text to decrypt
+    :param out: A writable buffer of len(ct) bytes for the plain text
+    :param iv: The Initialization vector for the first block
+    :param blocksize: the block size in bytes
+    :returns: The last cypher block, the IV for the following data
+    :rtype: bytes
+
+    """
+    _check_aligned(ct, blocksize)
+    if not len(ct):
+        raise ValueError('There is no cypher text to decrypt')
+    iv = iv if iv else b'\x00' * blocksize
+    data = Blocks(ct, blocksize).array
+    following_iv = data[-1].tobytes()
+    scratch = bytearray(data.size + blocksize - 1)
+    aes_context(key).decrypt_into(data.reshape(-1), scratch)
+    pt = Blocks(scratch, blocksize).array[:len(data)]
+    _cbc_unchain(pt, data, iv)
+    Blocks(out, blocksize).array[:len(data)] = pt
+    return following_iv
+
+
+def aes_cbc_padding_valid(key, ct, iv=None, blocksize=16):
+    """Check the padding of a CBC ciphertext without decrypting all of
+    it. Only the final block is decrypted, with the block before it (or
+    the IV) as its IV, and the plain text is never returned.
+
+    :param key: The key, or an AESContext, to use for decryption
+    :param ct: The cipher text to check
+    :param iv: The Initialization vector for the first block
+    :param blocksize: the block size in bytes
+    :returns: Whether the decrypted padding is valid
+    :rtype: bool
+
+    """
+    if not len(ct) or len(ct) % blocksize:
+        return False
+    iv = iv if iv else b'\x00' * blocksize
+    prev = ct[-2 * blocksize:-blocksize] if len(ct) > blocksize else iv
+    last = aes_context(key).decrypt(ct[-blocksize:])
+    return _padding_ok(int_from_bytes(last) ^ int_from_bytes(prev), blocksize)
+
+
+def aes_cbc_decrypt(key, ct, iv=None, blocksize=16, unpadder=pkcs7_unpad,
+                    workers=None, out=None):
     """Decrypt a ciphertext using Cipher Block Chaining
 
-    :param key: The key to use for encryption
+    Every block is decrypted straight into the output with ECB
+    update_into() and the result is XORed in place against the IV and
+    the ciphertext shifted by one block. The padding is removed by
+    cutting the plain text to length rather than copying it.
+
+    :param key: The key, or an AESContext, to use for decryption
     :param ct: The cipher text to decode
     :param iv: The Initialization vector for the first block
     :param blocksize: the block size in bytes
     :param unpadder: The unpadder to use
-    :returns: Plain text
-    :rtype: str
+    :param workers: Spread large inputs over this many processes
+    :param out: An optional writable buffer of at least len(ct) bytes
+        for the plain text. It must not be ct, see aes_cbc_decrypt_into
+    :returns: Plain text, a memoryview of `out` if it was given
+    :rtype: bytes
 
     """
-    iv = iv if iv else chr(0) * blocksize
-    cipher = Cipher(
-        algorithms.AES(key),
-        modes.ECB(),
-        backend=default_backend()
-    )
-    slices = slice_array(ct, blocksize)
-    pt = []
-    for i, s in enumerate(slices):
-        decryptor = cipher.decryptor()
-        pt.append(
-            xor(
-                decryptor.update(s) + decryptor.finalize(),
-                iv
-            )
+    if workers:
+        from cryptopals.parallel import parallel_crypt
+        return _parallel_unpad(
+            parallel_crypt('cbc_decrypt', key, ct, workers, iv, blocksize),
+            unpadder,
+            out
         )
-        iv = slices[i]
-    return unpadder(''.join(pt))
+    iv = iv if iv else b'\x00' * blocksize
+    data = Blocks(ct, blocksize).array
+    pt = _output(out, len(ct))
+    _ecb_decrypt_into(aes_context(key), ct, pt)
+    _cbc_unchain(Blocks(pt, blocksize).array[:len(data)], data, iv)
+    return _unpad_view(pt, len(ct), unpadder, out)
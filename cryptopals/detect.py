@@ -0,0 +1,169 @@
+""" Detect ECB encrypted lines in large inputs.
+
+    python -m cryptopals.detect proxy.log --workers 4 --top 20
+
+ECB encrypts equal plain text blocks to equal cypher text blocks, so a
+line is scored by how many of its blocks repeat an earlier block, see
+cryptopals.crypto.Blocks.repeats. Long lines are sorted as one array of
+blocks rather than hashed block by block, so memory use stays close to
+the size of the line.
+
+Input is read a line at a time from files or stdin and scored in
+batches, optionally on a pool of worker processes, see cryptopals.lines.
+"""
+import argparse
+import heapq
+import sys
+import time
+
+from cryptopals.crypto import Blocks
+from cryptopals.lines import (
+    DECODE_ERRORS,
+    LineReader,
+    add_arguments,
+    batches,
+    decoder,
+    map_batches,
+    report
+)
+
+
+def ecb_score(ct, blocksize=16):
+    """Count the blocks of a cypher text that repeat an earlier block
+
+    :param ct: The cypher text
+    :param blocksize: the block size in bytes
+    :returns: The number of repeated blocks
+    :rtype: int
+
+    """
+    return Blocks(ct, blocksize).repeats()
+
+
+def detect_ecb(ct, blocksize=16, threshold=1):
+    """Guess whether a cypher text was encrypted with ECB
+
+    :param ct: The cypher text
+    :param blocksize: the block size in bytes
+    :param threshold: The number of repeated blocks that means ECB
+    :returns: Whether at least threshold blocks repeat
+    :rtype: bool
+
+    """
+    return ecb_score(ct, blocksize) >= threshold
+
+
+def _score_batch(job):
+    """Score a batch of lines, keeping those at or above the threshold"""
+    first, lines, blocksize, threshold, encoding = job
+    decode = decoder(encoding)
+    scores = []
+    for number, line in enumerate(lines, first):
+        try:
+            score = ecb_score(decode(line), blocksize)
+        except DECODE_ERRORS:
+            continue
+        if score >= threshold:
+            scores.append((number, score))
+    return scores
+
+
+def scan(lines, blocksize=16, threshold=1, encoding='hex', workers=None,
+         batchsize=4096):
+    """Score every line of an input, in input order. Lines that fail to
+    decode are skipped.
+
+    :param lines: An iterable of encoded cypher texts, such as a file
+    :param blocksize: the block size in bytes
+    :param threshold: The fewest repeated blocks for a line to be kept
+    :param encoding: 'hex', 'base64' or 'raw'
+    :param workers: The number of worker processes, None for none
+    :param batchsize: The number of lines sent to a worker at a time
+    :returns: An iterator of (line number, score) tuples
+    :rtype: Iterator
+
+    """
+    decoder(encoding)
+    jobs = (
+        (first, batch, blocksize, threshold, encoding)
+        for first, batch in batches(lines, batchsize)
+    )
+    for scores in map_batches(_score_batch, jobs, workers):
+        for result in scores:
+            yield result
+
+
+def _rank_key(result):
+    return -result[1], result[0]
+
+
+def rank(scores, top=None):
+    """Order scores from most to fewest repeated blocks
+
+    :param scores: (line number, score) tuples, as from scan
+    :param top: Keep only this many of the highest scores
+    :returns: (line number, score) tuples, best first
+    :rtype: list
+
+    """
+    if top is None:
+        return sorted(scores, key=_rank_key)
+    return heapq.nsmallest(top, scores, key=_rank_key)
+
+
+def parser():
+    """Build the argument parser
+
+    :returns: The parser for the command line
+    :rtype: argparse.ArgumentParser
+
+    """
+    p = argparse.ArgumentParser(
+        prog='python -m cryptopals.detect',
+        description='Rank lines by how likely they are ECB cypher text.'
+    )
+    add_arguments(p)
+    p.add_argument('--blocksize', type=int, default=16)
+    p.add_argument(
+        '--threshold',
+        type=int,
+        default=1,
+        help='The fewest repeated blocks for a line to be reported'
+    )
+    p.add_argument('--top', type=int, help='Only report the best lines')
+    return p
+
+
+def main(argv=None):
+    """Run the command line. Reported lines are printed as
+    "<line number> <repeated blocks>", best first, and a summary goes to
+    stderr.
+
+    :param argv: The arguments, defaults to sys.argv
+    :returns: The exit status
+    :rtype: int
+
+    """
+    args = parser().parse_args(argv)
+    reader = LineReader(args.input)
+    start = time.time()
+    ranked = rank(
+        scan(
+            reader,
+            args.blocksize,
+            args.threshold,
+            args.encoding,
+            args.workers,
+            args.batchsize
+        ),
+        args.top
+    )
+    seconds = time.time() - start
+    for number, score in ranked:
+        print('%i %i' % (number, score))
+    report(reader.count, seconds)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
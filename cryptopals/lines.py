@@ -0,0 +1,148 @@
+""" Stream encoded lines from files or stdin through batch workers.
+
+The line scanning commands (cryptopals.detect and cryptopals.xorscan)
+read one cypher text per line, possibly millions of them. Lines are
+read lazily, grouped into batches and each batch is handed to a
+function, optionally on a pool of worker processes. At most two batches
+per worker are in flight, so memory use does not grow with the input.
+"""
+import binascii
+import collections
+import multiprocessing
+import sys
+
+DECODERS = {
+    'hex': lambda line: binascii.unhexlify(line.strip()),
+    'base64': lambda line: binascii.a2b_base64(line),
+    'raw': lambda line: line.rstrip(b'\r\n'),
+}
+
+DECODE_ERRORS = (binascii.Error, TypeError)
+
+
+def decoder(encoding):
+    """The function decoding lines of an encoding
+
+    :param encoding: 'hex', 'base64' or 'raw'
+    :returns: A function taking a line and returning its bytes
+    :rtype: function
+
+    """
+    if encoding not in DECODERS:
+        raise ValueError('Unknown encoding %r' % encoding)
+    return DECODERS[encoding]
+
+
+class LineReader(object):
+    """Iterate over the lines of files, counting them. The path - reads
+    stdin."""
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.count = 0
+
+    def _lines(self, path):
+        if path == '-':
+            # Python 3's stdin is text, its buffer gives the bytes
+            return getattr(sys.stdin, 'buffer', sys.stdin)
+        return open(path, 'rb')
+
+    def __iter__(self):
+        for path in self.paths:
+            f = self._lines(path)
+            try:
+                for line in f:
+                    self.count += 1
+                    yield line
+            finally:
+                if path != '-':
+                    f.close()
+
+
+def batches(lines, batchsize):
+    """Group lines into lists
+
+    :param lines: An iterable of lines
+    :param batchsize: The most lines in a batch
+    :returns: An iterator of (first line number, lines) tuples, line
+        numbers starting at 1
+    :rtype: Iterator
+
+    """
+    batch = []
+    first = 1
+    for number, line in enumerate(lines, 1):
+        batch.append(line)
+        if len(batch) == batchsize:
+            yield first, batch
+            batch = []
+            first = number + 1
+    if batch:
+        yield first, batch
+
+
+def map_batches(function, jobs, workers=None):
+    """Apply a function to every job, in this process or on a pool of
+    worker processes, keeping at most two jobs per worker in flight.
+
+    :param function: A module level function taking one job
+    :param jobs: An iterable of jobs
+    :param workers: The number of worker processes, None for none
+    :returns: An iterator of results in job order
+    :rtype: Iterator
+
+    """
+    if not workers or workers < 2:
+        for job in jobs:
+            yield function(job)
+        return
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        pending = collections.deque()
+        for job in jobs:
+            pending.append(pool.apply_async(function, (job,)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def add_arguments(parser, encoding='hex'):
+    """Add the input, --encoding, --workers and --batchsize arguments
+
+    :param parser: An argparse.ArgumentParser
+    :param encoding: The default encoding
+
+    """
+    parser.add_argument(
+        'input',
+        nargs='*',
+        default=['-'],
+        help='The files to read, - for stdin'
+    )
+    parser.add_argument(
+        '--encoding',
+        choices=sorted(DECODERS),
+        default=encoding
+    )
+    parser.add_argument('--workers', type=int, help='Worker processes to use')
+    parser.add_argument('--batchsize', type=int, default=4096)
+
+
+def report(count, seconds):
+    """Write the throughput of a scan to stderr
+
+    :param count: The number of lines scanned
+    :param seconds: The time taken
+
+    """
+    seconds = max(seconds, 1e-9)
+    sys.stderr.write('Scanned %i lines in %.3fs (%.0f lines/s)\n' % (
+        count,
+        seconds,
+        count / seconds
+    ))
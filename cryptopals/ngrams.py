@@ -0,0 +1,345 @@
+""" Score plain texts with n-gram log-probabilities.
+
+    python -m cryptopals.ngrams corpus.txt --order 3 -o english.ngrams
+
+Bytes are folded into 32 classes (the letters regardless of case, space,
+digits, sentence punctuation, other printable characters, other white
+space and everything else) and a text's log-probability is
+
+    sum log P(class of b_i | classes of the n - 1 bytes before it)
+  + sum log P(b_i | class of b_i)
+
+so a trigram table has 32 ** 3 entries rather than 256 ** 3. The tables
+are built from a corpus, smoothed by backing off to the next lower order
+and written to a small binary file which is memory mapped at load:
+
+    'NGRM', version, classes, order     4 bytes and 3 little endian uint32
+    class of each byte                  256 uint8
+    log P(byte | class)                 256 float32
+    log P(class | context), order 1..n  classes ** order float32 each
+
+english.ngrams, next to this module, holds orders 1 to 3 built from the
+Project Gutenberg text of Newton's Opticks.
+
+To rank XOR keys the n-grams of the cypher text are counted once, and
+the table entries of every distinct n-gram under all 256 keys are
+gathered in one (256, distinct n-grams) batch.
+"""
+import argparse
+import os
+import string
+import struct
+import sys
+
+import numpy as np
+
+from cryptopals.crypto import as_uint8
+from cryptopals.scoring import (
+    Scorer,
+    _XOR_INDEX
+)
+
+MAGIC = b'NGRM'
+VERSION = 1
+HEADER = struct.Struct('<4sIII')
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), 'english.ngrams')
+
+
+def byte_classes():
+    """The default byte classes
+
+    :returns: 256 class numbers indexed by byte value
+    :rtype: numpy.ndarray
+
+    """
+    classes = np.full(256, 31, dtype=np.uint8)
+    for chars, number in ((string.punctuation, 29),
+                          ('.,;:!?', 28),
+                          (string.digits, 27),
+                          ('\t\n\r\x0b\x0c', 30),
+                          (' ', 26)):
+        classes[[ord(char) for char in chars]] = number
+    for number, char in enumerate(string.ascii_lowercase):
+        classes[ord(char)] = number
+        classes[ord(char.upper())] = number
+    return classes
+
+
+def _gram_index(classes, count, order, length):
+    """The table index of each order long n-gram of a class array"""
+    index = np.zeros(length - order + 1, dtype=np.intp)
+    for i in range(order):
+        index *= count
+        index += classes[i:length - order + 1 + i]
+    return index
+
+
+def build_tables(corpus, order=3, classes=None, prior=None, smoothing=0.5):
+    """Build the log-probability tables of a corpus. Order k
+    probabilities are the counts of each context, plus prior times the
+    order k - 1 probabilities, normalised.
+
+    :param corpus: The text to learn from
+    :param order: The longest n-gram
+    :param classes: 256 class numbers indexed by byte, byte_classes()
+        by default
+    :param prior: The weight of the lower order, the number of classes
+        by default
+    :param smoothing: Added to every byte count within a class
+    :returns: The classes, log P(byte | class) and a list of the log
+        P(class | context) tables for orders 1 to order
+    :rtype: tuple
+
+    """
+    if classes is None:
+        classes = byte_classes()
+    data = as_uint8(corpus)
+    count = int(classes.max()) + 1
+    if prior is None:
+        prior = float(count)
+    cls = classes[data]
+
+    bytes_seen = np.bincount(data, minlength=256) + smoothing
+    class_seen = np.bincount(classes, weights=bytes_seen, minlength=count)
+    emission = np.log(bytes_seen / class_seen[classes])
+
+    tables = []
+    lower = np.full((1, count), 1.0 / count)
+    for k in range(1, order + 1):
+        counts = np.bincount(
+            _gram_index(cls, count, k, max(len(cls), k - 1)),
+            minlength=count ** k
+        ).reshape(-1, count).astype(np.float64)
+        lower = np.tile(lower, (count if k > 1 else 1, 1))
+        probability = (counts + prior * lower) / (
+            counts.sum(axis=1)[:, None] + prior
+        )
+        tables.append(np.log(probability).reshape(-1))
+        lower = probability
+    return classes, emission, tables
+
+
+def save_tables(path, classes, emission, tables):
+    """Write tables from build_tables to a file
+
+    :param path: The file to write
+    :param classes: 256 class numbers indexed by byte
+    :param emission: log P(byte | class)
+    :param tables: The log P(class | context) tables, orders 1 to n
+
+    """
+    count = int(classes.max()) + 1
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, count, len(tables)))
+        f.write(np.asarray(classes, dtype=np.uint8).tobytes())
+        f.write(np.asarray(emission, dtype='<f4').tobytes())
+        for table in tables:
+            f.write(np.asarray(table, dtype='<f4').tobytes())
+
+
+class NgramModel(object):
+    """n-gram tables memory mapped from a file written by save_tables"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        """Map a model
+
+        :param path: The file to map
+        :returns: The model
+        :rtype: NgramModel
+
+        """
+        self.path = path
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+        if len(data) < HEADER.size:
+            raise ValueError('%s is not an n-gram file' % path)
+        magic, version, count, order = HEADER.unpack(
+            data[:HEADER.size].tobytes()
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('%s is not an n-gram file' % path)
+        size = HEADER.size + 256 + 4 * 256 + 4 * sum(
+            count ** k for k in range(1, order + 1)
+        )
+        if len(data) != size:
+            raise ValueError('%s is truncated' % path)
+        self.count = count
+        self.order = order
+        data = np.asarray(data)
+        offset = HEADER.size
+        self.classes = data[offset:offset + 256]
+        offset += 256
+        self.emission = data[offset:offset + 4 * 256].view('<f4')
+        offset += 4 * 256
+        self.tables = [None]
+        for k in range(1, order + 1):
+            end = offset + 4 * count ** k
+            self.tables.append(data[offset:end].view('<f4'))
+            offset = end
+
+
+_models = {}
+
+
+def load_model(path=DEFAULT_PATH):
+    """Map a model, once per path
+
+    :param path: The file written by save_tables
+    :returns: The model
+    :rtype: NgramModel
+
+    """
+    if path not in _models:
+        _models[path] = NgramModel(path)
+    return _models[path]
+
+
+class NgramScorer(Scorer):
+    """The log-probability of a text under an n-gram model. A key byte
+    also changes the n-grams reaching into the neighbouring columns, so
+    column_scores takes their bytes from the current guess of the
+    key."""
+
+    contextual = True
+
+    def __init__(self, order=3, path=DEFAULT_PATH):
+        """Compile a scorer
+
+        :param order: The n-gram order, at most the model's
+        :param path: The model file
+        :returns: A scorer
+        :rtype: NgramScorer
+
+        """
+        self.model = load_model(path)
+        if not 1 <= order <= self.model.order:
+            raise ValueError('%s has no order %i table' % (path, order))
+        self.name = 'ngram%i' % order
+        self.order = order
+        self.classes = self.model.classes.astype(np.intp)
+        self.emission = self.model.emission.astype(np.float64)
+        self.emission_table = self.emission[_XOR_INDEX]
+        self.tables = self.model.tables[:order + 1]
+        self.unigram_table = (
+            self.emission + self.tables[1][self.classes]
+        )[_XOR_INDEX]
+
+    def score(self, data):
+        data = as_uint8(data)
+        cls = self.classes[data]
+        total = self.emission[data].sum()
+        count = self.model.count
+        for k in range(1, min(self.order, len(data) + 1)):
+            total += self.tables[k][_gram_index(cls[:k], count, k, k)][0]
+        if len(data) >= self.order:
+            index = _gram_index(cls, count, self.order, len(cls))
+            total += self.tables[self.order][index].sum(dtype=np.float64)
+        return float(total)
+
+    def _gram_scores(self, grams, mask):
+        """Score n-grams under all 256 keys. grams is a (count, k) byte
+        array and mask says which of its columns the key is XORed into.
+        Repeated n-grams are scored once and weighted by their count."""
+        order = len(mask)
+        codes = np.zeros(len(grams), dtype=np.int64)
+        for i in range(order):
+            codes = codes * 256 + grams[:, i]
+        codes, counts = np.unique(codes, return_counts=True)
+        keys = np.arange(256)[:, None]
+        index = np.zeros((1, len(codes)), dtype=np.intp)
+        for i in range(order):
+            byte = (codes >> 8 * (order - 1 - i)) & 255
+            index = index * self.model.count + self.classes[
+                byte[None, :] ^ keys if mask[i] else byte[None, :]
+            ]
+        return self.tables[order][index].dot(counts)
+
+    def key_scores(self, ct):
+        data = as_uint8(ct)
+        return self._column_scores(data, data, 1, 0)
+
+    def column_scores(self, ct, keysize, key=None):
+        data = as_uint8(ct)
+        if key is None:
+            return np.array([
+                self.unigram_table.dot(np.bincount(column, minlength=256))
+                for column in (data[i::keysize] for i in range(keysize))
+            ])
+        plain = data ^ np.resize(np.asarray(key, dtype=np.uint8), len(data))
+        return np.array([
+            self._column_scores(data, plain, keysize, column)
+            for column in range(keysize)
+        ])
+
+    def _column_scores(self, data, plain, keysize, column):
+        """Score the bytes for one key column, counting only the terms
+        that depend on it: the emissions of its bytes and every n-gram
+        holding one of them, once, by the last of them it holds."""
+        length = len(data)
+        order = self.order
+        positions = np.arange(column, length, keysize)
+        scores = self.emission_table.dot(
+            np.bincount(data[positions], minlength=256)
+        )
+        # The first bytes have shorter contexts
+        for end in range(min(order - 1, length)):
+            mask = [(i - column) % keysize == 0 for i in range(end + 1)]
+            if any(mask):
+                gram = np.where(mask, data[:end + 1], plain[:end + 1])
+                scores += self._gram_scores(gram[None, :], mask)
+        for after in range(min(order, keysize)):
+            ends = positions + after
+            ends = ends[(ends >= order - 1) & (ends < length)]
+            if not len(ends):
+                continue
+            mask = [
+                (after - order + 1 + i) % keysize == 0 for i in range(order)
+            ]
+            grams = np.column_stack([
+                (data if in_column else plain)[ends - order + 1 + i]
+                for i, in_column in enumerate(mask)
+            ])
+            scores += self._gram_scores(grams, mask)
+        return scores
+
+
+def parser():
+    """Build the argument parser
+
+    :returns: The parser for the command line
+    :rtype: argparse.ArgumentParser
+
+    """
+    p = argparse.ArgumentParser(
+        prog='python -m cryptopals.ngrams',
+        description='Build an n-gram log-probability table file.'
+    )
+    p.add_argument('corpus', nargs='+', help='The text files to learn from')
+    p.add_argument('-o', '--output', default=DEFAULT_PATH)
+    p.add_argument('--order', type=int, default=3)
+    return p
+
+
+def main(argv=None):
+    """Run the command line
+
+    :param argv: The arguments, defaults to sys.argv
+    :returns: The exit status
+    :rtype: int
+
+    """
+    args = parser().parse_args(argv)
+    corpus = []
+    for path in args.corpus:
+        with open(path, 'rb') as f:
+            corpus.append(f.read())
+    save_tables(args.output, *build_tables(b'\n'.join(corpus), args.order))
+    sys.stderr.write('Wrote %s (%i bytes)\n' % (
+        args.output,
+        os.path.getsize(args.output)
+    ))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+""" Spread ECB and CBC decryption over a process pool.
+
+Neither ECB nor CBC decryption carries state from one block to the
+next, so block aligned ranges can be processed independently. The
+payload is copied once into a shared memory array, which is handed to
+the workers as the pool starts them, so this works with the fork, spawn
+and forkserver start methods alike. Workers read their range from it
+and write their output into a second shared array, and only the
+(start, stop) offsets cross the process boundary.
+
+Below PARALLEL_THRESHOLD bytes the cost of starting the pool outweighs
+the gain and the single process path is used instead. The threshold
+comes from benchmarks/bench_parallel.py.
+"""
+import multiprocessing
+
+import numpy as np
+
+from cryptopals.crypto import (
+    aes_cbc_decrypt_into,
+    aes_context,
+    as_uint8
+)
+
+PARALLEL_THRESHOLD = 32 << 20
+
+OPERATIONS = ('ecb_encrypt', 'ecb_decrypt', 'cbc_decrypt')
+
+# The shared src and dst arrays, set in each worker by _init_worker
+_buffers = None
+
+
+def _init_worker(src, dst):
+    """Pool initializer: keep the shared arrays for _work"""
+    global _buffers
+    _buffers = (
+        np.frombuffer(src, dtype=np.uint8),
+        np.frombuffer(dst, dtype=np.uint8)
+    )
+
+
+def _crypt_range(operation, context, iv, blocksize, src, dst, start, stop):
+    """Process one block aligned range of src into dst"""
+    if operation == 'ecb_encrypt':
+        dst[start:stop] = as_uint8(context.encrypt(src[start:stop]))
+    elif operation == 'ecb_decrypt':
+        dst[start:stop] = as_uint8(context.decrypt(src[start:stop]))
+    else:
+        aes_cbc_decrypt_into(
+            context,
+            src[start:stop],
+            dst[start:stop],
+            src[start - blocksize:start].tobytes() if start else iv,
+            blocksize
+        )
+
+
+def _work(job):
+    """Process one range of the shared buffers in a pool worker"""
+    operation, key, iv, blocksize, start, stop = job
+    src, dst = _buffers
+    _crypt_range(
+        operation, aes_context(key), iv, blocksize, src, dst, start, stop
+    )
+
+
+def split_blocks(size, parts, blocksize=16):
+    """Split size bytes into at most parts block aligned ranges
+
+    :param size: The number of bytes, a multiple of blocksize
+    :param parts: The number of ranges wanted
+    :param blocksize: the block size in bytes
+    :returns: A list of (start, stop) tuples
+    :rtype: list
+
+    """
+    blocks = size // blocksize
+    step = -(-blocks // max(1, parts)) * blocksize
+    return [
+        (start, min(start + step, size))
+        for start in range(0, size, step or blocksize)
+    ]
+
+
+def parallel_crypt(operation, key, data, workers, iv=None, blocksize=16,
+                   threshold=None):
+    """Run 'ecb_encrypt', 'ecb_decrypt' or 'cbc_decrypt' over block aligned
+    data using a pool of worker processes. Inputs smaller than the
+    threshold are processed in this process.
+
+    :param operation: 'ecb_encrypt', 'ecb_decrypt' or 'cbc_decrypt'
+    :param key: The key, or an AESContext, to use
+    :param data: The block aligned input
+    :param workers: The number of worker processes
+    :param iv: The Initialization vector for CBC
+    :param blocksize: the block size in bytes
+    :param threshold: The smallest input to use the pool for
+    :returns: The output with no padding added or removed
+    :rtype: str
+
+    """
+    if operation not in OPERATIONS:
+        raise ValueError('Unknown operation %r' % operation)
+    context = aes_context(key)
+    iv = iv if iv else b'\x00' * blocksize
+    threshold = PARALLEL_THRESHOLD if threshold is None else threshold
+    if not workers or workers < 2 or len(data) < max(threshold, blocksize):
+        src = as_uint8(data)
+        dst = np.empty(len(data), dtype=np.uint8)
+        _crypt_range(operation, context, iv, blocksize, src, dst, 0, len(src))
+        return dst.tobytes()
+
+    if len(data) % blocksize:
+        raise ValueError(
+            'The length of the provided data is not a multiple of the '
+            'block length.'
+        )
+    src = multiprocessing.RawArray('B', len(data))
+    np.frombuffer(src, dtype=np.uint8)[:] = as_uint8(data)
+    dst = multiprocessing.RawArray('B', len(data))
+    pool = multiprocessing.Pool(
+        workers,
+        initializer=_init_worker,
+        initargs=(src, dst)
+    )
+    try:
+        pool.map(_work, [
+            (operation, context.key, iv, blocksize, start, stop)
+            for start, stop in split_blocks(len(data), workers, blocksize)
+        ])
+    finally:
+        pool.close()
+        pool.join()
+    return np.frombuffer(dst, dtype=np.uint8).tobytes()
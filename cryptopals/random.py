@@ -1,12 +1,256 @@
+""" Random bytes and integers for keys, IVs and oracles.
+
+The oracles ask for a few bytes at a time. A RandomPool reads `size`
+bytes at once and serves slices of the buffer, as bytes or as zero copy
+memoryviews. Each thread is served from a buffer of its own, so taking
+bytes needs no lock and threads never get the same bytes. A forked
+child drops the buffers it inherited, so it never repeats its parent's
+bytes either.
+
+A pool given a seed is deterministic instead: its bytes are an AES-256
+CTR keystream keyed by the SHA-256 of the seed, for reproducible runs
+and benchmarks. It is not for real keys. Which thread got which bytes
+would depend on scheduling, so a seeded pool belongs to the first
+thread that takes from it and raises RuntimeError in any other. It
+must not be shared across worker processes either: sibling workers
+forked from one parent would all carry on the same stream, so a
+forked child that takes from a seeded pool it inherited raises
+RuntimeError. Give each worker or shard a pool seeded of its own
+instead, from the parent's seed and the shard number.
+
+random_bytes and random_int draw from a shared default pool, which is
+seeded from the CRYPTOPALS_SEED environment variable if it is set, or
+by seed(). An oracle given a seed of its own draws from a pool of its
+own, see get_pool, so its keys do not depend on what else ran first.
+"""
+import hashlib
 import os
+import threading
+import weakref
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from cryptopals.compat import int_from_bytes
+
+# Every pool, so the ones in a forked child can drop their buffers
+_pools = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for pool in list(_pools):
+        pool._after_fork()
+
+
+# Python 3.7 and later run hooks after a fork, earlier versions compare
+# process ids on every request instead
+_AT_FORK = hasattr(os, 'register_at_fork')
+if _AT_FORK:
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class _ThreadBuffer(threading.local):
+    """The bytes a thread has been given and not used yet"""
+
+    def __init__(self):
+        self.buffer = b''
+        self.offset = 0
+        self.length = 0
+
+
+class RandomPool(object):
+    """A buffer of random bytes refilled in large reads"""
+
+    def __init__(self, size=1 << 16, seed=None):
+        """Create an empty pool, filled on first use
+
+        :param size: The number of bytes read per refill. Requests
+            larger than this are read directly.
+        :param seed: An int or bytes to make the pool deterministic, or
+            None to read from os.urandom
+        :returns: A pool
+        :rtype: RandomPool
+
+        """
+        self.size = size
+        self.seed = seed
+        self.refills = 0
+        self._pid = os.getpid()
+        self._local = _ThreadBuffer()
+        self._lock = threading.Lock()
+        self._owner = None
+        self._forked = False
+        _pools.add(self)
+        if seed is None:
+            self._read = os.urandom
+        else:
+            if not isinstance(seed, bytes):
+                seed = str(seed).encode('ascii')
+            self._keystream = Cipher(
+                algorithms.AES(hashlib.sha256(seed).digest()),
+                modes.CTR(b'\x00' * 16),
+                backend=default_backend()
+            ).encryptor()
+            self._read = self._read_keystream
+
+    def _read_keystream(self, size):
+        return self._keystream.update(b'\x00' * size)
+
+    def _after_fork(self):
+        """Drop every thread buffer inherited from the parent"""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._local = _ThreadBuffer()
+        self._forked = True
+
+    def _check_owner(self):
+        """Give a seeded pool to the first thread that takes from it"""
+        if self._forked:
+            raise RuntimeError(
+                'A seeded RandomPool cannot be used in a forked child, '
+                'its siblings would take the same bytes'
+            )
+        thread = threading.current_thread()
+        if self._owner is None:
+            self._owner = thread
+        elif self._owner is not thread:
+            raise RuntimeError(
+                'A seeded RandomPool belongs to %s, it cannot be used from '
+                '%s' % (self._owner.name, thread.name)
+            )
+
+    def _take(self, size):
+        """The buffer holding the next size bytes of this thread and
+        their offset"""
+        if not _AT_FORK and self._pid != os.getpid():
+            self._after_fork()
+        local = self._local
+        offset = local.offset
+        if offset + size <= local.length:
+            local.offset = offset + size
+            return local.buffer, offset
+        with self._lock:
+            if self.seed is not None:
+                self._check_owner()
+            self.refills += 1
+            if size > self.size:
+                return self._read(size), 0
+            local.buffer = self._read(self.size)
+        local.offset = size
+        local.length = self.size
+        return local.buffer, 0
+
+    def bytes(self, size):
+        """Take random bytes
+
+        :param size: The number of bytes
+        :returns: The bytes
+        :rtype: bytes
+
+        """
+        # _take inlined for the common case, this is called per request
+        local = self._local
+        offset = local.offset
+        if _AT_FORK and offset + size <= local.length:
+            local.offset = offset + size
+            return local.buffer[offset:offset + size]
+        buffer, offset = self._take(size)
+        return buffer[offset:offset + size]
+
+    def view(self, size):
+        """Take random bytes without copying them out of the pool. The
+        bytes are never handed out again, so the view stays valid.
+
+        :param size: The number of bytes
+        :returns: A read only view of the bytes
+        :rtype: memoryview
+
+        """
+        buffer, offset = self._take(size)
+        return memoryview(buffer)[offset:offset + size]
+
+    def random_int(self, start, end):
+        """Take a uniform random integer. Draws that would make some
+        values more likely than others are rejected and drawn again,
+        rather than reduced with a biased modulo.
+
+        :param start: The smallest value
+        :param end: The largest value, inclusive
+        :returns: The integer
+        :rtype: int
+
+        """
+        span = end - start + 1
+        if span < 1:
+            raise ValueError('empty range %i to %i' % (start, end))
+        if span <= 256:
+            # The common case: one byte, read with ord
+            limit = 256 // span * span
+            while True:
+                value = ord(self.bytes(1))
+                if value < limit:
+                    return start + value % span
+        size = ((span - 1).bit_length() + 7) // 8
+        # The largest multiple of span that size bytes can hold
+        limit = (1 << 8 * size) // span * span
+        while True:
+            value = int_from_bytes(self.bytes(size))
+            if value < limit:
+                return start + value % span
+
+
+SEED_VARIABLE = 'CRYPTOPALS_SEED'
+
+_pool = RandomPool(seed=os.environ.get(SEED_VARIABLE) or None)
+
+
+def seed(value=None):
+    """Replace the default pool. Everything drawn from it afterwards is
+    the same on every run with the same seed.
+
+    :param value: An int or bytes seed, or None to go back to
+        os.urandom
+
+    """
+    global _pool
+    _pool = RandomPool(seed=value)
+
+
+def get_pool(seed=None):
+    """The pool an oracle should draw its keys from
+
+    :param seed: None for the default pool, a RandomPool to share, or an
+        int or bytes seed for a deterministic pool of its own
+    :returns: A pool
+    :rtype: RandomPool
+
+    """
+    if seed is None:
+        return _pool
+    if isinstance(seed, RandomPool):
+        return seed
+    # An oracle draws a few keys, so a small refill is plenty
+    return RandomPool(size=1024, seed=seed)
 
 
 def random_bytes(size):
-    return ''.join(
-        chr(c)
-        for c in bytearray(os.urandom(size))
-    )
+    """Take random bytes from the default pool
+
+    :param size: The number of bytes
+    :returns: The bytes
+    :rtype: bytes
+
+    """
+    return _pool.bytes(size)
 
 
 def random_int(start, end):
-    return ord(random_bytes(1)) % (end - start + 1) + start
+    """Take a uniform random integer from the default pool
+
+    :param start: The smallest value
+    :param end: The largest value, inclusive
+    :returns: The integer
+    :rtype: int
+
+    """
+    return _pool.random_int(start, end)
@@ -0,0 +1,408 @@
+""" Score how much a buffer looks like English.
+
+Scorers are looked up by name with get_scorer, so every breaker can be
+told which one to use:
+
+    unigram      letter frequencies, summed per byte
+    printable    the number of printable ASCII bytes, ties broken by
+                 letter frequency
+    chi-squared  minus the chi-squared statistic of the letter counts
+    bigram       letter frequencies plus English letter pair frequencies
+    ngram2       log-probabilities from corpus built n-gram tables,
+    ngram3       see cryptopals.ngrams
+
+Higher scores are better. Each scorer compiles its model to a lookup
+array at construction, 256 entries indexed by byte or 65536 indexed by
+byte pair, so scoring a buffer is a gather and a sum with no per
+character python.
+
+Besides scoring a buffer, scorers rank the 256 single byte XOR keys of a
+cypher text (key_scores) and the key bytes of every column of a
+repeating key XOR cypher text (column_scores). The unigram and
+printable scores are linear in byte counts, so they score all keys at
+once from a histogram, see cryptopals.xorbreak.
+"""
+import string
+
+import numpy as np
+
+from cryptopals.crypto import as_uint8
+
+LETTER_FREQ = {
+    'a': 8.167,
+    'b': 1.492,
+    'c': 2.782,
+    'd': 4.253,
+    'e': 12.702,
+    'f': 2.228,
+    'g': 2.015,
+    'h': 6.094,
+    'i': 6.966,
+    'j': 0.153,
+    'k': 0.772,
+    'l': 4.025,
+    'm': 2.406,
+    'n': 6.749,
+    'o': 7.507,
+    'p': 1.929,
+    'q': 0.095,
+    'r': 5.987,
+    's': 6.327,
+    't': 9.056,
+    'u': 2.758,
+    'v': 0.978,
+    'w': 2.360,
+    'x': 0.150,
+    'y': 1.974,
+    'z': 0.074,
+    ' ': 17.162,
+}
+
+# Percentages of the most common English letter pairs
+BIGRAM_FREQ = {
+    'th': 3.56, 'he': 3.07, 'in': 2.43, 'er': 2.05, 'an': 1.99,
+    're': 1.85, 'on': 1.76, 'at': 1.49, 'en': 1.45, 'nd': 1.35,
+    'ti': 1.34, 'es': 1.34, 'or': 1.28, 'te': 1.20, 'of': 1.17,
+    'ed': 1.17, 'is': 1.13, 'it': 1.12, 'al': 1.09, 'ar': 1.07,
+    'st': 1.05, 'to': 1.04, 'nt': 1.04, 'ng': 0.95, 'se': 0.93,
+    'ha': 0.93, 'as': 0.87, 'ou': 0.87, 'io': 0.83, 'le': 0.83,
+    've': 0.83, 'co': 0.79, 'me': 0.79, 'de': 0.76, 'hi': 0.76,
+    'ri': 0.73, 'ro': 0.73, 'ic': 0.70, 'ne': 0.69, 'ea': 0.69,
+    'ra': 0.69, 'ce': 0.65,
+}
+
+_XOR_INDEX = np.arange(256)[:, None] ^ np.arange(256)[None, :]
+
+
+def frequency_weights(freq=LETTER_FREQ, default=0.0):
+    """Per byte weights for a letter frequency table. Upper case letters
+    share the weight of their lower case form.
+
+    :param freq: A dict of character to weight
+    :param default: The weight of any byte not in freq
+    :returns: 256 weights indexed by byte value
+    :rtype: numpy.ndarray
+
+    """
+    weights = np.full(256, default, dtype=np.float64)
+    for char, weight in freq.items():
+        weights[ord(char)] = weight
+        weights[ord(char.upper())] = weight
+    return weights
+
+
+def key_table(weights):
+    """The permuted score table for single byte XOR keys
+
+    :param weights: 256 per byte plain text weights
+    :returns: A 256x256 array where [k, c] is the weight of c ^ k
+    :rtype: numpy.ndarray
+
+    """
+    return np.asarray(weights, dtype=np.float64)[_XOR_INDEX]
+
+
+def byte_histogram(data):
+    """Count each byte value
+
+    :param data: A bytes-like object
+    :returns: 256 counts indexed by byte value
+    :rtype: numpy.ndarray
+
+    """
+    return np.bincount(as_uint8(data), minlength=256)
+
+
+def _columns(data, keysize):
+    return [data[column::keysize] for column in range(keysize)]
+
+
+class Scorer(object):
+    """Score buffers and rank XOR keys. Subclasses implement score and
+    key_scores, the other methods are built on them."""
+
+    name = None
+
+    # Whether a key byte's score depends on the neighbouring key bytes
+    contextual = False
+
+    def score(self, data):
+        """Score a buffer
+
+        :param data: A bytes-like object
+        :returns: The score, higher is more English
+        :rtype: float
+
+        """
+        raise NotImplementedError
+
+    def key_scores(self, ct):
+        """Score the plain text of every single byte XOR key
+
+        :param ct: The cypher text
+        :returns: 256 scores indexed by key
+        :rtype: numpy.ndarray
+
+        """
+        raise NotImplementedError
+
+    def batch_key_scores(self, cts):
+        """Score every single byte XOR key of many cypher texts
+
+        :param cts: A list of cypher texts
+        :returns: A len(cts)x256 array of scores
+        :rtype: numpy.ndarray
+
+        """
+        scores = np.empty((len(cts), 256))
+        for row, ct in enumerate(cts):
+            scores[row] = self.key_scores(ct)
+        return scores
+
+    def column_scores(self, ct, keysize, key=None):
+        """Score every byte for every key byte of a repeating key XOR
+        cypher text. Contextual scorers use the rest of key for the
+        neighbours of each column, others ignore it.
+
+        :param ct: The cypher text
+        :param keysize: The key size
+        :param key: The current guess of the key, as a uint8 array
+        :returns: A keysizex256 array of scores
+        :rtype: numpy.ndarray
+
+        """
+        return np.array([
+            self.key_scores(column)
+            for column in _columns(as_uint8(ct), keysize)
+        ])
+
+
+class LinearScorer(Scorer):
+    """Add up a weight per byte. The score of a single byte XOR key k is
+    the sum over c of count(c) * weight(c ^ k), so a histogram and the
+    permuted weight table score all 256 keys in one product."""
+
+    def __init__(self, name, weights):
+        """Compile a scorer
+
+        :param name: The scorer's name
+        :param weights: 256 weights indexed by byte value
+        :returns: A scorer
+        :rtype: LinearScorer
+
+        """
+        self.name = name
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.table = key_table(self.weights)
+
+    def score(self, data):
+        return float(self.weights[as_uint8(data)].sum())
+
+    def key_scores(self, ct):
+        return self.table.dot(byte_histogram(ct))
+
+    def batch_key_scores(self, cts):
+        lengths = [len(ct) for ct in cts]
+        rows = np.repeat(np.arange(len(cts)), lengths) * 256
+        counts = np.bincount(
+            rows + as_uint8(b''.join(cts)),
+            minlength=len(cts) * 256
+        ).reshape(len(cts), 256)
+        return counts.dot(self.table.T)
+
+    def column_scores(self, ct, keysize, key=None):
+        counts = np.array([
+            np.bincount(column, minlength=256)
+            for column in _columns(as_uint8(ct), keysize)
+        ])
+        return counts.dot(self.table.T)
+
+
+class ChiSquaredScorer(Scorer):
+    """Minus the chi-squared statistic of a buffer's letter counts
+    against English. Bytes fall into 29 categories: the 26 letters
+    regardless of case, space, other printable characters and anything
+    else."""
+
+    name = 'chi-squared'
+
+    def __init__(self, freq=LETTER_FREQ, other=0.02, unprintable=1e-4):
+        """Compile a scorer
+
+        :param freq: Letter and space frequencies
+        :param other: The share of other printable characters
+        :param unprintable: The share of unprintable bytes
+        :returns: A scorer
+        :rtype: ChiSquaredScorer
+
+        """
+        letters = string.ascii_lowercase + ' '
+        self.categories = np.full(256, len(letters) + 1, dtype=np.intp)
+        self.categories[[ord(c) for c in string.printable]] = len(letters)
+        for index, char in enumerate(letters):
+            self.categories[ord(char)] = index
+            self.categories[ord(char.upper())] = index
+        expected = np.array([freq.get(c, 0.0) for c in letters])
+        expected *= (1 - other - unprintable) / expected.sum()
+        self.expected = np.append(expected, [other, unprintable])
+        self.onehot = np.zeros((256, len(self.expected)))
+        self.onehot[np.arange(256), self.categories] = 1
+
+    def _chi_squared(self, counts):
+        """counts is ...x29, the statistic is taken along the last axis"""
+        total = counts.sum(axis=-1)[..., None]
+        expected = np.maximum(total, 1) * self.expected
+        return ((counts - expected) ** 2 / expected).sum(axis=-1)
+
+    def score(self, data):
+        counts = np.bincount(
+            self.categories[as_uint8(data)],
+            minlength=len(self.expected)
+        )
+        return -float(self._chi_squared(counts))
+
+    def key_scores(self, ct):
+        permuted = byte_histogram(ct)[_XOR_INDEX]
+        return -self._chi_squared(permuted.dot(self.onehot))
+
+
+class BigramScorer(Scorer):
+    """Letter frequencies plus English letter pair frequencies. The pair
+    table holds, for every byte pair (a, b), the unigram weight of b and
+    the bigram weight of ab, so a buffer scores the unigram weight of its
+    first byte plus the table entry of each of its adjacent pairs.
+
+    A repeating XOR key byte also affects the pairs it makes with its
+    neighbouring columns, so column_scores takes the neighbouring key
+    bytes from the current guess of the key."""
+
+    name = 'bigram'
+    contextual = True
+
+    def __init__(self, freq=LETTER_FREQ, bigrams=BIGRAM_FREQ, weight=1.0):
+        """Compile a scorer
+
+        :param freq: Letter and space frequencies
+        :param bigrams: Letter pair frequencies
+        :param weight: How much a pair counts next to a single letter
+        :returns: A scorer
+        :rtype: BigramScorer
+
+        """
+        self.unigrams = frequency_weights(freq)
+        self.unigram_table = key_table(self.unigrams)
+        pairs = np.zeros((256, 256))
+        for pair, frequency in bigrams.items():
+            for a in (pair[0], pair[0].upper()):
+                for b in (pair[1], pair[1].upper()):
+                    pairs[ord(a), ord(b)] = weight * frequency
+        pairs += self.unigrams[None, :]
+        self.pairs = pairs.reshape(-1)
+
+    def score(self, data):
+        data = as_uint8(data).astype(np.intp)
+        if not len(data):
+            return 0.0
+        pairs = self.pairs[data[:-1] * 256 + data[1:]].sum()
+        return float(self.unigrams[data[0]] + pairs)
+
+    def _pair_scores(self, index, shift):
+        """Score all 256 values of the unknown byte(s) of some pairs.
+        index holds the pairs as a * 256 + b with the unknown bytes still
+        encrypted, and XORing a key byte k into them is index ^ k * shift:
+        1 for b, 256 for a and 257 for both."""
+        counts = np.bincount(index, minlength=65536)
+        present = np.flatnonzero(counts)
+        keys = np.arange(256)[:, None] * shift
+        return self.pairs[present[None, :] ^ keys].dot(counts[present])
+
+    def key_scores(self, ct):
+        data = as_uint8(ct).astype(np.intp)
+        if not len(data):
+            return np.zeros(256)
+        pairs = self._pair_scores(data[:-1] * 256 + data[1:], 257)
+        return self.unigrams[data[0] ^ np.arange(256)] + pairs
+
+    def column_scores(self, ct, keysize, key=None):
+        data = as_uint8(ct).astype(np.intp)
+        if key is None:
+            return np.array([
+                self.unigram_table.dot(np.bincount(column, minlength=256))
+                for column in _columns(data, keysize)
+            ])
+        if keysize == 1:
+            return self.key_scores(ct)[None, :]
+        plain = data ^ np.resize(np.asarray(key, dtype=np.intp), len(data))
+        scores = np.zeros((keysize, 256))
+        if len(data):
+            scores[0] = self.unigrams[data[0] ^ np.arange(256)]
+        for column in range(min(keysize, len(data))):
+            # The pairs ending in the column carry its unigram weights,
+            # the pairs starting in it add a constant for the next byte
+            positions = np.arange(column, len(data), keysize)
+            before = positions[positions > 0]
+            after = positions[positions < len(data) - 1]
+            scores[column] += self._pair_scores(
+                plain[before - 1] * 256 + data[before], 1
+            )
+            scores[column] += self._pair_scores(
+                data[after] * 256 + plain[after + 1], 256
+            )
+        return scores
+
+
+# Most keys leave a text just as printable, so a letter frequency term
+# too small to outweigh a printable byte in texts of up to a few
+# thousand bytes breaks the ties
+PRINTABLE_WEIGHTS = frequency_weights() / (1000 * max(LETTER_FREQ.values()))
+PRINTABLE_WEIGHTS[[ord(c) for c in string.printable]] += 1
+
+
+def _ngram_scorer(order):
+    """A factory for the n-gram scorer of an order, which is imported on
+    first use as it maps its table file"""
+    def factory():
+        from cryptopals.ngrams import NgramScorer
+        return NgramScorer(order)
+    return factory
+
+
+SCORERS = {
+    'unigram': lambda: LinearScorer('unigram', frequency_weights()),
+    'printable': lambda: LinearScorer('printable', PRINTABLE_WEIGHTS),
+    'chi-squared': ChiSquaredScorer,
+    'bigram': BigramScorer,
+    'ngram2': _ngram_scorer(2),
+    'ngram3': _ngram_scorer(3),
+}
+
+_compiled = {}
+
+
+def register_scorer(name, factory):
+    """Make a scorer available by name
+
+    :param name: The name to look the scorer up by
+    :param factory: A callable returning the Scorer, called once on
+        first use
+
+    """
+    SCORERS[name] = factory
+    _compiled.pop(name, None)
+
+
+def get_scorer(scorer='unigram'):
+    """Look up a scorer, compiling it on first use
+
+    :param scorer: A name from SCORERS, or a Scorer
+    :returns: The scorer
+    :rtype: Scorer
+
+    """
+    if isinstance(scorer, Scorer):
+        return scorer
+    if scorer not in SCORERS:
+        raise ValueError('Unknown scorer %r' % (scorer,))
+    if scorer not in _compiled:
+        _compiled[scorer] = SCORERS[scorer]()
+    return _compiled[scorer]
@@ -0,0 +1,111 @@
+""" Chunked AES encryption and decryption for file-like objects.
+
+Input is read `chunksize` bytes at a time and output is yielded as soon
+as whole blocks are available, so memory use does not grow with the
+size of the input. Only the final block is padded or unpadded.
+"""
+from cryptopals.crypto import (
+    aes_cbc_decrypt,
+    aes_cbc_encrypt,
+    aes_context,
+    pkcs7_pad,
+    pkcs7_unpad
+)
+
+MODES = ('ecb', 'cbc')
+
+
+def _no_padding(string):
+    return string
+
+
+def _check_mode(mode):
+    if mode not in MODES:
+        raise ValueError('Unknown mode %r, expected one of %s' % (
+            mode,
+            ', '.join(MODES)
+        ))
+
+
+def _encrypt_blocks(context, data, mode, iv):
+    """Encrypt block aligned data and return it with the next IV"""
+    if mode == 'ecb':
+        return context.encrypt(data), iv
+    ct = aes_cbc_encrypt(context, data, iv, len(iv), padder=_no_padding)
+    return ct, ct[-len(iv):]
+
+
+def _decrypt_blocks(context, data, mode, iv):
+    """Decrypt block aligned data and return it with the next IV"""
+    if mode == 'ecb':
+        return context.decrypt(data), iv
+    pt = aes_cbc_decrypt(context, data, iv, len(iv), unpadder=_no_padding)
+    return pt, data[-len(iv):]
+
+
+def encrypt_stream(key, stream, mode='ecb', iv=None, chunksize=65536,
+                   blocksize=16, padder=pkcs7_pad):
+    """Encrypt a file-like object chunk by chunk. The CBC chaining state
+    is carried across chunks and only the final chunk is padded.
+
+    :param key: The key, or an AESContext, to use for encryption
+    :param stream: A binary file-like object to read plain text from
+    :param mode: 'ecb' or 'cbc'
+    :param iv: The Initialization vector for CBC
+    :param chunksize: The number of bytes to read at a time
+    :param blocksize: the block size in bytes
+    :param padder: The padder to use on the final chunk
+    :returns: A generator of cypher text chunks
+    :rtype: Iterator
+
+    """
+    _check_mode(mode)
+    context = aes_context(key)
+    iv = iv if iv else b'\x00' * blocksize
+    pending = b''
+    while True:
+        chunk = stream.read(chunksize)
+        if not chunk:
+            break
+        pending += chunk
+        aligned = len(pending) - len(pending) % blocksize
+        if aligned:
+            ct, iv = _encrypt_blocks(context, pending[:aligned], mode, iv)
+            pending = pending[aligned:]
+            yield ct
+    ct, iv = _encrypt_blocks(context, padder(pending), mode, iv)
+    yield ct
+
+
+def decrypt_stream(key, stream, mode='ecb', iv=None, chunksize=65536,
+                   blocksize=16, unpadder=pkcs7_unpad):
+    """Decrypt a file-like object chunk by chunk. The last block is held
+    back until the end of the stream so only it is unpadded.
+
+    :param key: The key, or an AESContext, to use for decryption
+    :param stream: A binary file-like object to read cypher text from
+    :param mode: 'ecb' or 'cbc'
+    :param iv: The Initialization vector for CBC
+    :param chunksize: The number of bytes to read at a time
+    :param blocksize: the block size in bytes
+    :param unpadder: The unpadder to use on the final block
+    :returns: A generator of plain text chunks
+    :rtype: Iterator
+
+    """
+    _check_mode(mode)
+    context = aes_context(key)
+    iv = iv if iv else b'\x00' * blocksize
+    pending = b''
+    while True:
+        chunk = stream.read(chunksize)
+        if not chunk:
+            break
+        pending += chunk
+        aligned = len(pending) - len(pending) % blocksize - blocksize
+        if aligned > 0:
+            pt, iv = _decrypt_blocks(context, pending[:aligned], mode, iv)
+            pending = pending[aligned:]
+            yield pt
+    pt, iv = _decrypt_blocks(context, pending, mode, iv)
+    yield unpadder(pt)
@@ -1,6 +1,8 @@
 """ A module for the needed url operations."""
 import logging
 
+from cryptopals.compat import PY2
+
 logging.basicConfig(level=logging.DEBUG)
 
 
@@ -18,12 +20,23 @@ def decode_query(query):
     }
 
 
+if PY2:
+    def _clean(value, remove):
+        return str(value).translate(None, remove)
+else:
+    def _clean(value, remove):
+        value = str(value)
+        for char in remove:
+            value = value.replace(char, '')
+        return value
+
+
 def encode_query(query, remove='&='):
     return '&'.join(
         '='.join(
             [
-                str(k).translate(None, remove),
-                str(v).translate(None, remove),
+                _clean(k, remove),
+                _clean(v, remove),
             ]
         )
         for k, v in query.items()
@@ -0,0 +1,348 @@
+""" Break XOR ciphers with byte histograms.
+
+A frequency score adds up a weight for every plain text byte. Under a
+single byte key k the plain text byte for cypher text byte c is c ^ k,
+so the score of key k is the sum over c of count(c) * weight(c ^ k).
+With a 256x256 table holding weight(c ^ k) in row k, one histogram of
+the cypher text and one matrix-vector product score all 256 keys at
+once, without decrypting anything.
+
+Every breaker takes a scorer, a name or a Scorer from
+cryptopals.scoring, 'unigram' letter frequencies by default.
+"""
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from cryptopals.crypto import (
+    as_uint8,
+    xor
+)
+from cryptopals.scoring import get_scorer
+
+
+def single_byte_scores(ct, scorer='unigram'):
+    """Score the plain text of every single byte XOR key
+
+    :param ct: The cypher text
+    :param scorer: A scorer name or Scorer
+    :returns: 256 scores indexed by key
+    :rtype: numpy.ndarray
+
+    """
+    return get_scorer(scorer).key_scores(ct)
+
+
+def best_single_byte_key(ct, top=1, scorer='unigram'):
+    """Rank the single byte XOR keys for a cypher text, all 256 of them
+    scored at once (with one matrix-vector product for linear scorers).
+
+    :param ct: The cypher text
+    :param top: The number of keys to return
+    :param scorer: A scorer name or Scorer
+    :returns: (key, score) tuples, best first
+    :rtype: list
+
+    """
+    scores = single_byte_scores(ct, scorer)
+    ranked = np.argsort(-scores, kind='mergesort')[:top]
+    return [(int(key), float(scores[key])) for key in ranked]
+
+
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def hamming_distance(string1, string2):
+    """Count the bits that differ between two equal length strings
+
+    :param string1: A bytes-like object
+    :param string2: A bytes-like object of the same length
+    :returns: The number of differing bits
+    :rtype: int
+
+    """
+    a = as_uint8(string1)
+    b = as_uint8(string2)
+    if len(a) != len(b):
+        raise ValueError('Strings differ in length')
+    return int(POPCOUNT[a ^ b].sum())
+
+
+def estimate_keysizes(ct, max_keysize=40, min_keysize=2, pairs=64):
+    """Rank repeating key XOR key sizes by the Hamming distance between
+    adjacent blocks of the cypher text, normalised to bits per byte. Only
+    the first pairs adjacent blocks are compared, so the cost does not
+    grow with the cypher text.
+
+    :param ct: The cypher text
+    :param max_keysize: The largest key size to try
+    :param min_keysize: The smallest key size to try
+    :param pairs: The most adjacent block pairs to average over
+    :returns: (key size, bits per byte) tuples, best (lowest) first
+    :rtype: list
+
+    """
+    data = as_uint8(ct)
+    results = []
+    for size in range(min_keysize, max_keysize + 1):
+        blocks = min(len(data) // size, pairs + 1)
+        if blocks < 2:
+            break
+        view = data[:blocks * size].reshape(blocks, size)
+        distance = POPCOUNT[view[1:] ^ view[:-1]].sum()
+        results.append((size, distance / float((blocks - 1) * size)))
+    return sorted(results, key=lambda result: result[1])
+
+
+def coincidences(ct, max_shift, method='auto'):
+    """Count, for every shift k up to max_shift, the positions where
+    ct[i] == ct[i + k].
+
+    The direct method makes one vectorised comparison per shift. The fft
+    method sums the power spectra of one indicator vector per distinct
+    byte value and inverts once, giving every shift at a cost that does
+    not depend on max_shift. 'auto' picks the cheaper of the two.
+
+    :param ct: The cypher text
+    :param max_shift: The largest shift
+    :param method: 'direct', 'fft' or 'auto'
+    :returns: max_shift + 1 counts indexed by shift, shift 0 being the
+        length
+    :rtype: numpy.ndarray
+
+    """
+    data = as_uint8(ct)
+    max_shift = min(max_shift, max(len(data) - 1, 0))
+    if method == 'auto':
+        size = 2 * len(data)
+        values = np.count_nonzero(np.bincount(data, minlength=256))
+        fft_cost = 3 * values * max(size, 1).bit_length()
+        method = 'fft' if fft_cost < max_shift else 'direct'
+    if method == 'direct':
+        counts = np.empty(max_shift + 1, dtype=np.int64)
+        counts[0] = len(data)
+        for k in range(1, max_shift + 1):
+            counts[k] = np.count_nonzero(data[:-k] == data[k:])
+        return counts
+    if method != 'fft':
+        raise ValueError('Unknown method %r' % method)
+    size = 1 << (2 * len(data)).bit_length()
+    power = np.zeros(size // 2 + 1)
+    for value in np.flatnonzero(np.bincount(data, minlength=256)):
+        spectrum = np.fft.rfft(data == value, size)
+        power += spectrum.real ** 2 + spectrum.imag ** 2
+    correlation = np.fft.irfft(power, size)[:max_shift + 1]
+    return np.rint(correlation).astype(np.int64)
+
+
+def coincidence_keysizes(ct, max_keysize=40, min_keysize=2,
+                         sample=1 << 24, method='auto'):
+    """Rank repeating key XOR key sizes by the index of coincidence.
+
+    Bytes a multiple of the key size apart were XORed with the same key
+    byte, so they are equal as often as the plain text's own bytes are,
+    far more often than bytes under different key bytes. Shifts up to
+    twice max_keysize are split into multiples of a key size and the
+    rest, and the key size scores the variance between the two groups'
+    coincidence rates. Only the true key size explains all of the high
+    rates, so it scores above its own multiples and divisors.
+
+    The rate settles long before hundreds of MB, so only the first
+    sample bytes are used.
+
+    :param ct: The cypher text
+    :param max_keysize: The largest key size to try
+    :param min_keysize: The smallest key size to try
+    :param sample: The most bytes to look at, None for all
+    :param method: 'direct', 'fft' or 'auto', see coincidences
+    :returns: (key size, score) tuples, best (highest) first
+    :rtype: list
+
+    """
+    data = as_uint8(ct)[:sample]
+    max_shift = min(2 * max_keysize, len(data) - 1)
+    if max_shift < min_keysize:
+        return []
+    counts = coincidences(data, max_shift, method)
+    shifts = np.arange(1, max_shift + 1)
+    rates = counts[1:] / (len(data) - shifts).astype(np.float64)
+    results = []
+    for size in range(min_keysize, min(max_keysize, max_shift) + 1):
+        multiple = shifts % size == 0
+        hits = np.count_nonzero(multiple)
+        misses = max_shift - hits
+        difference = rates[multiple].mean()
+        if misses:
+            difference -= rates[~multiple].mean()
+        weight = hits * misses / float(max_shift)
+        score = weight * difference * abs(difference)
+        results.append((size, float(score)))
+    return sorted(results, key=lambda result: -result[1])
+
+
+KEYSIZE_ENGINES = {
+    'hamming': (estimate_keysizes, False),
+    'coincidence': (coincidence_keysizes, True),
+}
+
+
+def rank_keysizes(ct, max_keysize=40, min_keysize=2,
+                  engines=('hamming', 'coincidence')):
+    """Rank repeating key XOR key sizes with one or more engines. Each
+    engine's scores are standardised, higher being better, and summed.
+    Engines with no results, as for a cypher text too short for them,
+    are left out.
+
+    :param ct: The cypher text
+    :param max_keysize: The largest key size to try
+    :param min_keysize: The smallest key size to try
+    :param engines: Names from KEYSIZE_ENGINES, or a single name
+    :returns: (key size, score) tuples, best (highest) first, or an
+        empty list if no engine has results
+    :rtype: list
+
+    """
+    if isinstance(engines, str):
+        engines = (engines,)
+    totals = {}
+    for name in engines:
+        if name not in KEYSIZE_ENGINES:
+            raise ValueError('Unknown key size engine %r' % name)
+        engine, higher_is_better = KEYSIZE_ENGINES[name]
+        results = engine(ct, max_keysize, min_keysize)
+        if not results:
+            continue
+        scores = np.array([score for size, score in results])
+        spread = scores.std() or 1.0
+        scores = (scores - scores.mean()) / spread
+        if not higher_is_better:
+            scores = -scores
+        for (size, _), score in zip(results, scores):
+            totals[size] = totals.get(size, 0.0) + float(score)
+    return sorted(totals.items(), key=lambda result: -result[1])
+
+
+def _fit_key(scorer, data, keysize, passes=2):
+    """The best key under a scorer, refined for contextual scorers"""
+    key = scorer.column_scores(data, keysize).argmax(axis=1)
+    if scorer.contextual:
+        for i in range(passes):
+            key = scorer.column_scores(data, keysize, key).argmax(axis=1)
+    return key.astype(np.uint8)
+
+
+def solve_columns(ct, keysize, scorer='unigram'):
+    """Find the repeating key of a given size. Column i holds every
+    byte XORed with key byte i; the columns are strided views of the
+    cypher text and the scorer ranks all 256 bytes for each at once
+    (one matrix product for linear scorers). Contextual scorers, whose
+    score for a column depends on its neighbours, refine the key
+    column by column.
+
+    :param ct: The cypher text
+    :param keysize: The key size
+    :param scorer: A scorer name or Scorer
+    :returns: The key and the score of the plain text it gives
+    :rtype: tuple
+
+    """
+    scorer = get_scorer(scorer)
+    key = _fit_key(scorer, as_uint8(ct), keysize).tobytes()
+    return key, scorer.score(xor(ct, key))
+
+
+def held_out_score(ct, keysize, scorer='unigram'):
+    """Score a key size on data its key was not fitted to. The cypher
+    text is cut into rows of keysize bytes, the key is fitted on the
+    even rows and scored on the odd rows, and the other way around. A
+    key size that is too long has too few bytes per column and picks
+    key bytes that fit the noise: its plain text score is inflated, its
+    held out score is not.
+
+    :param ct: The cypher text
+    :param keysize: The key size
+    :param scorer: A scorer name or Scorer
+    :returns: The held out plain text score
+    :rtype: float
+
+    """
+    scorer = get_scorer(scorer)
+    data = as_uint8(ct)
+    rows = data[:len(data) - len(data) % keysize].reshape(-1, keysize)
+    halves = rows[0::2].reshape(-1), rows[1::2].reshape(-1)
+    columns = np.arange(keysize)
+    total = 0.0
+    for fit, test in (halves, halves[::-1]):
+        if not len(fit) or not len(test):
+            continue
+        key = _fit_key(scorer, fit, keysize)
+        scores = scorer.column_scores(test, keysize, key)
+        total += float(scores[columns, key].sum())
+    return total
+
+
+def shortest_period(key):
+    """The shortest string that repeats to make key, so a key found for
+    a multiple of the true key size folds back to the true key.
+
+    :param key: The key
+    :returns: The shortest repeating unit of the key
+    :rtype: str
+
+    """
+    for size in range(1, len(key)):
+        if len(key) % size == 0 and key[:size] * (len(key) // size) == key:
+            return key[:size]
+    return key
+
+
+def break_repeating_xor(ct, candidates=3, max_keysize=40, min_keysize=2,
+                        engines=('hamming', 'coincidence'),
+                        scorer='unigram', workers=None):
+    """Break repeating key XOR. The best candidate key sizes from
+    rank_keysizes are solved with solve_columns, concurrently when
+    workers are given, keys that are repeats of a shorter key are
+    folded back and the keys are ranked by their held out plain text
+    score per byte, see held_out_score.
+
+    Starting a thread pool costs more than solving the key sizes of a
+    few MB, so by default they are solved in turn.
+
+    :param ct: The cypher text
+    :param candidates: The number of key sizes to try
+    :param max_keysize: The largest key size to try
+    :param min_keysize: The smallest key size to try
+    :param engines: The key size engines to rank with
+    :param scorer: A scorer name or Scorer
+    :param workers: The number of threads, None for none
+    :returns: (key, held out score per byte) tuples, best first
+    :rtype: list
+
+    """
+    sizes = [
+        size
+        for size, score in rank_keysizes(
+            ct, max_keysize, min_keysize, engines
+        )[:candidates]
+    ]
+    scorer = get_scorer(scorer)
+
+    def solve(size):
+        return solve_columns(ct, size, scorer)[0]
+
+    if workers and workers > 1 and len(sizes) > 1:
+        pool = ThreadPool(min(workers, len(sizes)))
+        try:
+            keys = pool.map(solve, sizes)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        keys = [solve(size) for size in sizes]
+    results = {}
+    for key in keys:
+        key = shortest_period(key)
+        if key not in results:
+            score = held_out_score(ct, len(key), scorer)
+            results[key] = score / len(ct)
+    return sorted(results.items(), key=lambda result: -result[1])
@@ -0,0 +1,172 @@
+""" Find single byte XOR encrypted lines in large inputs.
+
+    python -m cryptopals.xorscan blobs.txt --workers 4 --top 10
+
+Every line is decrypted with its best single byte key under a scorer
+from cryptopals.scoring, 'unigram' by default. A batch of lines is
+scored in one go: for the linear scorers the histograms of all its
+lines are built with a single bincount and multiplied by the permuted
+score table, giving the scores of all 256 keys for every line at once.
+
+Lines are ranked by score per byte so lines of different lengths
+compare fairly. Only the best lines of each batch leave the worker, and
+the overall best are kept in a heap bounded by the number requested.
+"""
+import argparse
+import heapq
+import sys
+import time
+
+import numpy as np
+
+from cryptopals.compat import BYTES
+from cryptopals.crypto import xor
+from cryptopals.lines import (
+    DECODE_ERRORS,
+    LineReader,
+    add_arguments,
+    batches,
+    decoder,
+    map_batches,
+    report
+)
+from cryptopals.scoring import (
+    SCORERS,
+    get_scorer
+)
+
+
+def best_keys(cts, scorer='unigram'):
+    """Find the best single byte XOR key of many cypher texts at once
+
+    :param cts: A list of cypher texts
+    :param scorer: A scorer name or Scorer
+    :returns: The best key and its score for each cypher text
+    :rtype: tuple
+
+    """
+    scores = get_scorer(scorer).batch_key_scores(cts)
+    keys = scores.argmax(axis=1)
+    return keys, scores[np.arange(len(cts)), keys]
+
+
+def _scan_batch(job):
+    """Score a batch of lines and keep the best of them"""
+    first, lines, encoding, top, scorer = job
+    decode = decoder(encoding)
+    numbers = []
+    cts = []
+    for number, line in enumerate(lines, first):
+        try:
+            ct = decode(line)
+        except DECODE_ERRORS:
+            continue
+        if ct:
+            numbers.append(number)
+            cts.append(ct)
+    if not cts:
+        return []
+    keys, scores = best_keys(cts, scorer)
+    best = heapq.nlargest(top, (
+        (score / len(ct), -number, key, ct)
+        for number, key, score, ct in zip(numbers, keys, scores, cts)
+    ))
+    return [
+        (float(score), number, int(key), xor(ct, BYTES[key]))
+        for score, number, key, ct in best
+    ]
+
+
+def scan(lines, top=10, encoding='hex', workers=None, batchsize=4096,
+         scorer='unigram'):
+    """Find the lines most likely to be single byte XOR encrypted text.
+    Lines that fail to decode are skipped.
+
+    :param lines: An iterable of encoded cypher texts, such as a file
+    :param top: The number of lines to return
+    :param encoding: 'hex', 'base64' or 'raw'
+    :param workers: The number of worker processes, None for none
+    :param batchsize: The number of lines sent to a worker at a time
+    :param scorer: A scorer name or Scorer. A Scorer is sent to the
+        workers with every batch, a name is compiled once in each
+    :returns: (line number, key, score per byte, plain text) tuples,
+        best first
+    :rtype: list
+
+    """
+    decoder(encoding)
+    get_scorer(scorer)
+    jobs = (
+        (first, batch, encoding, top, scorer)
+        for first, batch in batches(lines, batchsize)
+    )
+    heap = []
+    for results in map_batches(_scan_batch, jobs, workers):
+        for result in results:
+            if len(heap) < top:
+                heapq.heappush(heap, result)
+            else:
+                heapq.heappushpop(heap, result)
+    return [
+        (-number, key, score, plaintext)
+        for score, number, key, plaintext in sorted(heap, reverse=True)
+    ]
+
+
+def parser():
+    """Build the argument parser
+
+    :returns: The parser for the command line
+    :rtype: argparse.ArgumentParser
+
+    """
+    p = argparse.ArgumentParser(
+        prog='python -m cryptopals.xorscan',
+        description='Find lines encrypted with single byte XOR.'
+    )
+    add_arguments(p)
+    p.add_argument(
+        '--top',
+        type=int,
+        default=10,
+        help='The number of lines to report'
+    )
+    p.add_argument(
+        '--scorer',
+        choices=sorted(SCORERS),
+        default='unigram',
+        help='How to score plain texts, see cryptopals.scoring'
+    )
+    return p
+
+
+def main(argv=None):
+    """Run the command line. The best lines are printed as
+    "<line number> <key> <score per byte> <plain text>", best first, and
+    the throughput goes to stderr.
+
+    :param argv: The arguments, defaults to sys.argv
+    :returns: The exit status
+    :rtype: int
+
+    """
+    args = parser().parse_args(argv)
+    reader = LineReader(args.input)
+    start = time.time()
+    results = scan(
+        reader,
+        args.top,
+        args.encoding,
+        args.workers,
+        args.batchsize,
+        args.scorer
+    )
+    seconds = time.time() - start
+    for number, key, score, plaintext in results:
+        print('%i %02x %.3f %r' % (number, key, score, plaintext))
+    report(reader.count, seconds)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
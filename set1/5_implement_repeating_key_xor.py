@@ -1,4 +1,4 @@
-from itertools import izip_longest
+from cryptopals.crypto import xor
 """Implement repeating-key XOR
 
 Here is the opening stanza of an important work of the English language:
@@ -37,14 +37,6 @@ expect_result = (
 )
 
 
-def xor(c, k):
-    k = (k * -(-len(c) / len(k)))[:len(c)]
-    return ''.join(
-            chr(ord(a) ^ ord(b))
-            for (a, b) in zip(c, k)
-    )
-
-
 result = xor(message, key).encode('hex')
 
 
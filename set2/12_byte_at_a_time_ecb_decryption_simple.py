@@ -1,7 +1,8 @@
-import os
-
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptopals.challenges.s2_c12_byte_at_a_time_ecb_decryption import (
+    ByteAtATimeECB
+)
+from cryptopals.crypto import aes_ecb_encrypt
+from cryptopals.random import random_bytes
 import logging
 logging.basicConfig(level=logging.DEBUG)
 
@@ -76,43 +77,6 @@ YnkK"""
 
 TEXT = text.translate(None, '\n').decode('base64')
 
-BLOCKSIZE = 16
-
-
-def random_bytes(size):
-    return ''.join(
-        chr(c)
-        for c in bytearray(os.urandom(size))
-    )
-
-
-def random_int(start, end):
-    return ord(random_bytes(1)) % (end - start + 1) + start
-
-
-def pkcs7_pad(string, blocksize=BLOCKSIZE):
-    padding = blocksize - (len(string) % blocksize)
-    return string + (chr(padding) * padding)
-
-
-def slice_array(arr, size):
-    return [
-        arr[i:i + size]
-        for i in range(0, len(arr), size)
-    ]
-
-
-def aes_ecb_encrypt(key, pt, padder=pkcs7_pad):
-    cipher = Cipher(
-        algorithms.AES(key),
-        modes.ECB(),
-        backend=default_backend()
-    )
-    encryptor = cipher.encryptor()
-    random_bytes
-    return encryptor.update(padder(pt)) + encryptor.finalize()
-
-
 KEY = random_bytes(16)
 
 
@@ -121,67 +85,14 @@ def encryption_oracle(pt, key=KEY):
     return aes_ecb_encrypt(key, pt)
 
 
-def detect_block_size(cts):
-    cts = sorted(list(set(len(c) for c in cts)))
-    return list(
-        set(
-            cts[i] - cts[i-1]
-            for i in range(1, len(cts))
-        )
-    )[0]
-
-
-def detect_aes_ecb(ct):
-    slices = slice_array(ct, 16)
-    return bool([True for s in slices if slices.count(s) > 1])
-
-
-def oracle_result(string, secret_size):
-    return encryption_oracle(string)[:secret_size]
-
-
-def guess_last_byte(key, secret_size):
-    return {
-        oracle_result(
-            (key + chr(i)).rjust(secret_size, chr(0)),
-            secret_size
-        ):  chr(i)
-        for i in range(0, 255)
-    }
-
-
-results = [
-    encryption_oracle('A' * i)
-    for i in range(0, 200)
-]
-
-ecb = [
-    detect_aes_ecb(c)
-    for c in results
-]
-
-block_size = detect_block_size(results)
-is_ecb = ((ecb.count(True) + 0.0) / len(ecb) * 100)
-secret_size = block_size * -(-len(min(results)) / block_size)
-
-print '[+] Block size: %i' % block_size
-print '[+] ECB detected: %.02f%%' % is_ecb
-print '[+] Secret text size: %s' % secret_size
-
-recovered_text = ''
-
-for i in range(1, secret_size):
-
-    payload = ''.rjust(secret_size - i, chr(0))
-
-    oracle = oracle_result(payload, secret_size)
-
-    guesses = guess_last_byte(recovered_text, secret_size)
-
-    try:
-        recovered_text += guesses[oracle]
-    except KeyError:
-        recovered_text = recovered_text[:-1]
-        break
+attack = ByteAtATimeECB(encryption_oracle)
+result = attack.recover()
 
-print '[+] Secret text:\n%s' % recovered_text
+print '[+] Block size: %i' % attack.blocksize
+print '[+] ECB detected'
+print '[+] Secret text size: %s' % attack.secret_length
+print '[+] Oracle calls: %i (%.2f per byte)' % (
+    result['calls'],
+    result['calls_per_byte']
+)
+print '[+] Secret text:\n%s' % result['secret']
@@ -0,0 +1,99 @@
+"""An ECB/CBC detection oracle
+
+Write a function that encrypts data under an unknown key, appending
+5-10 random bytes before and after the plaintext, and choosing ECB or
+CBC at random. Detect the block cipher mode the function is using each
+time.
+"""
+import numpy as np
+
+from cryptopals.challenges.s2_c11_ecb_cbc_detection_oracle import (
+    chosen_plaintext,
+    classify,
+    classify_batch,
+    encryption_oracle,
+    main,
+    repeated_block,
+    run_trials
+)
+from cryptopals.crypto import (
+    aes_cbc_encrypt,
+    aes_ecb_encrypt
+)
+from cryptopals.random import (
+    RandomPool,
+    seed
+)
+
+KEY = b'YELLOW SUBMARINE'
+
+
+def test_chosen_plaintext_fills_two_blocks_after_any_prefix():
+    assert(1 == repeated_block(16))
+    assert(2 == repeated_block(8))
+    pt = chosen_plaintext()
+    assert(43 == len(pt))
+    for prefix in range(5, 11):
+        data = b'p' * prefix + pt
+        assert(data[16:32] == data[32:48] == b'\x00' * 16)
+
+
+def test_classify():
+    pt = b'x' * 7 + chosen_plaintext() + b'y' * 9
+    assert('ecb' == classify(aes_ecb_encrypt(KEY, pt)))
+    assert('cbc' == classify(aes_cbc_encrypt(KEY, pt, KEY)))
+    assert('ecb' == classify(bytearray(aes_ecb_encrypt(KEY, pt))))
+
+
+def test_classify_batch():
+    pt = b'x' * 5 + chosen_plaintext() + b'y' * 5
+    cts = np.array([
+        np.frombuffer(ct, dtype=np.uint8)
+        for ct in (aes_ecb_encrypt(KEY, pt), aes_cbc_encrypt(KEY, pt, KEY))
+    ])
+    assert([True, False] == list(classify_batch(cts)))
+
+
+def test_oracle_is_replayable():
+    pt = chosen_plaintext()
+    first = [encryption_oracle(pt, RandomPool(seed=11)) for i in range(2)]
+    assert(first[0] == first[1])
+    modes = set(
+        encryption_oracle(pt, RandomPool(seed=i))[0] for i in range(20)
+    )
+    assert(set(['ecb', 'cbc']) == modes)
+
+
+def test_run_trials():
+    result = run_trials(500, seed=3, shardsize=200)
+    assert(500 == result['trials'] == result['correct'])
+    assert(1.0 == result['accuracy'])
+    assert(result['ecb'] == result['ecb_guesses'])
+    assert(100 < result['ecb'] < 400)
+    assert(result['trials_per_second'] > 0)
+
+
+def test_run_trials_is_the_same_on_a_pool():
+    serial = run_trials(300, seed=4, shardsize=100)
+    pooled = run_trials(300, seed=4, workers=2, shardsize=100)
+    assert(serial['ecb'] == pooled['ecb'])
+    assert(300 == pooled['correct'])
+
+
+def test_run_trials_under_the_default_seed():
+    try:
+        seed(1)
+        runs = [
+            run_trials(40, workers=4, shardsize=5)['ecb'] for i in range(3)
+        ]
+    finally:
+        seed()
+    assert([run_trials(40, seed=1, shardsize=5)['ecb']] * 3 == runs)
+
+
+def test_main(capsys):
+    assert(0 == main(['--trials', '50', '--seed', '1']))
+    out, err = capsys.readouterr()
+    assert('Trials: 50' in out)
+    assert('Accuracy: 1.000000 (0 wrong)' in out)
+    assert('trials/s' in err)
@@ -0,0 +1,82 @@
+"""Byte-at-a-time ECB decryption (Simple)
+
+Copy your oracle function to a new function that encrypts buffers
+under ECB mode using a consistent but unknown key (for instance,
+assign a single random key, once, to a global variable).
+
+Now take that same function and have it append to the plaintext,
+BEFORE ENCRYPTING, the unknown string.
+
+It turns out: you can decrypt "unknown-string" with repeated calls to
+the oracle function!
+"""
+from pytest import raises
+
+from cryptopals.challenges.s2_c12_byte_at_a_time_ecb_decryption import (
+    SECRET,
+    ByteAtATimeECB,
+    ECBOracle,
+    challenge_12
+)
+from cryptopals.compat import BYTES
+from cryptopals.crypto import aes_cbc_encrypt
+
+
+def test_detect_block_size():
+    attack = ByteAtATimeECB(ECBOracle())
+
+    assert(16 == attack.detect_block_size())
+    assert(attack.calls <= 17)
+
+
+def test_detect_prefix():
+    for prefix in (b'', b'x', b'A' * 5, b'p' * 16, b'q' * 37):
+        attack = ByteAtATimeECB(ECBOracle(prefix=prefix))
+        assert(len(prefix) == attack.detect_prefix())
+        assert(len(SECRET) == attack.secret_length)
+        assert(attack.calls <= 3 * 16 + 2)
+
+
+def test_detect_prefix_rejects_cbc():
+    attack = ByteAtATimeECB(lambda pt: aes_cbc_encrypt(b'K' * 16, pt + b'x'))
+
+    with raises(ValueError):
+        attack.detect_prefix()
+
+
+def test_recover_secret_with_one_call_per_byte():
+    result = ByteAtATimeECB(ECBOracle(prefix=b'random prefix')).recover()
+
+    assert(SECRET == result['secret'])
+    assert(result['calls'] < len(SECRET) + 2 * 16 + 16)
+    assert(result['calls_per_byte'] < 1.5)
+
+
+def test_recover_secret_containing_every_byte():
+    secret = b''.join(BYTES)
+    result = ByteAtATimeECB(ECBOracle(secret=secret)).recover()
+
+    assert(secret == result['secret'])
+
+
+def test_recover_with_any_filler():
+    for filler in (b'B', b'@', b'\x00', b'\xff'):
+        oracle = ECBOracle(prefix=b'xy' + filler * 7)
+        attack = ByteAtATimeECB(oracle, filler=filler)
+        assert(filler != attack.spacer)
+        assert(SECRET == attack.recover()['secret'])
+        assert(9 == attack.prefix_length)
+
+
+def test_challenge_12():
+    assert(SECRET == challenge_12())
+
+
+def test_seeded_oracle_replays_call_counts():
+    results = [
+        ByteAtATimeECB(ECBOracle(prefix=b'xyz', seed=12)).recover()
+        for i in range(2)
+    ]
+    assert(results[0]['secret'] == results[1]['secret'])
+    assert(results[0]['calls'] == results[1]['calls'])
+    assert(ECBOracle(seed=12).key == ECBOracle(seed=12).key)
@@ -3,6 +3,7 @@ from cryptopals.challenges.c13_ecb_cut_and_paste import (
     encode_profile,
     ProfileCrypt
 )
+from cryptopals.compat import to_bytes
 from cryptopals.crypto import (
     aes_ecb_decrypt
 )
@@ -46,7 +47,7 @@ def test_ProfileCrypt_generates_random_keys():
 def test_ProfileCrypt_encypts_correctly():
     profile = profile_for('foo@bar.com')
     pc1 = ProfileCrypt(profile)
-    e = encode_profile(profile)
+    e = to_bytes(encode_profile(profile))
     r = aes_ecb_decrypt(
             pc1.key,
             pc1.encrypt()
@@ -69,4 +70,10 @@ def test_profile_encoding():
     profile = profile_for('foo@bar.com')
     e = 'role=user&email=foo@bar.com&uid=10'
     r = encode_query(profile)
-    assert(e == r)
+    # The pairs follow the dict's order, which differs between versions
+    assert(sorted(e.split('&')) == sorted(r.split('&')))
+
+
+def test_ProfileCrypt_seed_fixes_the_key():
+    assert(ProfileCrypt(seed=1).key == ProfileCrypt(seed=1).key)
+    assert(ProfileCrypt(seed=1).key != ProfileCrypt(seed=2).key)
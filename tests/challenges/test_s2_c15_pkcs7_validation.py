@@ -26,15 +26,15 @@ from cryptopals.crypto import pkcs7_unpad
 
 
 def test_pkcs7_unpad_works_for_valid_strigs():
-    valid_padding = ['ICE ICE BABY' + chr(4) * 4]
+    valid_padding = [b'ICE ICE BABY' + b'\x04' * 4]
     for s in valid_padding:
-        assert('ICE ICE BABY' == pkcs7_unpad(s))
+        assert(b'ICE ICE BABY' == pkcs7_unpad(s))
 
 
 def test_pkcs7_unpad_raises_ValueError_for_invalid_strigs():
     invalid_padding = [
-        'ICE ICE BABY' + chr(5) * 4,
-        'ICE ICE BABY' + chr(1) + chr(2) + chr(3) + chr(4)
+        b'ICE ICE BABY' + b'\x05' * 4,
+        b'ICE ICE BABY' + b'\x01\x02\x03\x04'
     ]
     for s in invalid_padding:
         try:
@@ -44,7 +44,13 @@ Before you implement this attack, answer this question: why does CBC
 mode have this property?
 
 """
+import base64
+
+from pytest import raises
+
 from cryptopals.challenges.s2_c16_cbc_bitflipping_attacks import (
+    BitFlippingCBC,
+    CookieOracle,
     clean_str,
     sandwich_userdata,
     encrypt_cookie,
@@ -54,6 +60,9 @@ from cryptopals.challenges.s2_c16_cbc_bitflipping_attacks import (
     flipbit,
     challenge_16
 )
+from cryptopals.crypto import aes_cbc_decrypt, aes_cbc_encrypt
+
+KEY = b'YELLOW SUBMARINE'
 
 
 def test_encrypt_userdata_sandwiches_userdata():
@@ -66,34 +75,34 @@ def test_encrypt_userdata_sandwiches_userdata():
 
     ";comment2=%20like%20a%20pound%20of%20bacon"
     """
-    userdata = 'foobarbaz'
-    expected = "comment1=cooking%20MCs;userdata=" +\
+    userdata = b'foobarbaz'
+    expected = b"comment1=cooking%20MCs;userdata=" +\
         userdata +\
-        ";comment2=%20like%20a%20pound%20of%20bacon"
+        b";comment2=%20like%20a%20pound%20of%20bacon"
 
     assert(expected == sandwich_userdata(userdata))
 
 
 def test_clean_str_removes_equals():
     """The function should quote out the ";" and "=" characters."""
-    data = '='
-    assert('' == clean_str(data, remove='='))
+    data = b'='
+    assert(b'' == clean_str(data, remove=b'='))
 
 
 def test_clean_str_removes_semi_colon():
     """The function should quote out the ";" and "=" characters."""
-    data = ';'
-    assert('' == clean_str(data, remove=';'))
+    data = b';'
+    assert(b'' == clean_str(data, remove=b';'))
 
 
 def test_can_encrypt_cookie():
     """The function should pad out the input to the 16-byte AES block
     length and encrypt it under the random AES key."""
     expected = (
-        'IIh8YdSwD6cJcPBngx/Xmf0aVEveR///QjGZEhlzuT4NJ5XmjeVNwb8Hlv/l2Gh'
-        '+1BiTH0e2v25f\nDyEo9IubRwv++CjsJzz94TWANVJdUlgFpW7Zl8GmSYkJH2DMNqpb\n'
+        b'IIh8YdSwD6cJcPBngx/Xmf0aVEveR///QjGZEhlzuT4NJ5XmjeVNwb8Hlv/l2Gh'
+        b'+1BiTH0e2v25fDyEo9IubRwv++CjsJzz94TWANVJdUlgFpW7Zl8GmSYkJH2DMNqpb'
     )
-    encrypted_cookie = encrypt_cookie('userdata1').encode('base64')
+    encrypted_cookie = base64.b64encode(encrypt_cookie(b'userdata1'))
     assert(encrypted_cookie == expected)
 
 
@@ -101,15 +110,15 @@ def test_can_decrypt_cookie():
     """Check that we can decrypt the cookies correctly and get the
     userdata back out."""
     encrypted_cookie = (
-        'IIh8YdSwD6cJcPBngx/Xmf0aVEveR///QjGZEhlzuT4NJ5XmjeVNwb8Hlv/l2Gh'
-        '+1BiTH0e2v25f\nDyEo9IubRwv++CjsJzz94TWANVJdUlgFpW7Zl8GmSYkJH2DMNqpb\n'
+        b'IIh8YdSwD6cJcPBngx/Xmf0aVEveR///QjGZEhlzuT4NJ5XmjeVNwb8Hlv/l2Gh'
+        b'+1BiTH0e2v25fDyEo9IubRwv++CjsJzz94TWANVJdUlgFpW7Zl8GmSYkJH2DMNqpb'
     )
     expected = (
-        'comment1=cooking%20MCs;'
-        'userdata=userdata1;'
-        'comment2=%20like%20a%20pound%20of%20bacon'
+        b'comment1=cooking%20MCs;'
+        b'userdata=userdata1;'
+        b'comment2=%20like%20a%20pound%20of%20bacon'
     )
-    decrypted_cookie = decrypt_cookie(encrypted_cookie.decode('base64'))
+    decrypted_cookie = decrypt_cookie(base64.b64decode(encrypted_cookie))
     assert(decrypted_cookie == expected)
 
 
@@ -117,9 +126,9 @@ def test_cookie_check_isadmin_true():
     """Check if the string ';admin=true; exitst in our cookie/ The user is
     an admin."""
     cookie = (
-        'comment1=cooking%20MCs;'
-        'admin=true;'
-        'comment2=%20like%20a%20pound%20of%20bacon'
+        b'comment1=cooking%20MCs;'
+        b'admin=true;'
+        b'comment2=%20like%20a%20pound%20of%20bacon'
     )
     result = check_is_admin(cookie)
     assert(result)
@@ -129,9 +138,9 @@ def test_cookie_check_isadmin_false():
     """Check if the string ';admin=true; exitst in our cookie/ The user is
     an admin."""
     cookie = (
-        'comment1=cooking%20MCs;'
-        'admin=no;'
-        'comment2=%20like%20a%20pound%20of%20bacon'
+        b'comment1=cooking%20MCs;'
+        b'admin=no;'
+        b'comment2=%20like%20a%20pound%20of%20bacon'
     )
     result = check_is_admin(cookie)
     assert(not result)
@@ -140,27 +149,27 @@ def test_cookie_check_isadmin_false():
 def test_bit_flipping_user_data_padding():
     """Check that the userdata is correct"""
     for n in range(0, 16):
-        assert(bit_fliping_userdata(n)[:n] == 'P' * n)
+        assert(bit_fliping_userdata(n)[:n] == b'P' * n)
 
 
 def test_bit_flipping_user_data_flipping_block():
     """Check that the flipping block is there """
-    assert(bit_fliping_userdata(0)[:16] == 'F' * 16)
+    assert(bit_fliping_userdata(0)[:16] == b'F' * 16)
 
 
 def test_bit_flipping_user_data_userdata_block():
     """Check that the admin block is there """
-    assert(bit_fliping_userdata(0)[16:] == ':admin<true')
+    assert(bit_fliping_userdata(0)[16:] == b':admin<true')
 
 
 def test_flipbit_with_a_single_charcter():
     """Check that we can flip the bits we want in a string"""
-    assert(flipbit(':', 0) == ';')
+    assert(flipbit(b':', 0) == b';')
 
 
 def test_flipbit_with_a_longstring():
     """Check that we can flip the bits we want in a string"""
-    assert(flipbit('A<B', 1) == 'A=B')
+    assert(flipbit(b'A<B', 1) == b'A=B')
 
 
 def test_fiptbit_with_our_userdata():
@@ -168,7 +177,7 @@ def test_fiptbit_with_our_userdata():
     userdata = bit_fliping_userdata(0)
     userdata = flipbit(userdata, 16)
     userdata = flipbit(userdata, 22)
-    expected = 'F' * 16 + ';admin=true'
+    expected = b'F' * 16 + b';admin=true'
     assert(userdata == expected)
 
 
@@ -178,3 +187,30 @@ def test_c16_can_bitflip_to_create_admin_cookie():
     block to create a valid admin token."""
     result = challenge_16()
     assert(check_is_admin(result))
+
+
+def test_bit_flipping_solver_finds_any_prefix():
+    """The prefix length is found for every alignment in a handful of
+    oracle calls, and any target up to a block is forged."""
+    for length in range(0, 40):
+        def oracle(userdata):
+            pt = b'p' * length + clean_str(userdata, b';=') + b';s=1'
+            return aes_cbc_encrypt(KEY, pt)
+        attack = BitFlippingCBC(oracle)
+        result = attack.forge(b';role=admin;')
+        assert(length == result['prefix_length'])
+        assert(7 == result['calls'])
+        pt = aes_cbc_decrypt(KEY, result['ct'])
+        assert(b';role=admin;;s=1' == pt[-16:])
+
+
+def test_bit_flipping_solver_against_the_cookie_oracle():
+    oracle = CookieOracle(seed=5)
+    attack = BitFlippingCBC(oracle.encrypt)
+    result = attack.forge()
+    assert(32 == result['prefix_length'])
+    assert(oracle.is_admin(result['ct']))
+    assert(not oracle.is_admin(oracle.encrypt(b';admin=true;')))
+    assert(0 <= result['oracle_seconds'] <= result['seconds'])
+    with raises(ValueError):
+        attack.forge(b'x' * 17)
@@ -62,8 +62,11 @@ that handles decryption. You can mount a padding oracle on any CBC
 block, whether it's padded or not.
 """
 from cryptopals.challenges.s3_c17_cbc_padding_oracle import (
+    PaddingOracleAttack,
+    candidate_order,
     s3_c17_cbc_padding_oracle
 )
+from cryptopals.compat import BYTES
 from pytest import fixture
 
 
@@ -87,22 +90,22 @@ def test_random_string(padding_oracle):
     The first function should select at random one of the following 10 strings:
     """
     strings = [
-        'MDAwMDAwTm93IHRoYXQgdGhlIHBhcnR5IGlzIGp1bXBpbmc=',
+        b'MDAwMDAwTm93IHRoYXQgdGhlIHBhcnR5IGlzIGp1bXBpbmc=',
         (
-            'MDAwMDAxV2l0aCB0aGUgYmFzcyBraWNrZWQgaW4gYW5k'
-            'IHRoZSBWZWdhJ3MgYXJlIHB1bXBpbic='
+            b'MDAwMDAxV2l0aCB0aGUgYmFzcyBraWNrZWQgaW4gYW5k'
+            b'IHRoZSBWZWdhJ3MgYXJlIHB1bXBpbic='
         ),
         (
-            'MDAwMDAyUXVpY2sgdG8gdGhlIHBvaW50LCB0byB0aGUgcG'
-            '9pbnQsIG5vIGZha2luZw=='
+            b'MDAwMDAyUXVpY2sgdG8gdGhlIHBvaW50LCB0byB0aGUgcG'
+            b'9pbnQsIG5vIGZha2luZw=='
         ),
-        'MDAwMDAzQ29va2luZyBNQydzIGxpa2UgYSBwb3VuZCBvZiBiYWNvbg==',
-        'MDAwMDA0QnVybmluZyAnZW0sIGlmIHlvdSBhaW4ndCBxdWljayBhbmQgbmltYmxl',
-        'MDAwMDA1SSBnbyBjcmF6eSB3aGVuIEkgaGVhciBhIGN5bWJhbA==',
-        'MDAwMDA2QW5kIGEgaGlnaCBoYXQgd2l0aCBhIHNvdXBlZCB1cCB0ZW1wbw==',
-        'MDAwMDA3SSdtIG9uIGEgcm9sbCwgaXQncyB0aW1lIHRvIGdvIHNvbG8=',
-        'MDAwMDA4b2xsaW4nIGluIG15IGZpdmUgcG9pbnQgb2g=',
-        'MDAwMDA5aXRoIG15IHJhZy10b3AgZG93biBzbyBteSBoYWlyIGNhbiBibG93'
+        b'MDAwMDAzQ29va2luZyBNQydzIGxpa2UgYSBwb3VuZCBvZiBiYWNvbg==',
+        b'MDAwMDA0QnVybmluZyAnZW0sIGlmIHlvdSBhaW4ndCBxdWljayBhbmQgbmltYmxl',
+        b'MDAwMDA1SSBnbyBjcmF6eSB3aGVuIEkgaGVhciBhIGN5bWJhbA==',
+        b'MDAwMDA2QW5kIGEgaGlnaCBoYXQgd2l0aCBhIHNvdXBlZCB1cCB0ZW1wbw==',
+        b'MDAwMDA3SSdtIG9uIGEgcm9sbCwgaXQncyB0aW1lIHRvIGdvIHNvbG8=',
+        b'MDAwMDA4b2xsaW4nIGluIG15IGZpdmUgcG9pbnQgb2g=',
+        b'MDAwMDA5aXRoIG15IHJhZy10b3AgZG93biBzbyBteSBoYWlyIGNhbiBibG93'
     ]
     random_string = padding_oracle.random_string()
     assert(random_string in strings)
@@ -136,15 +139,15 @@ def test_padding_oracle_can_cbc_encrypt_with_padding(padding_oracle):
     CBC-encrypt it under that key, providing the caller the ciphertext and
     IV.
     """
-    padding_oracle.key = 'YELLOW SUBMARINE'
-    padding_oracle.iv = 'ORANGE SUBMARINE'
-    padding_oracle._random_string = 'Cooking MCs like a poung of bacon'
+    padding_oracle.key = b'YELLOW SUBMARINE'
+    padding_oracle.iv = b'ORANGE SUBMARINE'
+    padding_oracle._random_string = b'Cooking MCs like a poung of bacon'
     expected = {
         'iv': padding_oracle.iv,
         'ct': (
-            "\x9d\x00\x9a'\x0cui\xa7\x9d\x99\x82m0b\xc4\xf0b[\xbc\xa0\xda"
-            "\x9c87^\x9c\x1a\xcb\xcbT\x9ec\xec|\xd1v\xb1b\xec\xec\x07,]\x82"
-            "\x92\x9a9\xec"
+            b"\x9d\x00\x9a'\x0cui\xa7\x9d\x99\x82m0b\xc4\xf0b[\xbc\xa0\xda"
+            b"\x9c87^\x9c\x1a\xcb\xcbT\x9ec\xec|\xd1v\xb1b\xec\xec\x07,]\x82"
+            b"\x92\x9a9\xec"
         )
     }
     result = padding_oracle.encrypt()
@@ -156,32 +159,40 @@ def test_padding_oracle_pkcs7_validator_true(padding_oracle):
     Check that the padding validator works for correct padding
     """
     for i in range(1, 16):
-        assert(padding_oracle.pkcs7_validator(chr(i) * i))
+        assert(padding_oracle.pkcs7_validator(BYTES[i] * i))
 
 
 def test_padding_oracle_pkcs7_validator_false(padding_oracle):
     """
     Check that the padding validator works for incorrect padding
     """
-    string = 'hello' + chr(10) * 5
+    string = b'hello' + b'\n' * 5
     assert(not padding_oracle.pkcs7_validator(string))
 
 
+def test_padding_oracle_pkcs7_validator_checks_padding_value(padding_oracle):
+    """
+    A run of equal bytes is only valid padding if it matches its value
+    """
+    assert(not padding_oracle.pkcs7_validator(b'\x00' * 16))
+    assert(not padding_oracle.pkcs7_validator(b'\x14' * 16))
+
+
 def test_padding_oracle_decrypts_and_validate_correct_padding(padding_oracle):
     """
     The second function should consume the ciphertext produced by the
     first function, decrypt it, check its padding, and return true or
     false depending on whether the padding is valid.
     """
-    padding_oracle.key = 'YELLOW SUBMARINE'
-    padding_oracle.iv = 'ORANGE SUBMARINE'
-    padding_oracle._random_string = 'Cooking MCs like a poung of bacon'
+    padding_oracle.key = b'YELLOW SUBMARINE'
+    padding_oracle.iv = b'ORANGE SUBMARINE'
+    padding_oracle._random_string = b'Cooking MCs like a poung of bacon'
     iv_ct = {
         'iv': padding_oracle.iv,
         'ct': (
-            "\x9d\x00\x9a'\x0cui\xa7\x9d\x99\x82m0b\xc4\xf0b[\xbc\xa0\xda"
-            "\x9c87^\x9c\x1a\xcb\xcbT\x9ec\xec|\xd1v\xb1b\xec\xec\x07,]\x82"
-            "\x92\x9a9\xec"
+            b"\x9d\x00\x9a'\x0cui\xa7\x9d\x99\x82m0b\xc4\xf0b[\xbc\xa0\xda"
+            b"\x9c87^\x9c\x1a\xcb\xcbT\x9ec\xec|\xd1v\xb1b\xec\xec\x07,]\x82"
+            b"\x92\x9a9\xec"
         )
     }
     result = padding_oracle.decrypt_and_validate_padding(
@@ -197,15 +208,15 @@ def test_padding_oracle_decrypts_and_validates_bad_padding(padding_oracle):
     first function, decrypt it, check its padding, and return true or
     false depending on whether the padding is valid.
     """
-    padding_oracle.key = 'YELLOW SUBMARINE'
-    padding_oracle.iv = 'ORANGE SUBMARINE'
-    padding_oracle._random_string = 'Cooking MCs like a poung of bacon'
+    padding_oracle.key = b'YELLOW SUBMARINE'
+    padding_oracle.iv = b'ORANGE SUBMARINE'
+    padding_oracle._random_string = b'Cooking MCs like a poung of bacon'
     iv_ct = {
         'iv': padding_oracle.iv,
         'ct': (
-            "\x9d\x00\x9a'\x0cui\xa7\x9d\x99\x82m0b\xc4\xf0b[\xbc\xa0\xda"
-            "\x9c87^\x9c\x1a\xcb\xcbT\x9ec\xec|\xd1v\xb1b\xec\xec\x07,]\x82"
-            "\x92\x9a9\xed"
+            b"\x9d\x00\x9a'\x0cui\xa7\x9d\x99\x82m0b\xc4\xf0b[\xbc\xa0\xda"
+            b"\x9c87^\x9c\x1a\xcb\xcbT\x9ec\xec|\xd1v\xb1b\xec\xec\x07,]\x82"
+            b"\x92\x9a9\xed"
         )
     }
     result = padding_oracle.decrypt_and_validate_padding(
@@ -217,19 +228,59 @@ def test_padding_oracle_decrypts_and_validates_bad_padding(padding_oracle):
 
 def test_cycle_byte(padding_oracle):
     """Test that we can cycle bytes in a string"""
-    string = padding_oracle.cycle_byte('aaa', 1)
+    string = padding_oracle.cycle_byte(b'aaa', 1)
     for i in range(0, 256):
         ct = next(string)
-        assert(ct[0] == 'a%sa' % chr(i))
+        assert(ct[0] == b'a' + BYTES[i] + b'a')
 
 
 def test_cycle_byte(padding_oracle):
     """Test that we can cycle bytes in a string and get the byte back"""
-    string = padding_oracle.cycle_byte('aaa', 1)
+    string = padding_oracle.cycle_byte(b'aaa', 1)
     for i in range(0, 256):
         ct = next(string)
         assert(ct[1] == i)
 
 
 def test_padding_attack(padding_oracle):
-    print(padding_oracle.padding_attack())
+    """Every byte of every block is recovered"""
+    assert(padding_oracle.padding_attack() == padding_oracle._random_string)
+
+
+def test_candidate_order_tries_padding_then_printable():
+    order = candidate_order(True)
+
+    assert(list(range(1, 17)) == order[:16])
+    assert(ord('0') == order[16])
+    assert(sorted(order) == list(range(256)))
+    assert(ord('0') == candidate_order(False)[0])
+
+
+def test_padding_oracle_attack_reports_per_block_stats(padding_oracle):
+    """Only one block is sent to the oracle per query and each block
+    reports its query count"""
+    sent = []
+
+    def oracle(iv, ct):
+        sent.append(len(ct))
+        return padding_oracle.decrypt_and_validate_padding(iv, ct)
+
+    encrypted = padding_oracle.encrypt()
+    result = PaddingOracleAttack(oracle, workers=2).decrypt(
+        encrypted['iv'],
+        encrypted['ct']
+    )
+
+    assert(result['plaintext'] == padding_oracle._random_string)
+    assert(len(result['blocks']) == len(encrypted['ct']) // 16)
+    assert(all(b['queries'] >= 16 for b in result['blocks']))
+    assert(result['queries'] == len(sent))
+    assert(set(sent) == set([16]))
+
+
+def test_seeded_oracles_replay():
+    first = s3_c17_cbc_padding_oracle(seed=17)
+    second = s3_c17_cbc_padding_oracle(seed=17)
+    assert((first.key, first.iv) == (second.key, second.iv))
+    assert(first._random_string == second._random_string)
+    assert(first.encrypt() == second.encrypt())
@@ -0,0 +1,148 @@
+import time
+
+from pytest import (
+    fixture,
+    raises
+)
+
+from cryptopals.challenges.s3_c17_cbc_padding_oracle import (
+    PaddingOracleAttack,
+    s3_c17_cbc_padding_oracle
+)
+from cryptopals.challenges.s3_c17_oracle_client import (
+    HTTPTransport,
+    LocalTransport,
+    OracleClient,
+    OracleServer
+)
+from cryptopals.compat import BYTES
+
+
+@fixture
+def padding_oracle():
+    return s3_c17_cbc_padding_oracle()
+
+
+@fixture
+def server(padding_oracle):
+    """A local padding oracle HTTP service"""
+    server = OracleServer(padding_oracle).start()
+    yield server
+    server.stop()
+
+
+def test_http_transport_reports_padding(padding_oracle, server):
+    encrypted = padding_oracle.encrypt()
+    transport = HTTPTransport(server.url)
+
+    assert(transport(encrypted['iv'], encrypted['ct']))
+    assert(not transport(encrypted['iv'], encrypted['ct'][:-1]))
+
+
+def test_first_valid_through_http_oracle(padding_oracle, server):
+    ct = padding_oracle.encrypt()['ct']
+    ivs = [BYTES[i] * 16 for i in range(8)] + [ct[-32:-16]]
+    with OracleClient(HTTPTransport(server.url), max_in_flight=4) as client:
+        index, queries = client.first_valid(ivs, ct[-16:])
+
+    assert(LocalTransport(padding_oracle)(ivs[index], ct[-16:]))
+    assert(queries == client.queries)
+
+
+def test_attack_through_concurrent_client(padding_oracle):
+    encrypted = padding_oracle.encrypt()
+    transport = LocalTransport(padding_oracle)
+    with OracleClient(transport, max_in_flight=8) as client:
+        result = PaddingOracleAttack(client, workers=2).decrypt(
+            encrypted['iv'],
+            encrypted['ct']
+        )
+
+    assert(result['plaintext'] == padding_oracle._random_string)
+    assert(result['queries'] == client.queries)
+    assert(client.queries == sum(c for _, c in client.histogram()))
+
+
+def test_first_valid_stops_sending_after_a_hit():
+    sent = []
+
+    def transport(iv, ct):
+        sent.append(iv)
+        return iv == 'yes'
+
+    with OracleClient(transport, max_in_flight=1) as client:
+        index, queries = client.first_valid(
+            ['no', 'yes'] + ['no'] * 50, 'ct'
+        )
+
+    assert(1 == index)
+    assert(2 == queries)
+    assert(['no', 'yes'] == sent)
+
+
+def test_client_retries_failed_requests():
+    calls = []
+
+    def transport(iv, ct):
+        calls.append(iv)
+        if len(calls) < 3:
+            raise IOError('connection reset')
+        return True
+
+    with OracleClient(transport, retries=2, backoff=0) as client:
+        assert(client('iv', 'ct'))
+        assert(2 == client.failures)
+
+        calls[:] = []
+        client.retries = 1
+        with raises(IOError):
+            client('iv', 'ct')
+
+
+def test_first_valid_returns_the_lowest_valid_index():
+    def transport(iv, ct):
+        # The better candidate answers last
+        if iv == 'first':
+            time.sleep(0.05)
+        return iv in ('first', 'second')
+
+    ivs = ['no', 'first', 'no', 'second'] + ['no'] * 20
+    with OracleClient(transport, max_in_flight=4) as client:
+        index, queries = client.first_valid(ivs, 'ct')
+
+    assert(1 == index)
+
+
+def test_first_valid_stops_sending_after_an_error():
+    sent = []
+
+    def transport(iv, ct):
+        sent.append(iv)
+        if iv == 0:
+            raise ValueError('rejected')
+        time.sleep(0.02)
+        return False
+
+    with OracleClient(transport, max_in_flight=8) as client:
+        with raises(ValueError):
+            client.first_valid(list(range(64)), 'ct')
+        after = len(sent)
+        time.sleep(0.1)
+        assert(after == len(sent))
+    assert(len(sent) < 64)
+
+
+def test_client_errors_are_not_retried(padding_oracle, server):
+    # The service answers 422 when the query has no iv or ct
+    transport = HTTPTransport(server.url + '?')
+    with OracleClient(transport, retries=3, backoff=10) as client:
+        with raises(ValueError):
+            client(b'\x00' * 16, b'\x00' * 16)
+        assert(0 == client.failures)
+
+
+def test_local_transport_wraps_oracle(padding_oracle):
+    encrypted = padding_oracle.encrypt()
+    transport = LocalTransport(padding_oracle)
+
+    assert(transport(encrypted['iv'], encrypted['ct']))
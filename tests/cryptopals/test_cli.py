@@ -0,0 +1,131 @@
+import base64
+import binascii
+
+from pytest import raises
+
+from cryptopals.cli import (
+    decrypt_file,
+    encrypt_file,
+    main
+)
+from cryptopals.crypto import (
+    aes_cbc_encrypt,
+    aes_ecb_encrypt
+)
+
+KEY = b'YELLOW SUBMARINE'
+IV = b'ORANGE SUBMARINE'
+PT = b'Cooking MCs like a pound of bacon. ' * 11
+
+
+def test_encrypt_file_matches_aes_cbc_encrypt(tmpdir):
+    src = tmpdir.join('pt')
+    src.write(PT, 'wb')
+    dst = tmpdir.join('ct')
+    written = encrypt_file(KEY, str(src), str(dst), 'cbc', IV, chunksize=48)
+
+    assert(aes_cbc_encrypt(KEY, PT, IV) == dst.read('rb'))
+    assert(written == len(dst.read('rb')))
+
+
+def test_encrypt_file_frames_cypher_text(tmpdir):
+    src = tmpdir.join('pt')
+    src.write(PT, 'wb')
+    ct = aes_ecb_encrypt(KEY, PT)
+    for framing, encode in (('hex', binascii.hexlify),
+                            ('base64', base64.b64encode)):
+        dst = tmpdir.join(framing)
+        encrypt_file(KEY, str(src), str(dst), framing=framing, chunksize=32)
+        assert(encode(ct) == dst.read('rb'))
+
+
+def test_decrypt_file_reads_framed_cypher_text(tmpdir):
+    src = tmpdir.join('ct')
+    encoded = base64.b64encode(aes_cbc_encrypt(KEY, PT, IV))
+    src.write(b'\n'.join(
+        encoded[i:i + 76] for i in range(0, len(encoded), 76)
+    ) + b'\n', 'wb')
+    dst = tmpdir.join('pt')
+    decrypt_file(KEY, str(src), str(dst), 'cbc', IV, 'base64', chunksize=16)
+
+    assert(PT == dst.read('rb'))
+
+
+def test_files_round_trip_in_place(tmpdir):
+    src = tmpdir.join('data')
+    src.write(PT, 'wb')
+    encrypt_file(KEY, str(src), mode='cbc', chunksize=64)
+    assert(aes_cbc_encrypt(KEY, PT) == src.read('rb'))
+
+    decrypt_file(KEY, str(src), mode='cbc', chunksize=64)
+    assert(PT == src.read('rb'))
+
+
+def test_failed_in_place_encryption_keeps_the_plain_text(tmpdir):
+    src = tmpdir.join('data')
+    src.write(PT, 'wb')
+    with raises(ValueError):
+        encrypt_file(KEY, str(src), mode='cbc', iv=b'short')
+    assert(PT == src.read('rb'))
+    assert([src] == tmpdir.listdir())
+
+
+def test_in_place_needs_raw_framing(tmpdir):
+    src = tmpdir.join('data')
+    src.write(PT, 'wb')
+    with raises(ValueError):
+        encrypt_file(KEY, str(src), framing='hex')
+
+
+def test_main_prints_throughput(tmpdir, capsys):
+    src = tmpdir.join('pt')
+    src.write(PT, 'wb')
+    dst = tmpdir.join('ct')
+    status = main([
+        'encrypt', str(src), '-o', str(dst),
+        '--key-hex', binascii.hexlify(KEY).decode()
+    ])
+
+    assert(0 == status)
+    assert('MB/s' in capsys.readouterr()[0])
+    assert(aes_ecb_encrypt(KEY, PT) == dst.read('rb'))
+
+
+def test_wrong_key_leaves_the_input_alone(tmpdir):
+    src = tmpdir.join('data')
+    ct = aes_cbc_encrypt(KEY, PT, IV)
+    src.write(ct, 'wb')
+    for mode in ('cbc', 'ecb'):
+        with raises(ValueError):
+            decrypt_file(IV, str(src), mode=mode, iv=IV)
+        assert(ct == src.read('rb'))
+
+
+def test_failed_output_is_removed(tmpdir):
+    src = tmpdir.join('ct')
+    src.write(aes_cbc_encrypt(KEY, PT, IV), 'wb')
+    dst = tmpdir.join('pt')
+    with raises(ValueError):
+        decrypt_file(IV, str(src), str(dst), 'cbc', IV)
+    assert(not dst.check())
+    src.write(b'not base64!', 'wb')
+    with raises(ValueError):
+        decrypt_file(KEY, str(src), str(dst), framing='base64')
+    assert(not dst.check())
+
+
+def test_unknown_modes_are_rejected(tmpdir):
+    src = tmpdir.join('pt')
+    src.write(PT, 'wb')
+    for crypt in (encrypt_file, decrypt_file):
+        with raises(ValueError):
+            crypt(KEY, str(src), str(tmpdir.join('out')), mode='ctr')
+    assert(PT == src.read('rb'))
+
+
+def test_main_reports_errors(tmpdir, capsys):
+    src = tmpdir.join('ct')
+    src.write(aes_ecb_encrypt(KEY, PT), 'wb')
+    with raises(SystemExit):
+        main(['decrypt', str(src), '--in-place', '--key', 'ORANGE SUBMARINE'])
+    assert('Invalid padding' in capsys.readouterr()[1])
@@ -1,21 +1,334 @@
+import binascii
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+import numpy as np
+from pytest import raises
+
+from cryptopals.compat import BYTES
 from cryptopals.crypto import (
+    AESContext,
+    AESContextCache,
+    Blocks,
+    aes_cbc_decrypt,
+    aes_cbc_decrypt_into,
+    aes_cbc_encrypt,
+    aes_cbc_encrypt_into,
+    aes_cbc_padding_valid,
+    aes_ecb_decrypt,
     aes_ecb_encrypt,
-    pkcs7_pad
+    pkcs7_final_block,
+    pkcs7_length,
+    pkcs7_pad,
+    pkcs7_unpad,
+    pkcs7_valid,
+    xor
 )
 
 
 def test_pkcs7_pad():
-    i = 'AAAAAAAA'
-    e = i + chr(8) * 8
+    i = b'AAAAAAAA'
+    e = i + BYTES[8] * 8
 
     assert(e == pkcs7_pad(i))
 
 
 def test_aes_ecb_encrypt():
-    e = '91befd7fe8e6d8a664a98309686d19b3'
+    e = b'91befd7fe8e6d8a664a98309686d19b3'
 
-    key = 'aaaaaaaaaaaaaaaa'
-    pt = 'texttexttext'
+    key = b'aaaaaaaaaaaaaaaa'
+    pt = b'texttexttext'
     r = aes_ecb_encrypt(key, pt)
 
-    assert(e == r.encode('hex'))
+    assert(e == binascii.hexlify(r))
+
+
+def test_xor_equal_length():
+    a = binascii.unhexlify(b'1c0111001f010100061a024b53535009181c')
+    b = binascii.unhexlify(b'686974207468652062756c6c277320657965')
+    e = b'746865206b696420646f6e277420706c6179'
+
+    assert(e == binascii.hexlify(xor(a, b)))
+
+
+def test_xor_repeats_short_key():
+    pt = (
+        b"Burning 'em, if you ain't quick and nimble\n"
+        b"I go crazy when I hear a cymbal"
+    )
+    e = (
+        b'0b3637272a2b2e63622c2e69692a23693a2a3c6324202d623d63343c2a2622632427'
+        b'2765272a282b2f20430a652e2c652a3124333a653e2b2027630c692b202831652863'
+        b'26302e27282f'
+    )
+
+    assert(e == binascii.hexlify(xor(pt, b'ICE')))
+
+
+def test_xor_truncates_long_key():
+    assert(b'\x00\x00' == xor(b'ab', b'abcd'))
+
+
+def test_xor_accepts_buffers():
+    r = xor(bytearray(b'abc'), memoryview(b'\x01'))
+
+    assert(b'`cb' == r)
+
+
+def test_xor_writes_into_out():
+    out = bytearray(4)
+    r = xor(b'abcd', b'\x01\x02', out=out)
+
+    assert(r is out)
+    assert(bytearray(b'``bf') == out)
+
+
+def test_xor_in_place():
+    data = bytearray(b'abcd')
+    xor(data, b'abcd', out=data)
+
+    assert(bytearray(4) == data)
+
+
+def test_xor_rejects_empty_key():
+    with raises(ValueError):
+        xor(b'abc', b'')
+
+
+def test_aes_cbc_encrypt_matches_reference_cbc():
+    key = b'YELLOW SUBMARINE'
+    iv = b'ORANGE SUBMARINE'
+    pt = b'Cooking MCs like a pound of bacon' * 7
+    encryptor = Cipher(
+        algorithms.AES(key),
+        modes.CBC(iv),
+        backend=default_backend()
+    ).encryptor()
+    e = encryptor.update(pkcs7_pad(pt)) + encryptor.finalize()
+
+    assert(e == aes_cbc_encrypt(key, pt, iv))
+
+
+def test_aes_cbc_decrypt_matches_reference_cbc():
+    key = b'YELLOW SUBMARINE'
+    iv = b'ORANGE SUBMARINE'
+    pt = b'Cooking MCs like a pound of bacon' * 7
+    encryptor = Cipher(
+        algorithms.AES(key),
+        modes.CBC(iv),
+        backend=default_backend()
+    ).encryptor()
+    ct = encryptor.update(pkcs7_pad(pt)) + encryptor.finalize()
+
+    assert(pt == aes_cbc_decrypt(key, ct, iv))
+
+
+def test_aes_cbc_round_trip_without_iv():
+    key = b'YELLOW SUBMARINE'
+    pt = bytearray(range(256))
+
+    assert(bytes(pt) == aes_cbc_decrypt(key, aes_cbc_encrypt(key, pt)))
+
+
+def test_aes_context_can_be_used_as_key():
+    key = b'aaaaaaaaaaaaaaaa'
+    context = AESContext(key)
+    ct = aes_ecb_encrypt(context, b'texttexttext')
+
+    assert(ct == aes_ecb_encrypt(key, b'texttexttext'))
+    assert(b'texttexttext' == aes_ecb_decrypt(context, ct))
+
+
+def test_aes_context_rejects_partial_blocks():
+    context = AESContext(b'aaaaaaaaaaaaaaaa')
+    with raises(ValueError):
+        context.encrypt(b'A' * 15)
+    assert(16 == len(context.encrypt(b'A' * 16)))
+
+
+def test_aes_context_cache_counts_hits_and_misses():
+    cache = AESContextCache()
+    first = cache.get(b'aaaaaaaaaaaaaaaa')
+    second = cache.get(bytearray(b'aaaaaaaaaaaaaaaa'))
+
+    assert(first is second)
+    assert(1 == cache.info()['hits'])
+    assert(1 == cache.info()['misses'])
+
+
+def test_aes_context_cache_evicts_least_recently_used():
+    cache = AESContextCache(maxsize=2)
+    a = cache.get(b'a' * 16)
+    cache.get(b'b' * 16)
+    cache.get(b'a' * 16)
+    cache.get(b'c' * 16)
+
+    assert(2 == cache.info()['size'])
+    assert(a is cache.get(b'a' * 16))
+    cache.get(b'b' * 16)
+    assert(4 == cache.info()['misses'])
+
+
+def test_pkcs7_valid():
+    assert(pkcs7_valid(b'ICE ICE BABY' + BYTES[4] * 4))
+    assert(pkcs7_valid(BYTES[16] * 16))
+    assert(pkcs7_valid(b'A' * 31 + BYTES[1]))
+
+
+def test_pkcs7_valid_compares_against_the_padding_value():
+    assert(not pkcs7_valid(b'ICE ICE BABY' + BYTES[5] * 4))
+    assert(not pkcs7_valid(BYTES[0] * 16))
+    assert(not pkcs7_valid(BYTES[17] * 16))
+    assert(not pkcs7_valid(BYTES[17] * 32))
+    assert(not pkcs7_valid(b''))
+
+
+def test_aes_cbc_padding_valid():
+    key = b'YELLOW SUBMARINE'
+    iv = b'ORANGE SUBMARINE'
+    for pt in (b'', b'A' * 15, b'A' * 16, b'A' * 40):
+        ct = aes_cbc_encrypt(key, pt, iv)
+        assert(aes_cbc_padding_valid(key, ct, iv))
+        assert(not aes_cbc_padding_valid(key, ct[:-1], iv))
+        bad = aes_cbc_encrypt(
+            key,
+            pt,
+            iv,
+            padder=lambda x: x + BYTES[0] * (16 - len(x) % 16)
+        )
+        assert(not aes_cbc_padding_valid(key, bad, iv))
+    assert(not aes_cbc_padding_valid(key, b'', iv))
+
+
+def test_pkcs7_final_block():
+    for length in (0, 1, 15, 16, 17, 40):
+        pt = b'A' * length
+        aligned, final = pkcs7_final_block(pt)
+        assert(0 == aligned % 16 and 16 == len(final))
+        assert(pkcs7_pad(pt) == pt[:aligned] + final)
+    pt = bytearray(b'A' * 16 + b'B')
+    assert((16, pkcs7_pad(b'B')) == pkcs7_final_block(pt))
+
+
+def test_pkcs7_length():
+    assert(12 == pkcs7_length(b'ICE ICE BABY' + BYTES[4] * 4))
+    assert(12 == pkcs7_length(memoryview(b'ICE ICE BABY' + BYTES[4] * 4)))
+    assert(0 == pkcs7_length(BYTES[16] * 16))
+    assert(b'ICE ICE BABY' == pkcs7_unpad(b'ICE ICE BABY' + BYTES[4] * 4))
+    with raises(ValueError):
+        pkcs7_length(b'ICE ICE BABY' + BYTES[5] * 4)
+
+
+def test_padded_modes_match_padding_then_encrypting():
+    key = b'YELLOW SUBMARINE'
+    iv = b'ORANGE SUBMARINE'
+    context = AESContext(key)
+    for length in (0, 1, 15, 16, 17, 100):
+        pt = bytearray(range(length))
+        padded = pkcs7_pad(bytes(pt))
+        e = context.encrypt(padded)
+        assert(e == aes_ecb_encrypt(key, pt))
+        assert(e == aes_ecb_encrypt(key, memoryview(pt)))
+        e = aes_cbc_encrypt(key, padded, iv, padder=lambda x: x)
+        assert(e == aes_cbc_encrypt(key, pt, iv))
+        assert(bytes(pt) == aes_cbc_decrypt(key, e, iv))
+
+
+def test_encrypt_and_decrypt_into_out():
+    key = b'YELLOW SUBMARINE'
+    iv = b'ORANGE SUBMARINE'
+    pt = b'Cooking MCs like a pound of bacon'
+    for encrypt, decrypt, args in (
+        (aes_ecb_encrypt, aes_ecb_decrypt, ()),
+        (aes_cbc_encrypt, aes_cbc_decrypt, (iv,)),
+    ):
+        ct = bytearray(48)
+        assert(ct is encrypt(key, pt, *args, out=ct))
+        assert(encrypt(key, pt, *args) == ct)
+        out = bytearray(48)
+        view = decrypt(key, bytes(ct), *args, out=out)
+        assert(isinstance(view, memoryview))
+        assert(pt == view.tobytes() == out[:len(pt)])
+        with raises(ValueError):
+            encrypt(key, pt, *args, out=bytearray(47))
+        with raises(ValueError):
+            decrypt(key, bytes(ct), *args, out=bytearray(47))
+
+
+def test_decrypt_rejects_bad_cypher_text():
+    key = b'YELLOW SUBMARINE'
+    ct = aes_ecb_encrypt(key, b'A' * 20)
+    for decrypt in (aes_ecb_decrypt, aes_cbc_decrypt):
+        with raises(ValueError):
+            decrypt(key, ct[:-1])
+    with raises(ValueError):
+        aes_ecb_decrypt(key, b'')
+    with raises(ValueError):
+        aes_ecb_decrypt(key, ct[:16])
+
+
+def test_blocks_index_and_iterate_without_copying():
+    data = bytearray(b'abcdefghijklmnopq')
+    blocks = Blocks(data, 4)
+    assert(4 == len(blocks))
+    assert(b'efgh' == blocks[1].tobytes())
+    assert(b'mnop' == blocks[-1].tobytes())
+    split = [block.tobytes() for block in blocks]
+    assert([b'abcd', b'efgh', b'ijkl', b'mnop'] == split)
+    assert((4, 4) == blocks.array.shape)
+    data[4] = ord('E')
+    assert(b'Efgh' == blocks[1].tobytes())
+    assert(b'E' == blocks.array[1, :1].tobytes())
+    with raises(IndexError):
+        blocks[4]
+
+
+def test_blocks_slices():
+    blocks = Blocks(b'abcdefghijklmnop', 4)
+    assert(b'efghijkl' == blocks[1:3].tobytes())
+    assert(b'mnop' == blocks[-1:].tobytes())
+    assert(0 == len(blocks[3:1]))
+    assert(isinstance(blocks[1:], Blocks))
+    with raises(ValueError):
+        blocks[::2]
+
+
+def test_blocks_equality_and_hashing():
+    a = Blocks(b'abcdabcd', 4)
+    assert(a[0:1] == a[1:2])
+    assert(a[0:1] != Blocks(b'abcd', 2))
+    assert(a != Blocks(b'abcdabce', 4))
+    assert(hash(a[0:1]) == hash(a[1:2]))
+    assert(1 == len(set([a[0:1], a[1:2], Blocks(b'abcd', 4)])))
+
+
+def test_blocks_change_in_place():
+    data = bytearray(b'aaaabbbbcccc')
+    blocks = Blocks(data, 4)
+    blocks[0] = b'AAAA'
+    blocks.swap(0, -1)
+    assert(b'ccccbbbbAAAA' == bytes(data))
+    blocks.xor(1, b'\x20' * 4)
+    assert(b'ccccBBBBAAAA' == bytes(data))
+    with raises(ValueError):
+        blocks[0] = b'abc'
+
+
+def test_blocks_repeats():
+    assert(0 == Blocks(b'').repeats())
+    assert(2 == Blocks(b'abcdabcdefghabcd', 4).repeats())
+    blocks = np.arange(100, dtype=np.uint8).repeat(16)
+    data = np.concatenate([blocks, blocks[:16 * 30]])
+    assert(100 > Blocks._SET_BLOCKS)
+    assert(30 == Blocks(data).repeats())
+    assert(30 == Blocks(data.tobytes()).repeats())
+
+
+def test_aes_cbc_rejects_unaligned_input():
+    key = b'YELLOW SUBMARINE'
+    with raises(ValueError):
+        aes_cbc_encrypt(key, b'x' * 20, padder=lambda x: x)
+    with raises(ValueError):
+        aes_cbc_encrypt_into(key, b'x' * 20, bytearray(20))
+    with raises(ValueError):
+        aes_cbc_decrypt_into(key, b'x' * 20, bytearray(20))
@@ -0,0 +1,102 @@
+import base64
+import binascii
+import io
+import sys
+
+from pytest import raises
+
+from cryptopals.crypto import (
+    aes_cbc_encrypt,
+    aes_ecb_encrypt
+)
+from cryptopals.detect import (
+    detect_ecb,
+    ecb_score,
+    main,
+    rank,
+    scan
+)
+
+KEY = b'YELLOW SUBMARINE'
+PT = b'A' * 64 + b'Cooking MCs like a pound of bacon'
+
+
+def lines(count=20, ecb=(3, 17)):
+    return [
+        binascii.hexlify(
+            aes_ecb_encrypt(KEY, PT * (i % 3 + 1)) if i in ecb
+            else aes_cbc_encrypt(KEY, PT + b'%i' % i)
+        ) + b'\n'
+        for i in range(count)
+    ]
+
+
+def test_ecb_score():
+    assert(0 == ecb_score(b''))
+    assert(0 == ecb_score(b'abcdefgh', 4))
+    assert(2 == ecb_score(b'abcdabcdefghabcd', 4))
+    assert(1 == ecb_score(b'abcdabcdab', 4))
+    assert(3 == ecb_score(aes_ecb_encrypt(KEY, PT)))
+    assert(0 == ecb_score(aes_cbc_encrypt(KEY, PT)))
+
+
+def test_detect_ecb_threshold():
+    ct = aes_ecb_encrypt(KEY, PT)
+    assert(detect_ecb(ct))
+    assert(detect_ecb(ct, threshold=3))
+    assert(not detect_ecb(ct, threshold=4))
+    assert(not detect_ecb(aes_cbc_encrypt(KEY, PT)))
+
+
+def test_scan_finds_ecb_lines():
+    results = list(scan(lines(), batchsize=3))
+    assert([(4, 3), (18, 9)] == results)
+
+
+def test_scan_encodings():
+    data = [aes_ecb_encrypt(KEY, PT), aes_cbc_encrypt(KEY, PT)]
+    assert([(1, 3)] == list(scan(
+        [base64.b64encode(ct) + b'\n' for ct in data],
+        encoding='base64'
+    )))
+    assert([(1, 3)] == list(scan(
+        [ct.replace(b'\n', b'') + b'\n' for ct in data],
+        encoding='raw'
+    )))
+    with raises(ValueError):
+        list(scan([], encoding='rot13'))
+
+
+def test_scan_skips_undecodable_lines():
+    data = [b'not hex\n', b'abc\n'] + lines(4, ecb=(2,))
+    assert([(5, 9)] == list(scan(data)))
+
+
+def test_scan_with_workers_matches_serial():
+    data = lines(50, ecb=(0, 9, 10, 33, 49))
+    serial = list(scan(data, threshold=2, batchsize=4))
+    assert(serial == list(scan(data, threshold=2, workers=2, batchsize=4)))
+    assert(5 == len(serial))
+
+
+def test_rank():
+    scores = [(1, 2), (2, 7), (3, 2), (4, 9)]
+    assert([(4, 9), (2, 7), (1, 2), (3, 2)] == rank(scores))
+    assert([(4, 9), (2, 7)] == rank(iter(scores), top=2))
+
+
+def test_main(tmpdir, capsys):
+    src = tmpdir.join('ct')
+    src.write(b''.join(lines()), 'wb')
+    assert(0 == main([str(src), '--top', '1']))
+    out, err = capsys.readouterr()
+    assert('18 9\n' == out)
+    assert(err.startswith('Scanned 20 lines'))
+
+
+def test_main_reads_stdin(monkeypatch, capsys):
+    stdin = io.TextIOWrapper(io.BytesIO(b''.join(lines())))
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    assert(0 == main(['--workers', '2', '--batchsize', '5']))
+    out, err = capsys.readouterr()
+    assert('18 9\n4 3\n' == out)
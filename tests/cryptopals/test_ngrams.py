@@ -0,0 +1,127 @@
+import os
+
+import numpy as np
+from pytest import raises
+
+from cryptopals.compat import BYTES
+from cryptopals.crypto import xor
+from cryptopals.ngrams import (
+    DEFAULT_PATH,
+    NgramModel,
+    NgramScorer,
+    build_tables,
+    byte_classes,
+    load_model,
+    main,
+    save_tables
+)
+from cryptopals.scoring import get_scorer
+from cryptopals.xorbreak import (
+    best_single_byte_key,
+    solve_columns
+)
+
+PT = b"Cooking MC's like a pound of bacon"
+
+
+def test_byte_classes():
+    classes = byte_classes()
+    assert(classes[ord('a')] == classes[ord('A')] == 0)
+    assert(classes[ord('z')] == 25)
+    assert(classes[ord('.')] != classes[ord('(')])
+    assert(classes[0] == classes[0xff] == 31)
+
+
+def test_build_tables_are_distributions():
+    classes, emission, tables = build_tables(PT * 10, order=3)
+    assert(3 == len(tables))
+    for k, table in enumerate(tables, 1):
+        assert(32 ** k == len(table))
+        sums = np.exp(table).reshape(-1, 32).sum(axis=1)
+        assert(np.allclose(1, sums))
+    sums = np.bincount(classes, weights=np.exp(emission))
+    assert(np.allclose(1, sums))
+
+
+def test_save_and_load(tmpdir):
+    path = str(tmpdir.join('test.ngrams'))
+    classes, emission, tables = build_tables(PT * 10, order=2)
+    save_tables(path, classes, emission, tables)
+    model = NgramModel(path)
+    assert(2 == model.order)
+    assert(32 == model.count)
+    assert((classes == model.classes).all())
+    assert(np.allclose(emission, model.emission))
+    assert(np.allclose(tables[1], model.tables[2]))
+    assert(load_model(path) is load_model(path))
+    with raises(ValueError):
+        NgramScorer(3, path)
+
+
+def test_load_rejects_bad_files(tmpdir):
+    path = tmpdir.join('bad.ngrams')
+    path.write(b'NGRX' + b'\x00' * 100, 'wb')
+    with raises(ValueError):
+        NgramModel(str(path))
+    path.write(open(DEFAULT_PATH, 'rb').read()[:-4], 'wb')
+    with raises(ValueError):
+        NgramModel(str(path))
+
+
+def test_shipped_model():
+    model = load_model()
+    assert(3 == model.order)
+    for name in ('ngram2', 'ngram3'):
+        scorer = get_scorer(name)
+        english = scorer.score(b'the cat sat on the mat')
+        assert(english > scorer.score(b'xqz jkv wvf vqx zzq'))
+        assert(88 == best_single_byte_key(xor(PT, b'X'), 1, name)[0][0])
+
+
+def test_score_short_texts():
+    scorer = get_scorer('ngram3')
+    assert(0.0 == scorer.score(b''))
+    assert(scorer.score(b'a') > scorer.score(b'\x00'))
+    assert(scorer.score(b'ab') < 0)
+
+
+def test_key_scores_match_decrypt_and_score():
+    for name in ('ngram2', 'ngram3'):
+        scorer = get_scorer(name)
+        for ct in (os.urandom(200), os.urandom(2), b''):
+            expected = [scorer.score(xor(ct, BYTES[k])) for k in range(256)]
+            assert(np.allclose(expected, scorer.key_scores(ct)))
+
+
+def test_column_scores_use_neighbouring_key_bytes():
+    scorer = get_scorer('ngram3')
+    for key in (b'\x07\x63', b'\x07\x63\xfa\x03'):
+        key = np.frombuffer(key, dtype=np.uint8)
+        ct = xor(PT, key.tobytes())
+        scores = scorer.column_scores(ct, len(key), key)
+        for column in range(len(key)):
+            rest = []
+            for k in (0, 1, 99, 255):
+                guess = key.copy()
+                guess[column] = k
+                plain = xor(ct, guess.tobytes())
+                rest.append(scorer.score(plain) - scores[column, k])
+            # The terms away from the column are the same for every k
+            assert(np.ptp(rest) < 1e-6)
+    assert((4, 256) == scorer.column_scores(ct, 4).shape)
+
+
+def test_solve_columns():
+    key = b'Terminator X: Bring the noise'
+    ct = xor(PT * 20, key)
+    assert(key == solve_columns(ct, len(key), 'ngram3')[0])
+
+
+def test_main(tmpdir, capsys):
+    corpus = tmpdir.join('corpus.txt')
+    corpus.write(PT * 10)
+    path = str(tmpdir.join('out.ngrams'))
+    assert(0 == main([str(corpus), '-o', path, '--order', '2']))
+    out, err = capsys.readouterr()
+    assert(err.startswith('Wrote %s' % path))
+    assert(2 == NgramModel(path).order)
@@ -0,0 +1,75 @@
+import multiprocessing
+
+from pytest import (
+    mark,
+    raises
+)
+
+from cryptopals.crypto import (
+    aes_cbc_decrypt,
+    aes_cbc_encrypt,
+    aes_ecb_decrypt,
+    aes_ecb_encrypt
+)
+from cryptopals.parallel import (
+    parallel_crypt,
+    split_blocks
+)
+
+KEY = b'YELLOW SUBMARINE'
+IV = b'ORANGE SUBMARINE'
+PT = bytes(bytearray(i % 251 for i in range(4099)))
+
+
+def test_split_blocks_covers_input_in_order():
+    ranges = split_blocks(16 * 10, 3)
+
+    assert([(0, 64), (64, 128), (128, 160)] == ranges)
+
+
+def test_parallel_ecb_encrypt_matches_single_process():
+    ct = aes_ecb_encrypt(KEY, PT)
+
+    assert(ct == aes_ecb_encrypt(KEY, PT, workers=1))
+    data = PT[:4096]
+    e = aes_ecb_encrypt(KEY, data, padder=lambda x: x)
+    assert(e == parallel_crypt('ecb_encrypt', KEY, data, 3, threshold=0))
+
+
+def test_parallel_ecb_decrypt_matches_single_process():
+    ct = aes_ecb_encrypt(KEY, PT)
+    r = parallel_crypt('ecb_decrypt', KEY, ct, 3, threshold=0)
+
+    assert(aes_ecb_decrypt(KEY, ct, unpadder=lambda x: x) == r)
+    assert(PT == aes_ecb_decrypt(KEY, ct, workers=3))
+
+
+def test_parallel_cbc_decrypt_matches_single_process():
+    ct = aes_cbc_encrypt(KEY, PT, IV)
+    r = parallel_crypt('cbc_decrypt', KEY, ct, 4, IV, threshold=0)
+
+    assert(aes_cbc_decrypt(KEY, ct, IV, unpadder=lambda x: x) == r)
+    assert(PT == aes_cbc_decrypt(KEY, ct, IV, workers=4))
+
+
+@mark.skipif(
+    not hasattr(multiprocessing, 'get_start_method'),
+    reason='Only fork is available'
+)
+def test_parallel_crypt_with_spawned_workers():
+    method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method('spawn', force=True)
+    try:
+        ct = aes_cbc_encrypt(KEY, PT, IV)
+        r = parallel_crypt('cbc_decrypt', KEY, ct, 2, IV, threshold=0)
+    finally:
+        multiprocessing.set_start_method(method, force=True)
+    assert(aes_cbc_decrypt(KEY, ct, IV, unpadder=lambda x: x) == r)
+
+
+def test_parallel_rejects_empty_and_unaligned_cypher_text():
+    for ct in (b'', b'x' * 20):
+        with raises(ValueError):
+            aes_cbc_decrypt(KEY, ct, workers=4)
+        with raises(ValueError):
+            parallel_crypt('cbc_decrypt', KEY, ct, 2, threshold=0)
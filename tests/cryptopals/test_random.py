@@ -1,6 +1,14 @@
+import os
+import threading
+
+from pytest import raises
+
 from cryptopals.random import (
+    RandomPool,
+    get_pool,
     random_bytes,
-    random_int
+    random_int,
+    seed
 )
 
 
@@ -15,3 +23,148 @@ def test_random_bytes_size():
 
 def test_random_int():
     assert(type(random_int(1, 2)) == int)
+
+
+def test_pool_refills_in_large_reads():
+    pool = RandomPool(size=64)
+    chunks = [pool.bytes(16) for i in range(8)]
+    assert(2 == pool.refills)
+    assert(len(set(chunks)) == 8)
+    assert(100 == len(pool.bytes(100)))
+    assert(3 == pool.refills)
+
+
+def test_pool_view():
+    pool = RandomPool(size=64, seed=1)
+    view = pool.view(16)
+    assert(isinstance(view, memoryview))
+    assert(RandomPool(size=64, seed=1).bytes(16) == view.tobytes())
+    for i in range(10):
+        pool.bytes(16)
+    # Refills do not change bytes already handed out
+    assert(RandomPool(size=64, seed=1).bytes(16) == view.tobytes())
+
+
+def test_seeded_pool_is_deterministic():
+    first = RandomPool(seed=7)
+    second = RandomPool(size=16, seed=7)
+    assert(first.bytes(100) == second.bytes(100))
+    assert(RandomPool(seed=b'7').bytes(8) == RandomPool(seed=7).bytes(8))
+    assert(RandomPool(seed=8).bytes(8) != RandomPool(seed=7).bytes(8))
+    ints = [first.random_int(0, 9) for i in range(20)]
+    assert(ints == [second.random_int(0, 9) for i in range(20)])
+
+
+def test_random_int_range_and_rejection():
+    pool = RandomPool(seed=0)
+    counts = [0] * 3
+    for i in range(3000):
+        counts[pool.random_int(0, 2)] += 1
+    assert(min(counts) > 900)
+    assert(set(pool.random_int(5, 5) for i in range(10)) == set([5]))
+    assert(0 <= pool.random_int(0, 1 << 70) <= 1 << 70)
+    with raises(ValueError):
+        pool.random_int(2, 1)
+
+
+def test_random_int_rejects_biased_draws():
+    # 256 is not a multiple of 255, so the byte 255 must be redrawn
+    pool = RandomPool(seed=0)
+    pool._read = lambda size: b'\xff\x07' * (size // 2)
+    assert(7 == pool.random_int(0, 254))
+
+
+def test_threads_never_share_bytes():
+    # Each thread refills its own buffer 5 times
+    pool = RandomPool(size=160)
+    taken = []
+
+    def take():
+        chunks = [pool.bytes(16) for i in range(50)]
+        taken.extend(chunks)
+
+    threads = [threading.Thread(target=take) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert(200 == len(set(taken)))
+    assert(20 == pool.refills)
+
+
+def test_seeded_pool_belongs_to_one_thread():
+    pool = RandomPool(size=160, seed=3)
+    errors = []
+
+    def take():
+        try:
+            pool.bytes(16)
+        except RuntimeError as e:
+            errors.append(e)
+
+    first = pool.bytes(16)
+    threads = [threading.Thread(target=take) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert(2 == len(errors))
+    expected = RandomPool(seed=3).bytes(16 * 200)
+    taken = first + b''.join(pool.bytes(16) for i in range(199))
+    assert(expected == taken)
+
+
+def test_forked_child_refills():
+    pool = RandomPool(size=1024)
+    pool.bytes(1)
+    read, write = os.pipe()
+    pid = os.fork()
+    if not pid:
+        os.write(write, pool.bytes(16))
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child = os.read(read, 16)
+    os.close(read)
+    os.close(write)
+    assert(pool.bytes(16) != child)
+    assert(1 == pool.refills)
+
+
+def test_forked_child_refuses_a_seeded_pool():
+    pool = RandomPool(size=64, seed=6)
+    first = pool.bytes(1)
+    read, write = os.pipe()
+    pid = os.fork()
+    if not pid:
+        try:
+            pool.bytes(1)
+            os.write(write, b'took')
+        except RuntimeError:
+            os.write(write, b'refused')
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child = os.read(read, 16)
+    os.close(read)
+    os.close(write)
+    assert(b'refused' == child)
+    assert(RandomPool(seed=6).bytes(17) == first + pool.bytes(16))
+
+
+def test_seed_replays_the_default_pool():
+    try:
+        seed(5)
+        first = [random_bytes(16), random_int(0, 1000)]
+        seed(5)
+        assert(first == [random_bytes(16), random_int(0, 1000)])
+        assert(first[0] == RandomPool(seed=5).bytes(16))
+    finally:
+        seed()
+    assert(get_pool().seed is None)
+
+
+def test_get_pool():
+    assert(get_pool() is get_pool(None))
+    pool = RandomPool()
+    assert(pool is get_pool(pool))
+    assert(get_pool(3).bytes(32) == RandomPool(seed=3).bytes(32))
+    assert(get_pool(3) is not get_pool(3))
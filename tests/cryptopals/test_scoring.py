@@ -0,0 +1,129 @@
+import os
+
+import numpy as np
+from pytest import raises
+
+from cryptopals.compat import BYTES
+from cryptopals.crypto import xor
+from cryptopals.scoring import (
+    SCORERS,
+    BigramScorer,
+    LinearScorer,
+    Scorer,
+    byte_histogram,
+    frequency_weights,
+    get_scorer,
+    register_scorer
+)
+
+PT = b"Cooking MC's like a pound of bacon"
+
+
+def test_byte_histogram():
+    counts = byte_histogram(b'abca\xff')
+    assert(256 == len(counts))
+    assert(2 == counts[ord('a')])
+    assert(1 == counts[0xff])
+    assert(5 == counts.sum())
+
+
+def test_frequency_weights_fold_case():
+    weights = frequency_weights({'e': 2.0}, default=-1)
+    assert(2.0 == weights[ord('e')] == weights[ord('E')])
+    assert(-1 == weights[ord('x')])
+
+
+def test_get_scorer():
+    assert(get_scorer() is get_scorer('unigram'))
+    scorer = LinearScorer('q', frequency_weights({'q': 1.0}))
+    assert(scorer is get_scorer(scorer))
+    with raises(ValueError):
+        get_scorer('trigram')
+
+
+def test_register_scorer():
+    scorer = LinearScorer('q', frequency_weights({'q': 1.0}))
+    register_scorer('test-q', lambda: scorer)
+    try:
+        assert(scorer is get_scorer('test-q'))
+        assert(3.0 == get_scorer('test-q').score(b'qQqa'))
+    finally:
+        SCORERS.pop('test-q')
+
+
+def test_scores():
+    for name in SCORERS:
+        scorer = get_scorer(name)
+        assert(isinstance(scorer, Scorer))
+        assert(name == scorer.name)
+        assert(scorer.score(PT) > scorer.score(xor(PT, b'X')))
+
+
+def test_printable():
+    scorer = get_scorer('printable')
+    assert(3 == int(scorer.score(b'a \n\x00\xff')))
+    assert(scorer.score(b'etaoin') > scorer.score(b'zqxjkv'))
+
+
+def test_chi_squared_prefers_english_letters():
+    scorer = get_scorer('chi-squared')
+    assert(scorer.score(b'etaoin shrdlu') > scorer.score(b'zqxjkv zqxjkv'))
+    assert(0 > scorer.score(PT))
+
+
+def test_bigram_counts_letter_pairs():
+    scorer = BigramScorer(bigrams={'th': 1.0})
+    unigrams = scorer.unigrams
+    assert(unigrams[ord('t')] + unigrams[ord('h')] + 1 == scorer.score(b'Th'))
+    assert(unigrams[ord('h')] + unigrams[ord('t')] == scorer.score(b'ht'))
+    assert(0.0 == scorer.score(b''))
+
+
+def test_key_scores_match_decrypt_and_score():
+    ct = os.urandom(200)
+    for name in SCORERS:
+        scorer = get_scorer(name)
+        expected = [scorer.score(xor(ct, BYTES[k])) for k in range(256)]
+        assert(np.allclose(expected, scorer.key_scores(ct)))
+
+
+def test_batch_key_scores_match_key_scores():
+    cts = [os.urandom(n) for n in (1, 5, 60, 200)]
+    for name in SCORERS:
+        scorer = get_scorer(name)
+        batch = scorer.batch_key_scores(cts)
+        assert((len(cts), 256) == batch.shape)
+        for ct, scores in zip(cts, batch):
+            assert(np.allclose(scorer.key_scores(ct), scores))
+
+
+def test_column_scores_match_key_scores():
+    ct = os.urandom(100)
+    for name in ('unigram', 'printable', 'chi-squared'):
+        scorer = get_scorer(name)
+        scores = scorer.column_scores(ct, 3)
+        assert((3, 256) == scores.shape)
+        for column in range(3):
+            expected = scorer.key_scores(ct[column::3])
+            assert(np.allclose(expected, scores[column]))
+
+
+def test_bigram_column_scores_use_neighbouring_key_bytes():
+    scorer = get_scorer('bigram')
+    key = np.array([7, 99, 250], dtype=np.uint8)
+    ct = xor(PT, key.tobytes())
+    scores = scorer.column_scores(ct, 3, key)
+    for column in range(3):
+        for k in (0, 1, 99, 255):
+            guess = key.copy()
+            guess[column] = k
+            # Pairs away from the column score the same for every k
+            rest = scorer.score(xor(ct, guess.tobytes())) - scores[column, k]
+            if k == 0:
+                first = rest
+            assert(abs(first - rest) < 1e-6)
+    assert((3, 256) == scorer.column_scores(ct, 3).shape)
+    assert(np.allclose(
+        scorer.key_scores(ct)[None, :],
+        scorer.column_scores(ct, 1, key[:1])
+    ))
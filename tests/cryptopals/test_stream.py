@@ -0,0 +1,61 @@
+from io import BytesIO
+
+from pytest import raises
+
+from cryptopals.crypto import (
+    aes_cbc_encrypt,
+    aes_ecb_encrypt
+)
+from cryptopals.stream import (
+    decrypt_stream,
+    encrypt_stream
+)
+
+KEY = b'YELLOW SUBMARINE'
+IV = b'ORANGE SUBMARINE'
+PT = b'Cooking MCs like a pound of bacon. ' * 11
+
+
+def test_encrypt_stream_ecb_matches_aes_ecb_encrypt():
+    e = aes_ecb_encrypt(KEY, PT)
+    for chunksize in (1, 5, 16, 33, 1024):
+        r = b''.join(encrypt_stream(KEY, BytesIO(PT), chunksize=chunksize))
+        assert(e == r)
+
+
+def test_encrypt_stream_cbc_matches_aes_cbc_encrypt():
+    e = aes_cbc_encrypt(KEY, PT, IV)
+    for chunksize in (1, 5, 16, 33, 1024):
+        r = b''.join(
+            encrypt_stream(KEY, BytesIO(PT), 'cbc', IV, chunksize=chunksize)
+        )
+        assert(e == r)
+
+
+def test_decrypt_stream_cbc_round_trip():
+    ct = aes_cbc_encrypt(KEY, PT, IV)
+    for chunksize in (1, 5, 16, 33, 1024):
+        r = b''.join(
+            decrypt_stream(KEY, BytesIO(ct), 'cbc', IV, chunksize=chunksize)
+        )
+        assert(PT == r)
+
+
+def test_decrypt_stream_ecb_round_trip_of_aligned_input():
+    pt = b'A' * 64
+    ct = b''.join(encrypt_stream(KEY, BytesIO(pt), chunksize=16))
+
+    assert(80 == len(ct))
+    assert(pt == b''.join(decrypt_stream(KEY, BytesIO(ct), chunksize=16)))
+
+
+def test_streams_yield_incrementally():
+    chunks = list(encrypt_stream(KEY, BytesIO(PT), chunksize=32))
+
+    assert(len(chunks) > 1)
+    assert(all(len(c) <= 32 for c in chunks))
+
+
+def test_stream_rejects_unknown_mode():
+    with raises(ValueError):
+        next(encrypt_stream(KEY, BytesIO(PT), 'ctr'))
@@ -0,0 +1,198 @@
+import os
+
+import numpy as np
+from pytest import raises
+
+from cryptopals.compat import (
+    BYTES,
+    to_str
+)
+from cryptopals.crypto import xor
+from cryptopals.scoring import (
+    LETTER_FREQ,
+    LinearScorer,
+    frequency_weights
+)
+from cryptopals.xorbreak import (
+    best_single_byte_key,
+    break_repeating_xor,
+    coincidence_keysizes,
+    coincidences,
+    estimate_keysizes,
+    hamming_distance,
+    rank_keysizes,
+    held_out_score,
+    shortest_period,
+    single_byte_scores,
+    solve_columns
+)
+
+PT = b"Cooking MC's like a pound of bacon"
+TEXT = (
+    b"This code is going to turn out to be surprisingly useful later on. "
+    b"Breaking repeating-key XOR (Vigenere) statistically is obviously an "
+    b"academic exercise, a Crypto 101 thing. But more people know how to "
+    b"break it than can actually break it, and a similar technique breaks "
+    b"something much more important. We get more tech support questions "
+    b"for this challenge than any of the other ones. We promise, there "
+    b"aren't any blatant errors in this text. In particular: the wokka "
+    b"wokka edit distance really is 37."
+)
+
+
+def score(string):
+    return sum(LETTER_FREQ.get(c, 0) for c in to_str(string).lower())
+
+
+def test_single_byte_scores_match_decrypt_and_score():
+    ct = os.urandom(200)
+    scores = single_byte_scores(ct)
+    expected = [score(xor(ct, BYTES[k])) for k in range(256)]
+    assert(np.allclose(expected, scores))
+
+
+def test_best_single_byte_key():
+    ct = xor(PT, BYTES[88])
+    key, best = best_single_byte_key(ct)[0]
+    assert(88 == key)
+    assert(abs(score(PT) - best) < 1e-9)
+
+
+def test_best_single_byte_key_covers_0xff():
+    assert(0xff == best_single_byte_key(xor(PT, b'\xff'))[0][0])
+
+
+def test_best_single_byte_key_ranks_top_keys():
+    ranked = best_single_byte_key(xor(PT, b'X'), top=5)
+    assert(5 == len(ranked))
+    assert(ord(b'X') == ranked[0][0])
+    scores = [s for k, s in ranked]
+    assert(sorted(scores, reverse=True) == scores)
+    assert(256 == len(best_single_byte_key(b'', top=300)))
+
+
+def test_best_single_byte_key_custom_scorer():
+    scorer = LinearScorer('z', frequency_weights({'z': 1.0}))
+    assert(ord('z') ^ ord('q') == best_single_byte_key(b'q', 1, scorer)[0][0])
+
+
+def test_best_single_byte_key_named_scorer():
+    ct = xor(PT, BYTES[88])
+    for name in ('unigram', 'chi-squared', 'bigram'):
+        assert(88 == best_single_byte_key(ct, 1, name)[0][0])
+    # Many keys leave a text printable, letters break the tie
+    ranked = best_single_byte_key(ct, 256, 'printable')
+    assert(88 == ranked[0][0])
+    assert(len(PT) == int(ranked[0][1]) == int(ranked[1][1]))
+
+
+def test_hamming_distance():
+    assert(37 == hamming_distance(b'this is a test', b'wokka wokka!!!'))
+    assert(0 == hamming_distance(b'', b''))
+    with raises(ValueError):
+        hamming_distance(b'a', b'ab')
+
+
+def test_estimate_keysizes():
+    for key in (b'ICE', b'YELLOW SUBMARINE', b'Terminator X: Bring the noise'):
+        ranked = estimate_keysizes(xor(TEXT, key), 40)
+        assert(0 == ranked[0][0] % len(key))
+        assert(39 == len(ranked))
+        distances = [d for size, d in ranked]
+        assert(sorted(distances) == distances)
+
+
+def test_estimate_keysizes_bounds():
+    ranked = estimate_keysizes(b'abcdefgh', 40, min_keysize=3)
+    assert([3, 4] == sorted(size for size, d in ranked))
+    assert([] == estimate_keysizes(b'a'))
+
+
+def test_coincidences():
+    assert([6, 2, 1, 3] == list(coincidences(b'aabaab', 3)))
+    assert([6, 2, 1, 3] == list(coincidences(b'aabaab', 3, 'fft')))
+    assert([1] == list(coincidences(b'a', 5)))
+    ct = os.urandom(300) * 3
+    direct = coincidences(ct, 310, 'direct')
+    assert((direct == coincidences(ct, 310, 'fft')).all())
+    assert((direct == coincidences(ct, 310)).all())
+    assert(600 == direct[300])
+    with raises(ValueError):
+        coincidences(ct, 3, 'guess')
+
+
+def test_coincidence_keysizes():
+    for key in (b'ICE', b'YELLOW SUBMARINE', b'Terminator X: Bring the noise'):
+        ranked = coincidence_keysizes(xor(TEXT, key), 40)
+        assert(len(key) == ranked[0][0])
+        scores = [s for size, s in ranked]
+        assert(sorted(scores, reverse=True) == scores)
+    ranked = coincidence_keysizes(xor(TEXT, b'ICE'), 40, sample=200)
+    assert(3 == ranked[0][0])
+    assert([] == coincidence_keysizes(b'ab'))
+
+
+def test_rank_keysizes():
+    ct = xor(TEXT, b'YELLOW SUBMARINE')
+    for engines in ('coincidence', ('hamming', 'coincidence')):
+        ranked = rank_keysizes(ct, 40, engines=engines)
+        assert(16 == ranked[0][0])
+        assert(39 == len(ranked))
+    hamming = rank_keysizes(ct, 40, engines='hamming')
+    sizes = [size for size, d in estimate_keysizes(ct, 40)]
+    assert(sizes == [size for size, s in hamming])
+    assert([] == rank_keysizes(b'a'))
+    # Too short for hamming, which is left out
+    short = rank_keysizes(b'abc')
+    assert([] != short == rank_keysizes(b'abc', engines='coincidence'))
+    with raises(ValueError):
+        rank_keysizes(ct, engines='kasiski')
+
+
+def test_solve_columns():
+    key, score = solve_columns(xor(TEXT, b'ICE'), 3)
+    assert(b'ICE' == key)
+    assert(abs(score - single_byte_scores(TEXT)[0]) < 1e-6)
+    assert(b'ICEICE' == solve_columns(xor(TEXT, b'ICE'), 6)[0])
+
+
+def test_held_out_score_penalises_long_keys():
+    ct = xor(TEXT, b'ICE')
+    assert(solve_columns(ct, 39)[1] > solve_columns(ct, 3)[1])
+    assert(held_out_score(ct, 39) < held_out_score(ct, 3))
+
+
+def test_shortest_period():
+    assert(b'ab' == shortest_period(b'ababab'))
+    assert(b'abcab' == shortest_period(b'abcab'))
+    assert(b'a' == shortest_period(b'aaaa'))
+    assert(b'' == shortest_period(b''))
+
+
+def test_break_repeating_xor():
+    key = b'Terminator X: Bring the noise'
+    results = break_repeating_xor(xor(TEXT * 4, key), candidates=4)
+    assert(key == results[0][0])
+    scores = [s for k, s in results]
+    assert(sorted(scores, reverse=True) == scores)
+    assert(len(set(k for k, s in results)) == len(results) <= 4)
+    assert(results == break_repeating_xor(
+        xor(TEXT * 4, key),
+        candidates=4,
+        workers=2
+    ))
+
+
+def test_break_repeating_xor_folds_repeated_keys():
+    results = break_repeating_xor(xor(TEXT, b'ICE'), candidates=10)
+    assert((b'ICE', b'ICEICE') not in [(a, b) for a, s in results
+                                       for b, t in results])
+    assert(b'ICE' == results[0][0])
+    assert([] == break_repeating_xor(b'a'))
+
+
+def test_break_repeating_xor_with_each_scorer():
+    key = b'YELLOW SUBMARINE'
+    for scorer in ('unigram', 'chi-squared', 'bigram'):
+        results = break_repeating_xor(xor(TEXT * 2, key), scorer=scorer)
+        assert(key == results[0][0])
@@ -0,0 +1,140 @@
+import base64
+import binascii
+import io
+import multiprocessing
+import os
+import sys
+
+from pytest import (
+    mark,
+    raises
+)
+
+from cryptopals.compat import BYTES
+from cryptopals.crypto import xor
+from cryptopals.scoring import (
+    LinearScorer,
+    frequency_weights
+)
+from cryptopals.xorbreak import best_single_byte_key
+from cryptopals.xorscan import (
+    best_keys,
+    main,
+    scan
+)
+
+PT = b"Now that the party is jumping\n"
+
+
+def lines(count=40, hidden=(7, 30)):
+    return [
+        binascii.hexlify(
+            xor(PT, BYTES[i + 1]) if i in hidden else os.urandom(30)
+        ) + b'\n'
+        for i in range(count)
+    ]
+
+
+def test_best_keys_match_best_single_byte_key():
+    cts = [os.urandom(n) for n in (1, 5, 60, 200)] + [xor(PT, b'\xff')]
+    keys, scores = best_keys(cts)
+    for ct, key, score in zip(cts, keys, scores):
+        best_key, best_score = best_single_byte_key(ct)[0]
+        assert(best_key == key)
+        assert(abs(best_score - score) < 1e-9)
+    assert(0xff == keys[-1])
+
+
+def test_scan_finds_hidden_lines():
+    results = scan(lines(), top=2, batchsize=8)
+    assert([8, 31] == sorted(r[0] for r in results))
+    for number, key, score, plaintext in results:
+        assert(number == key)
+        assert(PT == plaintext)
+
+
+def test_scan_ranks_by_score_per_byte():
+    data = [binascii.hexlify(xor(PT * 3, b'a')),
+            binascii.hexlify(xor(PT, b'b'))]
+    data.append(binascii.hexlify(os.urandom(200)))
+    results = scan(data, top=3)
+    assert(results[0][2] >= results[1][2] >= results[2][2])
+    assert(3 == results[2][0])
+
+
+def test_scan_bounds_the_results():
+    assert(5 == len(scan(lines(), top=5, batchsize=3)))
+    assert(40 == len(scan(lines(), top=100)))
+
+
+def test_scan_skips_empty_and_undecodable_lines():
+    data = [b'\n', b'zz\n', binascii.hexlify(xor(PT, b'x'))]
+    assert([(3, ord('x'))] == [r[:2] for r in scan(data)])
+    with raises(ValueError):
+        scan([], encoding='rot13')
+
+
+def test_scan_encodings():
+    ct = xor(PT, b'k')
+    assert(PT == scan([base64.b64encode(ct)], encoding='base64')[0][3])
+    assert(PT == scan([ct + b'\n'], encoding='raw')[0][3])
+
+
+def test_scan_custom_scorer():
+    scorer = LinearScorer('q', frequency_weights({'q': 1.0}))
+    results = scan([b'71\n', b'61\n'], top=1, scorer=scorer)
+    assert([(1, 0, 1.0, b'q')] == results)
+
+
+def test_scan_with_workers_matches_serial():
+    data = lines(100, hidden=(0, 50, 99))
+    serial = scan(data, top=4, batchsize=7)
+    assert(serial == scan(data, top=4, workers=2, batchsize=7))
+    assert(all(type(score) is float for _, _, score, _ in serial))
+
+
+@mark.skipif(
+    not hasattr(multiprocessing, 'get_start_method'),
+    reason='Only fork is available'
+)
+def test_scan_scorer_reaches_spawned_workers():
+    data = lines(100, hidden=(0, 50, 99))
+    serial = scan(data, top=4, batchsize=7, scorer='printable')
+    method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method('spawn', force=True)
+    try:
+        pooled = scan(
+            data, top=4, workers=2, batchsize=7, scorer='printable'
+        )
+    finally:
+        multiprocessing.set_start_method(method, force=True)
+    assert(serial == pooled)
+
+
+def test_main(tmpdir, capsys):
+    src = tmpdir.join('ct')
+    src.write(b''.join(lines()), 'wb')
+    assert(0 == main([str(src), '--top', '1']))
+    out, err = capsys.readouterr()
+    assert(out.startswith('8 08 ') or out.startswith('31 1f '))
+    assert(1 == len(out.splitlines()))
+    assert(err.startswith('Scanned 40 lines'))
+
+
+def test_main_reads_stdin(monkeypatch, capsys):
+    stdin = io.TextIOWrapper(io.BytesIO(b''.join(lines())))
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    assert(0 == main(['--top', '2', '--workers', '2', '--batchsize', '4']))
+    out, err = capsys.readouterr()
+    assert(2 == len(out.splitlines()))
+    assert('lines/s' in err)
+
+
+def test_main_scorer(tmpdir, capsys):
+    src = tmpdir.join('ct')
+    src.write(b''.join(lines()), 'wb')
+    assert(0 == main([str(src), '--top', '2', '--scorer', 'chi-squared']))
+    out, err = capsys.readouterr()
+    assert(set(['8', '31']) == set(
+        line.split()[0] for line in out.splitlines()
+    ))